@@ -0,0 +1,83 @@
+/**
+ * Precomputed Layout Tests
+ *
+ * /api/layout returns positions as base64 little-endian float32 pairs; the
+ * hook only renders the custom layout once they have loaded.
+ */
+
+import { act, renderHook, waitFor } from '@testing-library/react';
+import {
+  decodeLayoutPositions,
+  usePrecomputedLayout,
+  PRECOMPUTED_LAYOUT_FALLBACK,
+} from '@/hooks/use-precomputed-layout';
+
+describe('decodeLayoutPositions', () => {
+  it('should map each id to its x/y pair with z = 0', () => {
+    const values = new Float32Array([-500, 12.5, 250, -0.25]);
+    const bytes = new Uint8Array(values.buffer);
+    const base64 = btoa(String.fromCharCode(...Array.from(bytes)));
+
+    const positions = decodeLayoutPositions(['A5', 'R12'], base64);
+
+    expect(positions.get('A5')).toEqual({ x: -500, y: 12.5, z: 0 });
+    expect(positions.get('R12')).toEqual({ x: 250, y: -0.25, z: 0 });
+  });
+});
+
+describe('usePrecomputedLayout', () => {
+  const nodes = [{ id: 'A5' }, { id: 'R12' }] as any[];
+  const originalFetch = global.fetch;
+
+  afterEach(() => {
+    global.fetch = originalFetch;
+    jest.restoreAllMocks();
+  });
+
+  it('should fall back to a client layout and report the error when /api/layout fails', async () => {
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+    global.fetch = jest.fn().mockResolvedValue({ ok: false, status: 500 }) as any;
+    const positionsRef = { current: new Map() };
+
+    const { result } = renderHook(() => usePrecomputedLayout('custom', nodes, [], positionsRef));
+
+    expect(result.current.activeLayoutType).toBe(PRECOMPUTED_LAYOUT_FALLBACK);
+    await waitFor(() => expect(result.current.layoutError).toBe('Layout request failed: 500'));
+    expect(result.current.activeLayoutType).toBe(PRECOMPUTED_LAYOUT_FALLBACK);
+    expect(positionsRef.current.size).toBe(0);
+  });
+
+  it('should switch to the custom layout once positions arrive', async () => {
+    const values = new Float32Array([1, 2, 3, 4]);
+    const positions = btoa(String.fromCharCode(...Array.from(new Uint8Array(values.buffer))));
+    global.fetch = jest.fn().mockResolvedValue({
+      ok: true,
+      json: async () => ({ success: true, ids: ['A5', 'R12'], positions }),
+    }) as any;
+    const positionsRef = { current: new Map() };
+
+    const { result } = renderHook(() => usePrecomputedLayout('custom', nodes, [], positionsRef));
+
+    await waitFor(() => expect(result.current.activeLayoutType).toBe('custom'));
+    expect(positionsRef.current.get('R12')).toEqual({ x: 3, y: 4, z: 0 });
+  });
+
+  it('should not refetch for new but equal node and edge arrays, only on retry', async () => {
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+    global.fetch = jest.fn().mockResolvedValue({ ok: false, status: 500 }) as any;
+    const positionsRef = { current: new Map() };
+
+    const { result, rerender } = renderHook(
+      ({ graphNodes, graphEdges }) => usePrecomputedLayout('custom', graphNodes, graphEdges, positionsRef),
+      { initialProps: { graphNodes: [...nodes], graphEdges: [{ id: 'e', source: 'A5', target: 'R12' }] as any[] } }
+    );
+    await waitFor(() => expect(result.current.layoutError).toBe('Layout request failed: 500'));
+
+    rerender({ graphNodes: [{ id: 'R12' }, { id: 'A5' }] as any[], graphEdges: [{ id: 'e', source: 'A5', target: 'R12' }] as any[] });
+    expect(global.fetch).toHaveBeenCalledTimes(1);
+    expect(result.current.layoutError).toBe('Layout request failed: 500');
+
+    act(() => result.current.retryLayout());
+    await waitFor(() => expect(global.fetch).toHaveBeenCalledTimes(2));
+  });
+});
@@ -0,0 +1,38 @@
+/**
+ * Passage Collapsing Tests
+ *
+ * Long documents are indexed as passages; search results must come back
+ * as one hit per document, best score first.
+ */
+
+import { collapsePassageHits } from '@/lib/services/vector_search';
+
+describe('collapsePassageHits', () => {
+  const hits = [
+    { _id: 'OSFI_1#p3', _score: 0.92, fields: { label: 'OSFI E-23', parent_id: 'OSFI_1', passage: 3 } },
+    { _id: 'A5', _score: 0.88, fields: { label: 'Article 5' } },
+    { _id: 'OSFI_1#p1', _score: 0.85, fields: { label: 'OSFI E-23', parent_id: 'OSFI_1', passage: 1 } },
+    { _id: 'OSFI_1', _score: 0.8, fields: { label: 'OSFI E-23', passage_count: 18 } },
+    { _id: 'R12', _score: 0.7, fields: { label: 'Recital 12' } },
+  ];
+
+  it('should keep one hit per document with its best score', () => {
+    const documents = collapsePassageHits(hits, 10);
+
+    expect(documents.map((hit) => hit._id)).toEqual(['OSFI_1', 'A5', 'R12']);
+    expect(documents[0]._score).toBe(0.92);
+    expect(documents[0].passages).toEqual([3, 1, 0]);
+  });
+
+  it('should strip passage fields from the document fields', () => {
+    const [osfi] = collapsePassageHits(hits, 10);
+
+    expect(osfi.fields.parent_id).toBeUndefined();
+    expect(osfi.fields.passage).toBeUndefined();
+    expect(osfi.fields.label).toBe('OSFI E-23');
+  });
+
+  it('should return at most topK documents', () => {
+    expect(collapsePassageHits(hits, 2).map((hit) => hit._id)).toEqual(['OSFI_1', 'A5']);
+  });
+});
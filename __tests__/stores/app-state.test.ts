@@ -110,6 +110,44 @@ describe('Search Functionality', () => {
 
       expect(global.fetch).not.toHaveBeenCalled();
     });
+
+    it('should fill in full text from the document store after a search', async () => {
+      const mockResponse = {
+        rawResponse: {
+          result: {
+            hits: [
+              { _id: 'A5', _score: 0.9, fields: { label: 'Article 5' } },
+            ],
+          },
+        },
+      };
+
+      (global.fetch as jest.Mock)
+        .mockResolvedValueOnce({ ok: true, json: async () => mockResponse })
+        .mockResolvedValueOnce({
+          ok: true,
+          json: async () => ({
+            documents: {
+              A5: { content: 'Full article text', summary: 'Prohibited practices', chunk_text: 'Article 5. Full article text' },
+            },
+          }),
+        });
+
+      const store = useAppStore.getState();
+
+      await store.performSearch('prohibited practices', 20);
+      expect(global.fetch).toHaveBeenLastCalledWith(
+        '/api/documents/text',
+        expect.objectContaining({ body: expect.stringContaining('"ids":["A5"]') })
+      );
+
+      // The text lookup is not awaited by performSearch; let it settle
+      await new Promise((resolve) => setTimeout(resolve, 0));
+      const state = useAppStore.getState();
+      expect(state.searchResults[0].content).toBe('Full article text');
+      expect(state.filteredResults[0].content).toBe('Full article text');
+      expect(state.searchResults[0].summary).toBe('Prohibited practices');
+    });
   });
 
   describe('Test 2: Change K Value', () => {
@@ -1,7 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { spawn } from 'child_process';
-import { existsSync } from 'fs';
 import path from 'path';
+import { runPythonScript } from '@/lib/utils/python-runner';
 
 interface NodeInput {
 	id: string;
@@ -62,76 +61,3 @@ export async function POST(request: NextRequest) {
 		);
 	}
 }
-
-/**
- * Helper function to run Python script and return parsed JSON result
- */
-function runPythonScript(scriptPath: string, inputData: any): Promise<any> {
-	return new Promise((resolve, reject) => {
-		// Use environment-based Python path for Docker/Render compatibility
-		let pythonCommand = process.env.PYTHON_PATH || 'python3';
-		
-		// Fallback to venv if running locally (development)
-		if (!process.env.PYTHON_PATH) {
-			const projectRoot = process.cwd();
-			const venvPaths = [
-				path.join(projectRoot, 'backend', 'clustering', 'venv', 'Scripts', 'python.exe'), // Windows
-				path.join(projectRoot, 'backend', 'clustering', 'venv', 'bin', 'python'), // Unix
-			];
-
-			for (const venvPath of venvPaths) {
-				if (existsSync(venvPath)) {
-					pythonCommand = venvPath;
-					break;
-				}
-			}
-		}
-
-		console.log(`[Cluster Analysis] Using Python: ${pythonCommand}`);
-
-		const python = spawn(pythonCommand, [scriptPath]);
-
-		let stdout = '';
-		let stderr = '';
-
-		// Write input to stdin
-		python.stdin.write(JSON.stringify(inputData));
-		python.stdin.end();
-
-		// Collect stdout
-		python.stdout.on('data', (data) => {
-			stdout += data.toString();
-		});
-
-		// Collect stderr
-		python.stderr.on('data', (data) => {
-			stderr += data.toString();
-		});
-
-		// Handle process completion
-		python.on('close', (code) => {
-			if (code !== 0) {
-				reject(new Error(`Python script failed with code ${code}: ${stderr}`));
-				return;
-			}
-
-			try {
-				const result = JSON.parse(stdout);
-				
-				if (result.error) {
-					reject(new Error(result.error));
-					return;
-				}
-
-				resolve(result);
-			} catch (error) {
-				reject(new Error(`Failed to parse Python output: ${stdout}`));
-			}
-		});
-
-		// Handle errors
-		python.on('error', (error) => {
-			reject(new Error(`Failed to start Python process: ${error.message}`));
-		});
-	});
-}
@@ -1,43 +1,53 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { Pinecone } from '@pinecone-database/pinecone';
+import path from 'path';
+import { runPythonScript } from '@/lib/utils/python-runner';
 
+const DEFAULT_LIMIT = 50;
+const MAX_LIMIT = 1000;
+const DEFAULT_FIELDS = ['label', 'type', 'tags'];
+// Values for listed fields a record doesn't carry (e.g. Canadian records have no type)
+const FIELD_FALLBACKS: Record<string, unknown> = { label: 'Unknown', type: 'Unknown', tags: [] };
+
+/**
+ * GET /api/documents/list?cursor=A10&limit=50&fields=label,type,tags
+ *
+ * Pages through the document index written at upload time
+ * (scripts/document_index.py), ordered by id. Pass `nextCursor` from a
+ * response as `cursor` to get the following page; it is null on the last page.
+ */
 export async function GET(request: NextRequest) {
 	try {
-		// Check if Pinecone is configured
-		if (!process.env.PINECONE_API_KEY || !process.env.PINECONE_INDEX_NAME) {
-			return NextResponse.json({
-				success: false,
-				error: 'Pinecone not configured',
-				count: 0,
-				documents: [],
-			});
-		}
-
-		// Initialize Pinecone client at runtime
-		const pc = new Pinecone({
-			apiKey: process.env.PINECONE_API_KEY,
-		});
+		const { searchParams } = new URL(request.url);
+		const cursor = searchParams.get('cursor') || undefined;
+		const limit = Number(searchParams.get('limit') ?? DEFAULT_LIMIT);
+		const fieldsParam = searchParams.get('fields');
+		const fields = fieldsParam ? fieldsParam.split(',').map((field) => field.trim()).filter(Boolean) : DEFAULT_FIELDS;
 
-		const index = pc.index(process.env.PINECONE_INDEX_NAME);
-
-		// Query for a few sample documents
-		const queryResponse = await index.query({
-			vector: Array(1536).fill(0), // Dummy vector
-			topK: 10,
-			includeMetadata: true,
-		});
+		// Validate input
+		if (!Number.isInteger(limit) || limit < 1 || limit > MAX_LIMIT) {
+			return NextResponse.json(
+				{ error: `Invalid input: limit must be an integer from 1 to ${MAX_LIMIT}` },
+				{ status: 400 }
+			);
+		}
 
-		const documents = queryResponse.matches.map((match) => ({
-			id: match.id,
-			label: match.metadata?.label || 'Unknown',
-			type: match.metadata?.type || 'Unknown',
-			tags: match.metadata?.tags || [],
-		}));
+		const scriptPath = path.join(process.cwd(), 'scripts', 'document_index.py');
+		const page = await runPythonScript(scriptPath, { cursor, limit, fields }, ['query']);
 
 		return NextResponse.json({
 			success: true,
-			count: documents.length,
-			documents,
+			count: page.documents.length,
+			total: page.total,
+			nextCursor: page.next_cursor,
+			documents: page.documents.map((document: Record<string, unknown>) => {
+				const filled = { ...document };
+				for (const field of fields) {
+					if (filled[field] === undefined && field in FIELD_FALLBACKS) {
+						filled[field] = FIELD_FALLBACKS[field];
+					}
+				}
+				return filled;
+			}),
 		});
 	} catch (error) {
 		console.error('Error listing documents:', error);
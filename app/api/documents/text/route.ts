@@ -0,0 +1,52 @@
+import { NextRequest, NextResponse } from 'next/server';
+import path from 'path';
+import { runPythonScript } from '@/lib/utils/python-runner';
+
+const TEXT_FIELDS = ['content', 'summary', 'chunk_text'];
+const MAX_IDS = 1000;
+
+/**
+ * POST /api/documents/text
+ *
+ * Batched full-text lookup by id from the local document store
+ * (scripts/document_store.py). Vector search results carry only lean
+ * metadata; this fills in content when it is needed.
+ * Body: { ids: string[], fields?: ('content' | 'summary' | 'chunk_text')[] }
+ * Returns: { documents: { [id]: { [field]: string } } }
+ */
+export async function POST(request: NextRequest) {
+	try {
+		const body = await request.json();
+		const { ids, fields = TEXT_FIELDS } = body;
+
+		// Validate input
+		if (!ids || !Array.isArray(ids) || ids.length === 0 || ids.length > MAX_IDS) {
+			return NextResponse.json(
+				{ error: `Invalid input: ids must be an array of 1 to ${MAX_IDS} document ids` },
+				{ status: 400 }
+			);
+		}
+
+		if (!Array.isArray(fields) || fields.some((field: string) => !TEXT_FIELDS.includes(field))) {
+			return NextResponse.json(
+				{ error: `Invalid input: fields must be a subset of ${TEXT_FIELDS.join(', ')}` },
+				{ status: 400 }
+			);
+		}
+
+		const scriptPath = path.join(process.cwd(), 'scripts', 'document_store.py');
+		const result = await runPythonScript(scriptPath, { ids, fields }, ['query']);
+
+		return NextResponse.json(result);
+
+	} catch (error) {
+		console.error('[Documents Text API] Error:', error);
+		return NextResponse.json(
+			{
+				error: 'Internal server error',
+				details: error instanceof Error ? error.message : 'Unknown error'
+			},
+			{ status: 500 }
+		);
+	}
+}
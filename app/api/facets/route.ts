@@ -0,0 +1,48 @@
+import { NextRequest, NextResponse } from 'next/server';
+import path from 'path';
+import { runPythonScript } from '@/lib/utils/python-runner';
+import { buildPineconeFilter, FilterMetadata } from '@/lib/utils/pinecone-filters';
+
+interface FacetsRequest {
+	filters?: FilterMetadata;
+	facets?: string[];
+}
+
+/**
+ * POST /api/facets
+ *
+ * Applies the same filter expression as vector search (buildPineconeFilter)
+ * to the local corpus with the bitmap filter engine (scripts/filter_engine.py)
+ * and returns the matching ids with per-field facet counts:
+ * { count, ids: string[], facets: { [field]: { [value]: count } } }
+ */
+export async function POST(request: NextRequest) {
+	try {
+		const body: FacetsRequest = await request.json();
+		const { filters = {}, facets } = body;
+
+		// Validate input
+		if (facets !== undefined && (!Array.isArray(facets) || facets.some((field) => typeof field !== 'string'))) {
+			return NextResponse.json(
+				{ error: 'Invalid input: facets must be an array of field names' },
+				{ status: 400 }
+			);
+		}
+
+		const filter = buildPineconeFilter(filters);
+		const scriptPath = path.join(process.cwd(), 'scripts', 'filter_engine.py');
+		const result = await runPythonScript(scriptPath, { filter, facets }, ['query']);
+
+		return NextResponse.json(result);
+
+	} catch (error) {
+		console.error('[Facets API] Error:', error);
+		return NextResponse.json(
+			{
+				error: 'Internal server error',
+				details: error instanceof Error ? error.message : 'Unknown error'
+			},
+			{ status: 500 }
+		);
+	}
+}
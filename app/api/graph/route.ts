@@ -0,0 +1,68 @@
+import { NextRequest, NextResponse } from 'next/server';
+import path from 'path';
+import { runPythonScript } from '@/lib/utils/python-runner';
+
+type GraphOp = 'neighbors' | 'khop' | 'subgraph';
+
+interface GraphRequest {
+	op: GraphOp;
+	ids: string[];
+	k?: number;
+}
+
+const GRAPH_OPS: GraphOp[] = ['neighbors', 'khop', 'subgraph'];
+const MAX_HOPS = 3;
+
+/**
+ * POST /api/graph
+ *
+ * Answers cross-reference queries from the prebuilt graph index
+ * (scripts/graph_index.py), so expanding the graph needs no per-node
+ * metadata lookups.
+ * - neighbors: { neighbors: { [id]: string[] } }
+ * - khop:      { nodes: { [id]: hops }, edges: [source, target][] }
+ * - subgraph:  { edges: [source, target][] } among the given ids
+ */
+export async function POST(request: NextRequest) {
+	try {
+		const body: GraphRequest = await request.json();
+		const { op, ids, k = 1 } = body;
+
+		// Validate input
+		if (!GRAPH_OPS.includes(op)) {
+			return NextResponse.json(
+				{ error: `Invalid op: expected one of ${GRAPH_OPS.join(', ')}` },
+				{ status: 400 }
+			);
+		}
+
+		if (!ids || !Array.isArray(ids) || ids.length === 0) {
+			return NextResponse.json(
+				{ error: 'Invalid input: ids array is required' },
+				{ status: 400 }
+			);
+		}
+
+		if (!Number.isInteger(k) || k < 1 || k > MAX_HOPS) {
+			return NextResponse.json(
+				{ error: `Invalid input: k must be an integer from 1 to ${MAX_HOPS}` },
+				{ status: 400 }
+			);
+		}
+
+		const scriptPath = path.join(process.cwd(), 'scripts', 'graph_index.py');
+		const result = await runPythonScript(scriptPath, { op, ids, k }, ['query']);
+
+		return NextResponse.json(result);
+
+	} catch (error) {
+		console.error('[Graph API] Error:', error);
+		return NextResponse.json(
+			{
+				error: 'Internal server error',
+				details: error instanceof Error ? error.message : 'Unknown error'
+			},
+			{ status: 500 }
+		);
+	}
+}
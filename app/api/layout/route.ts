@@ -0,0 +1,52 @@
+import { NextRequest, NextResponse } from 'next/server';
+import path from 'path';
+import { runPythonScript } from '@/lib/utils/python-runner';
+
+const MAX_NODES = 20000;
+const METHODS = ['svd', 'spectral'];
+
+/**
+ * POST /api/layout
+ *
+ * Precomputed 2D node positions from the document vectors
+ * (backend/layout/), cached on disk by node set so revisits are instant.
+ * Body: { ids: string[], links?: { source, target }[], method?: 'svd' | 'spectral' }
+ * Returns: { ids, positions, cached, source } where positions is a base64
+ * little-endian Float32Array [x0, y0, x1, y1, ...] in ids order.
+ */
+export async function POST(request: NextRequest) {
+	try {
+		const body = await request.json();
+		const { ids, links = [], method = 'svd' } = body;
+
+		// Validate input
+		if (!ids || !Array.isArray(ids) || ids.length === 0 || ids.length > MAX_NODES) {
+			return NextResponse.json(
+				{ error: `Invalid input: ids must be an array of 1 to ${MAX_NODES} node ids` },
+				{ status: 400 }
+			);
+		}
+
+		if (!METHODS.includes(method)) {
+			return NextResponse.json(
+				{ error: `Invalid input: method must be one of ${METHODS.join(', ')}` },
+				{ status: 400 }
+			);
+		}
+
+		const scriptPath = path.join(process.cwd(), 'backend', 'layout', 'cli.py');
+		const result = await runPythonScript(scriptPath, { ids, links, method });
+
+		return NextResponse.json(result);
+
+	} catch (error) {
+		console.error('[Layout API] Error:', error);
+		return NextResponse.json(
+			{
+				error: 'Internal server error',
+				details: error instanceof Error ? error.message : 'Unknown error'
+			},
+			{ status: 500 }
+		);
+	}
+}
@@ -6,10 +6,42 @@ Reads JSON from stdin, performs clustering, outputs JSON to stdout.
 This is the entry point called by the Next.js API route.
 """
 
+import os
 import sys
 import json
 from analyzer import perform_cluster_analysis
 
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts')
+
+
+def fill_content(nodes):
+    """
+    Fill in missing node content from the document store, else the corpus snapshot.
+
+    Lets callers send just node ids instead of full document text. Returns the
+    ids of nodes that still have no text to cluster on.
+    """
+    missing = {node['id']: node for node in nodes if not node.get('content') and node.get('id')}
+    if missing:
+        sys.path.insert(0, SCRIPTS_DIR)
+        from document_store import DocumentStore, default_document_store_path
+        if os.path.exists(default_document_store_path()):
+            with DocumentStore() as store:
+                for _id, fields in store.get_many(missing, ['content', 'chunk_text']).items():
+                    missing[_id]['content'] = fields.get('content') or fields.get('chunk_text', '')
+
+        unfilled = [_id for _id, node in missing.items() if not node.get('content')]
+        if unfilled:
+            try:
+                from snapshot import CorpusSnapshot
+                with CorpusSnapshot() as snapshot:
+                    for record in snapshot.get_many(unfilled):
+                        missing[record['_id']]['content'] = record.get('content') or record.get('chunk_text', '')
+            except FileNotFoundError:
+                pass  # No snapshot exported either; reported below
+
+    return [node.get('id') for node in nodes if not (node.get('content') or node.get('summary') or node.get('label'))]
+
 
 if __name__ == "__main__":
     try:
@@ -27,6 +59,15 @@ if __name__ == "__main__":
             print(json.dumps(result))
             sys.exit(1)
         
+        no_text = fill_content(nodes)
+        if no_text:
+            result = {
+                "success": False,
+                "error": f"No text for {len(no_text)} nodes (not in the document store or snapshot): {', '.join(map(str, no_text[:10]))}"
+            }
+            print(json.dumps(result))
+            sys.exit(1)
+
         # Perform clustering
         result = perform_cluster_analysis(nodes)
         
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+CLI wrapper for precomputed graph layouts.
+Reads JSON from stdin, returns node positions as JSON on stdout.
+
+Input:  {"ids": [...], "nodes": [{id, content, ...}] (optional text),
+         "links": [[source, target], ...], "method": "svd" | "spectral"}
+Output: {"success", "ids", "positions", "cached", "source", "metadata"}
+
+`positions` is a base64 little-endian float32 array [x0, y0, x1, y1, ...] in
+`ids` order. Vectors come from the vector export (scripts/export_vectors.py)
+when it has every node, otherwise from TF-IDF over the node text, filled in
+from the document store or the corpus snapshot for nodes sent without text.
+
+Layouts are cached on disk by a hash of the node set, links, method and
+vector source (LAYOUT_CACHE, default scripts/data/layouts/), so revisiting a
+result set returns instantly.
+
+This is the entry point called by the Next.js API route.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from layout import DEFAULT_ITERATIONS, DEFAULT_NEIGHBORS, compute_layout
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts')
+DEFAULT_LAYOUT_CACHE = os.path.join(SCRIPTS_DIR, 'data', 'layouts')
+LAYOUT_CACHE_MAX_FILES = 500
+TEXT_DIMENSIONS = 64  # TF-IDF is reduced to this many SVD components before layout
+
+
+def layout_cache_dir():
+    """Cache directory, overridable with LAYOUT_CACHE."""
+    return os.getenv('LAYOUT_CACHE', DEFAULT_LAYOUT_CACHE)
+
+
+def vectors_from_export(ids):
+    """Rows of the vector export for these ids, or None unless it has every one."""
+    sys.path.insert(0, SCRIPTS_DIR)
+    try:
+        from export_vectors import VectorSnapshot
+        snapshot = VectorSnapshot()
+        rows = [snapshot.position(_id) for _id in ids]
+    except (FileNotFoundError, KeyError, ValueError):
+        return None, None
+    fingerprint = f"export:{snapshot.manifest['exported_at']}"
+    return np.asarray(snapshot.vectors[np.sort(rows)])[np.argsort(np.argsort(rows))], fingerprint
+
+
+def node_texts(ids, nodes):
+    """Text per id: from the request, else the document store, else the corpus snapshot."""
+    texts = {}
+    for node in nodes:
+        text = node.get('content') or node.get('text') or node.get('summary') or node.get('label')
+        if node.get('id') and text:
+            texts[node['id']] = text
+
+    missing = [_id for _id in ids if _id not in texts]
+    if missing:
+        sys.path.insert(0, SCRIPTS_DIR)
+        try:
+            from document_store import DocumentStore, default_document_store_path
+            if os.path.exists(default_document_store_path()):
+                with DocumentStore() as store:
+                    for _id, fields in store.get_many(missing).items():
+                        texts[_id] = fields.get('content') or fields.get('chunk_text', '')
+            else:
+                from snapshot import CorpusSnapshot
+                with CorpusSnapshot() as snapshot:
+                    for record in snapshot.get_many(missing):
+                        texts[record['_id']] = record.get('content') or record.get('chunk_text', '')
+        except FileNotFoundError:
+            pass  # Nothing stored locally; lay out on whatever text the nodes carry
+    return [texts.get(_id, _id) for _id in ids]
+
+
+def vectors_from_text(texts):
+    """TF-IDF vectors reduced to TEXT_DIMENSIONS dense components."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.decomposition import TruncatedSVD
+
+    tfidf = TfidfVectorizer(sublinear_tf=True, stop_words='english', ngram_range=(1, 2)).fit_transform(texts)
+    components = min(TEXT_DIMENSIONS, tfidf.shape[0] - 1, tfidf.shape[1] - 1)
+    if components < 2:
+        return tfidf.toarray().astype(np.float32)
+    return TruncatedSVD(n_components=components, random_state=0).fit_transform(tfidf).astype(np.float32)
+
+
+def cache_key(ids, links, method, fingerprint):
+    """Hash of everything the layout depends on; node order does not matter."""
+    payload = json.dumps([sorted(ids), sorted(links), method, DEFAULT_NEIGHBORS, DEFAULT_ITERATIONS, fingerprint],
+                         separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def read_cached(key):
+    """Cached positions in sorted-id order, or None."""
+    path = os.path.join(layout_cache_dir(), f"{key}.npy")
+    try:
+        positions = np.load(path)
+    except (FileNotFoundError, ValueError):
+        return None
+    os.utime(path)  # Recently used layouts survive pruning
+    return positions
+
+
+def write_cached(key, positions):
+    """Store positions atomically and drop the least recently used layouts beyond the cap."""
+    directory = layout_cache_dir()
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f"{key}.tmp.npy")
+    np.save(tmp_path, positions)
+    os.replace(tmp_path, os.path.join(directory, f"{key}.npy"))
+
+    files = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.npy') and '.tmp' not in name]
+    if len(files) > LAYOUT_CACHE_MAX_FILES:
+        for path in sorted(files, key=os.path.getmtime)[:len(files) - LAYOUT_CACHE_MAX_FILES]:
+            os.remove(path)
+
+
+def link_pairs(links):
+    """Links as sorted (source, target) id pairs, from [a, b] lists or {source, target} objects."""
+    pairs = set()
+    for link in links:
+        source, target = (link.get('source'), link.get('target')) if isinstance(link, dict) else link
+        if source and target and source != target:
+            pairs.add(tuple(sorted((source, target))))
+    return sorted(pairs)
+
+
+def layout_nodes(ids, nodes=(), links=(), method='svd'):
+    """Positions (float32[len(ids), 2] in `ids` order) plus whether they came from the cache and the vector source."""
+    ids = list(dict.fromkeys(ids))
+    order = sorted(ids)
+    position = {_id: row for row, _id in enumerate(order)}
+    pairs = [pair for pair in link_pairs(links) if pair[0] in position and pair[1] in position]
+
+    vectors, fingerprint = vectors_from_export(order)
+    source = 'vectors'
+    if vectors is None:
+        texts = node_texts(order, nodes)
+        vectors, source = None, 'text'
+        fingerprint = 'text:' + hashlib.sha256('\x00'.join(texts).encode('utf-8')).hexdigest()
+
+    key = cache_key(order, pairs, method, fingerprint)
+    positions = read_cached(key)
+    cached = positions is not None and len(positions) == len(order)
+    if not cached:
+        if vectors is None:
+            vectors = vectors_from_text(texts)
+        positions = compute_layout(vectors, [(position[a], position[b]) for a, b in pairs], method=method)
+        write_cached(key, positions)
+
+    return positions[[position[_id] for _id in ids]], ids, cached, source
+
+
+if __name__ == "__main__":
+    try:
+        data = json.loads(sys.stdin.read() or '{}')
+        nodes = data.get('nodes') or []
+        ids = data.get('ids') or [node['id'] for node in nodes if node.get('id')]
+
+        if not ids:
+            print(json.dumps({"success": False, "error": "No node ids provided"}))
+            sys.exit(1)
+
+        start = time.perf_counter()
+        positions, ids, cached, source = layout_nodes(ids, nodes, data.get('links') or [], data.get('method') or 'svd')
+
+        print(json.dumps({
+            "success": True,
+            "ids": ids,
+            "positions": base64.b64encode(positions.astype('<f4').tobytes()).decode('ascii'),
+            "cached": cached,
+            "source": source,
+            "metadata": {"totalNodes": len(ids), "seconds": time.perf_counter() - start},
+        }))
+
+    except Exception as e:
+        print(json.dumps({"success": False, "error": f"Layout failed: {str(e)}"}))
+        sys.exit(1)
@@ -0,0 +1,174 @@
+"""
+Precomputed 2D layouts for network graph nodes.
+
+Strategy: project the document vectors to 2D (truncated SVD, or a spectral
+embedding of the kNN graph), then refine with a short force simulation on the
+sparse kNN graph plus the document links. Everything is vectorized NumPy, so
+a few thousand nodes lay out in about a second.
+
+Repulsion is estimated from a few random nodes per step instead of all pairs,
+which keeps each step linear in nodes + edges.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+LAYOUT_EXTENT = 500.0  # Output coordinates span roughly ±LAYOUT_EXTENT
+DEFAULT_NEIGHBORS = 10
+DEFAULT_ITERATIONS = 150
+REPULSION_SAMPLES = 8  # Random nodes each node is pushed away from per step
+KNN_BLOCK_ROWS = 2048
+METHODS = ('svd', 'spectral')
+
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    """Unit-length float32 rows."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def knn_edges(vectors: np.ndarray, k: int = DEFAULT_NEIGHBORS) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Symmetric cosine kNN graph as (rows, cols, weights), one entry per direction.
+
+    Similarities are computed in row blocks, so memory stays at block × n.
+    """
+    units = normalize(vectors)
+    n = len(units)
+    k = min(k, n - 1)
+    if k < 1:
+        return np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0, np.float32)
+
+    rows, cols, weights = [], [], []
+    for start in range(0, n, KNN_BLOCK_ROWS):
+        block = units[start:start + KNN_BLOCK_ROWS] @ units.T
+        block[np.arange(len(block)), np.arange(start, start + len(block))] = -np.inf  # No self edges
+        nearest = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        rows.append(np.repeat(np.arange(start, start + len(block)), k))
+        cols.append(nearest.ravel())
+        weights.append(np.take_along_axis(block, nearest, axis=1).ravel())
+
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    weights = np.clip(np.concatenate(weights), 0, None)
+    # Keep each undirected edge once with its best weight, then emit both directions
+    low, high = np.minimum(rows, cols), np.maximum(rows, cols)
+    keys, inverse = np.unique(low * n + high, return_inverse=True)
+    best = np.zeros(len(keys), dtype=np.float32)
+    np.maximum.at(best, inverse, weights)
+    low, high = np.divmod(keys, n)
+    return np.concatenate([low, high]), np.concatenate([high, low]), np.concatenate([best, best])
+
+
+def svd_projection(vectors: np.ndarray) -> np.ndarray:
+    """The two leading principal components of the centered vectors."""
+    centered = np.asarray(vectors, dtype=np.float64)
+    centered = centered - centered.mean(axis=0)
+    n, d = centered.shape
+    # Eigen-decompose the smaller of the Gram and covariance matrices
+    if n <= d:
+        values, vectors_ = np.linalg.eigh(centered @ centered.T)
+        return vectors_[:, ::-1][:, :2] * np.sqrt(np.clip(values[::-1][:2], 0, None))
+    values, vectors_ = np.linalg.eigh(centered.T @ centered)
+    return centered @ vectors_[:, ::-1][:, :2]
+
+
+def spectral_projection(n: int, rows: np.ndarray, cols: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Laplacian eigenmap: the two smallest non-trivial eigenvectors of the normalized graph Laplacian."""
+    from scipy.sparse import coo_matrix, identity, diags
+    from scipy.sparse.linalg import eigsh
+
+    adjacency = coo_matrix((weights + 1e-6, (rows, cols)), shape=(n, n)).tocsr()
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    scale = diags(1 / np.sqrt(np.where(degree == 0, 1, degree)))
+    laplacian = identity(n) - scale @ adjacency @ scale
+    # Shifted so the smallest eigenvalues of L become the largest of (2I - L)
+    values, vectors = eigsh(2 * identity(n) - laplacian, k=min(3, n - 1), which='LA')
+    order = np.argsort(values)[::-1]
+    return vectors[:, order[1:3]]
+
+
+def refine(positions: np.ndarray, rows: np.ndarray, cols: np.ndarray, weights: np.ndarray,
+           iterations: int = DEFAULT_ITERATIONS, seed: int = 0) -> np.ndarray:
+    """
+    Fruchterman-Reingold steps: springs along the graph edges, repulsion
+    estimated from REPULSION_SAMPLES random nodes, cooling step size.
+    """
+    rng = np.random.default_rng(seed)
+    positions = np.array(positions, dtype=np.float64)
+    n = len(positions)
+    if n < 3 or iterations <= 0:
+        return positions
+
+    ideal = 1 / np.sqrt(n)  # Natural edge length in a unit square
+    samples = min(REPULSION_SAMPLES, n - 1)
+    repulsion_scale = (n - 1) / samples
+    strength = 0.5 + weights  # Stronger springs between closer neighbours
+
+    for step in range(iterations):
+        temperature = 0.1 * (1 - step / iterations) + 1e-3
+        displacement = np.zeros_like(positions)
+
+        # Attraction along edges (both directions are listed, so each end moves)
+        delta = positions[cols] - positions[rows]
+        distance = np.linalg.norm(delta, axis=1) + 1e-9
+        pull = (strength * distance / ideal)[:, None] * delta
+        for axis in range(2):
+            displacement[:, axis] += np.bincount(rows, weights=pull[:, axis], minlength=n)
+
+        # Repulsion from random nodes, scaled up to stand in for all pairs
+        others = rng.integers(n, size=(n, samples))
+        delta = positions[:, None, :] - positions[others]
+        distance_sq = (delta ** 2).sum(axis=2) + 1e-9
+        displacement += repulsion_scale * (ideal ** 2 * delta / distance_sq[:, :, None]).sum(axis=1) / samples
+
+        # Move at most `temperature` per step
+        length = np.linalg.norm(displacement, axis=1, keepdims=True) + 1e-9
+        positions += displacement / length * np.minimum(length, temperature)
+    return positions
+
+
+def fit_extent(positions: np.ndarray, extent: float = LAYOUT_EXTENT) -> np.ndarray:
+    """Center the layout and scale its larger side to ±extent, as float32."""
+    positions = positions - positions.mean(axis=0)
+    span = np.abs(positions).max()
+    return (positions * (extent / span if span > 0 else 1)).astype(np.float32)
+
+
+def compute_layout(vectors: np.ndarray, links: Optional[List[Tuple[int, int]]] = None,
+                   method: str = 'svd', neighbors: int = DEFAULT_NEIGHBORS,
+                   iterations: int = DEFAULT_ITERATIONS, seed: int = 0) -> np.ndarray:
+    """
+    2D positions (float32[n, 2]) for the rows of `vectors`.
+
+    `links` are extra (row, row) edges, such as document cross-references,
+    that pull linked nodes together in the refinement.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown layout method '{method}' (expected one of {', '.join(METHODS)})")
+    n = len(vectors)
+    if n == 0:
+        return np.zeros((0, 2), dtype=np.float32)
+    if n == 1:
+        return np.zeros((1, 2), dtype=np.float32)
+
+    rows, cols, weights = knn_edges(vectors, neighbors)
+    if links:
+        pairs = np.array([(a, b) for a, b in links if a != b], dtype=np.int64).reshape(-1, 2)
+        rows = np.concatenate([rows, pairs[:, 0], pairs[:, 1]])
+        cols = np.concatenate([cols, pairs[:, 1], pairs[:, 0]])
+        weights = np.concatenate([weights, np.full(2 * len(pairs), 0.5, dtype=np.float32)])
+
+    if method == 'spectral' and n > 3:
+        initial = spectral_projection(n, rows, cols, weights)
+    else:
+        initial = svd_projection(vectors)
+    if initial.shape[1] < 2:
+        initial = np.pad(initial, ((0, 0), (0, 2 - initial.shape[1])))
+    # Start from the projection scaled into the unit square, with a little jitter to split duplicates
+    rng = np.random.default_rng(seed)
+    initial = initial - initial.mean(axis=0)
+    initial = initial / (np.abs(initial).max() or 1) * 0.5 + rng.normal(0, 1e-3, initial.shape)
+
+    return fit_extent(refine(initial, rows, cols, weights, iterations, seed))
@@ -25,6 +25,11 @@ export function NetworkGraphCanvasClient() {
 		graphNodes,
 		graphEdges,
 		layoutType,
+		activeLayoutType,
+		layoutVersion,
+		isLayoutLoading,
+		layoutError,
+		retryLayout,
 		showLabels,
 		colorMode,
 		nodeSizeMode,
@@ -108,19 +113,54 @@ export function NetworkGraphCanvasClient() {
 					<span>Hold Shift and Drag to Lasso Select</span>
 				</div>
 
+				{/* Similarity Map status while the force-directed fallback is shown */}
+				{layoutType === 'custom' && activeLayoutType !== 'custom' && (isLayoutLoading || layoutError) && (
+					<div
+						style={{
+							zIndex: Z_INDEX.graphOverlay,
+							userSelect: 'none',
+							position: 'absolute',
+							top: 10,
+							left: 10,
+							background: layoutError ? 'rgba(185, 28, 28, .85)' : 'rgba(0, 0, 0, .5)',
+							color: 'white',
+							padding: '5px 10px',
+							borderRadius: '4px',
+							fontSize: '12px',
+						}}>
+						{layoutError ? (
+							<span>
+								Similarity Map unavailable, showing Force Directed.{' '}
+								<button type="button" className="underline" onClick={retryLayout}>
+									Retry
+								</button>
+							</span>
+						) : (
+							<span>Computing Similarity Map...</span>
+						)}
+					</div>
+				)}
+
 				{safeGraphNodes.length > 0 ? (
 					<GraphCanvas
-						key={`graph-${nodeSizeMode}-${colorMode}-${clusterMode}`}
+						key={`graph-${nodeSizeMode}-${colorMode}-${clusterMode}-${activeLayoutType === 'custom' ? layoutVersion : 0}`}
 						ref={graphRef}
 						nodes={safeGraphNodes}
 						edges={safeGraphEdges}
-						layoutType={layoutType as any}
+						layoutType={activeLayoutType as any}
 						layoutOverrides={{
 							clusterStrength: activeClusterAttribute ? GRAPH_LAYOUT_CONFIG.clusterStrength : 0,
 							linkDistance: GRAPH_LAYOUT_CONFIG.linkDistance,
 							nodeStrength: GRAPH_LAYOUT_CONFIG.nodeStrength,
 							gravity: GRAPH_LAYOUT_CONFIG.gravity,
-						}}
+							// Similarity Map: positions precomputed server-side (/api/layout),
+							// only rendered once they have loaded (see usePrecomputedLayout)
+							...(activeLayoutType === 'custom' && {
+								getNodePosition: (id: string, context?: any) =>
+									context?.drags?.[id]?.position ||
+									nodePositionsRef.current.get(id) || { x: 0, y: 0, z: 0 },
+							}),
+						} as any}
 						// Temporarily disable selections to isolate the error
 						// selections={safeSelections}
 						onNodeClick={handleCustomNodeClick}
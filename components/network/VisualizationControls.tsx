@@ -46,6 +46,12 @@ export function VisualizationControls({}: VisualizationControlsProps) {
 			name: 'Force Directed',
 			description: 'Physics-based natural spacing',
 		},
+		// Precomputed server-side from document similarity
+		{
+			id: 'custom',
+			name: 'Similarity Map',
+			description: 'Precomputed from document similarity',
+		},
 		// Radial layout
 		{
 			id: 'radialOut2d',
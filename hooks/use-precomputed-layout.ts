@@ -0,0 +1,127 @@
+'use client';
+
+import { useCallback, useEffect, useMemo, useState } from 'react';
+import type { GraphNode, GraphEdge } from 'reagraph';
+
+type Position = { x: number; y: number; z: number };
+
+/**
+ * Decode the /api/layout positions: base64 little-endian float32
+ * [x0, y0, x1, y1, ...] in ids order
+ */
+export function decodeLayoutPositions(ids: string[], base64: string): Map<string, Position> {
+	const binary = atob(base64);
+	const bytes = new Uint8Array(binary.length);
+	for (let i = 0; i < binary.length; i++) {
+		bytes[i] = binary.charCodeAt(i);
+	}
+	const view = new DataView(bytes.buffer);
+
+	const positions = new Map<string, Position>();
+	ids.forEach((id, i) => {
+		positions.set(id, {
+			x: view.getFloat32(i * 8, true),
+			y: view.getFloat32(i * 8 + 4, true),
+			z: 0,
+		});
+	});
+	return positions;
+}
+
+/** Client layout shown while Similarity Map positions load, or if they can't be computed */
+export const PRECOMPUTED_LAYOUT_FALLBACK = 'forceDirected2d';
+
+/**
+ * usePrecomputedLayout Hook
+ *
+ * For the 'custom' (Similarity Map) layout, fetches node positions computed
+ * server-side from the document vectors (/api/layout) instead of running a
+ * force simulation in the browser. Positions are written into
+ * nodePositionsRef, which the canvas reads through getNodePosition;
+ * `layoutVersion` changes when a new set arrives so the canvas re-lays out.
+ *
+ * `activeLayoutType` is what the canvas should render: the custom layout only
+ * once positions for the current nodes and edges exist, PRECOMPUTED_LAYOUT_FALLBACK
+ * while they load or after the request fails (`layoutError`). `retryLayout`
+ * requests them again; a new node or edge set is requested automatically.
+ *
+ * The server caches layouts by node set, so revisiting a result set is instant.
+ */
+export function usePrecomputedLayout(
+	layoutType: string,
+	graphNodes: GraphNode[],
+	graphEdges: GraphEdge[],
+	nodePositionsRef: React.MutableRefObject<Map<string, Position>>
+): {
+	activeLayoutType: string;
+	layoutVersion: number;
+	isLayoutLoading: boolean;
+	layoutError: string | null;
+	retryLayout: () => void;
+} {
+	const [layoutVersion, setLayoutVersion] = useState(0);
+	const [isLayoutLoading, setIsLayoutLoading] = useState(false);
+	const [layoutError, setLayoutError] = useState<string | null>(null);
+	const [readyLayoutKey, setReadyLayoutKey] = useState('');
+	const [attempt, setAttempt] = useState(0);
+
+	// The effect is keyed on these strings, not the array identities, so a re-render
+	// with the same nodes and edges neither aborts the request nor retries a failed one
+	const nodeSet = useMemo(() => graphNodes.map((node) => node.id).sort().join('\n'), [graphNodes]);
+	const edgeSet = useMemo(
+		() => graphEdges.map((edge) => `${edge.source}\t${edge.target}`).sort().join('\n'),
+		[graphEdges]
+	);
+	const layoutKey = `${nodeSet}\n\n${edgeSet}`;
+
+	useEffect(() => {
+		if (layoutType !== 'custom' || nodeSet === '') return;
+		if (layoutKey === readyLayoutKey) return;
+
+		const controller = new AbortController();
+		setIsLayoutLoading(true);
+		setLayoutError(null);
+
+		fetch('/api/layout', {
+			method: 'POST',
+			headers: { 'Content-Type': 'application/json' },
+			body: JSON.stringify({
+				ids: nodeSet.split('\n'),
+				links: edgeSet === ''
+					? []
+					: edgeSet.split('\n').map((edge) => {
+							const [source, target] = edge.split('\t');
+							return { source, target };
+						}),
+			}),
+			signal: controller.signal,
+		})
+			.then((response) => {
+				if (!response.ok) throw new Error(`Layout request failed: ${response.status}`);
+				return response.json();
+			})
+			.then((data) => {
+				if (!data.success) throw new Error(data.error || 'Layout request failed');
+				decodeLayoutPositions(data.ids, data.positions).forEach((position, id) => {
+					nodePositionsRef.current.set(id, position);
+				});
+				setReadyLayoutKey(layoutKey);
+				setLayoutVersion((version) => version + 1);
+			})
+			.catch((error) => {
+				if (error.name === 'AbortError') return;
+				console.error('[Layout] Failed to load precomputed layout:', error);
+				setLayoutError(error.message || 'Layout request failed');
+			})
+			.finally(() => setIsLayoutLoading(false));
+
+		return () => controller.abort();
+	}, [layoutType, nodeSet, edgeSet, layoutKey, readyLayoutKey, attempt, nodePositionsRef]);
+
+	const retryLayout = useCallback(() => setAttempt((count) => count + 1), []);
+
+	const hasPositions = nodeSet !== '' && layoutKey === readyLayoutKey;
+	const activeLayoutType = layoutType === 'custom' && !hasPositions ? PRECOMPUTED_LAYOUT_FALLBACK : layoutType;
+
+	return { activeLayoutType, layoutVersion, isLayoutLoading, layoutError, retryLayout };
+}
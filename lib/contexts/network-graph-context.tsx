@@ -22,6 +22,7 @@ import { useGraphVisualizationSettings } from '@/hooks/use-graph-visualization-s
 import { useGraphLayout } from '@/hooks/use-graph-layout';
 import { useGraphSelectionReagraph } from '@/hooks/use-graph-selection-reagraph';
 import { useGraphCoordination } from '@/hooks/use-graph-coordination';
+import { usePrecomputedLayout } from '@/hooks/use-precomputed-layout';
 
 // Define the context interface
 interface NetworkGraphContextType {
@@ -33,6 +34,11 @@ interface NetworkGraphContextType {
 
 	// Graph state
 	layoutType: string;
+	activeLayoutType: string;
+	layoutVersion: number;
+	isLayoutLoading: boolean;
+	layoutError: string | null;
+	retryLayout: () => void;
 	showLabels: boolean;
 	colorMode: ColorMode;
 	nodeSizeMode: NodeSizeMode;
@@ -207,7 +213,15 @@ export function NetworkGraphProvider({
 		closeLassoMenuFromHook,
 	});
 
-	// Hook 4: Selection state management (needs graphRef from coordination hook)
+	// Hook 4: Server-side positions for the precomputed (custom) layout
+	const { activeLayoutType, layoutVersion, isLayoutLoading, layoutError, retryLayout } = usePrecomputedLayout(
+		layoutType,
+		graphNodes,
+		graphEdges,
+		nodePositionsRef
+	);
+
+	// Hook 5: Selection state management (needs graphRef from coordination hook)
 	const {
 		selections,
 		selectedNode,
@@ -227,6 +241,11 @@ export function NetworkGraphProvider({
 
 			// Graph state
 			layoutType,
+			activeLayoutType,
+			layoutVersion,
+			isLayoutLoading,
+			layoutError,
+			retryLayout,
 			showLabels,
 			colorMode,
 			nodeSizeMode,
@@ -279,6 +298,11 @@ export function NetworkGraphProvider({
 			filteredResults,
 			filteredLinks,
 			layoutType,
+			activeLayoutType,
+			layoutVersion,
+			isLayoutLoading,
+			layoutError,
+			retryLayout,
 			showLabels,
 			colorMode,
 			nodeSizeMode,
@@ -12,6 +12,11 @@ const PINECONE_INDEX_HOST = process.env.PINECONE_INDEX_HOST || ''; // Add this t
 const PINECONE_NAMESPACE =
 	process.env.PINECONE_NAMESPACE || 'example-namespace';
 
+// Long documents are indexed as passages ("<id>#p<n>" with parent_id, see
+// scripts/chunking.py). Fetch extra hits so collapsing passages into their
+// documents still leaves topK documents.
+const PASSAGE_OVERFETCH = 3;
+
 // Types for Pinecone responses
 export interface PineconeSearchResult {
 	id: string;
@@ -64,23 +69,23 @@ export async function searchPinecone(
 		// Build the search query with optional filters
 		const searchQuery: any = {
 			query: {
-				topK,
+				topK: topK * PASSAGE_OVERFETCH,
 				inputs: { text: query },
 			},
+			// Only fields needed to filter and draw results; full text (content,
+			// summary, chunk_text) is looked up from the document store by id
 			fields: [
-				'chunk_text',
 				'category',
 				'label',
 				'type',
-				'summary',
-				'content',
 				'continent',
 				'country',
 				'sourceType',
 				'connected_to',
 				'url',
-				'embedding',
 				'tags',
+				'parent_id',
+				'passage',
 			],
 		};
 
@@ -91,7 +96,10 @@ export async function searchPinecone(
 		}
 
 		// Search using the exact pattern from the documentation
-		const response = await namespace.searchRecords(searchQuery);
+		const response: any = await namespace.searchRecords(searchQuery);
+		if (response?.result?.hits) {
+			response.result.hits = collapsePassageHits(response.result.hits, topK);
+		}
 
 		return { results: response };
 	} catch (error) {
@@ -99,3 +107,25 @@ export async function searchPinecone(
 		throw new Error(`Pinecone search failed: ${error}`);
 	}
 }
+
+/**
+ * Fold passage hits into their parent documents, keeping each document's
+ * best-scoring hit (hits arrive best first) and the passages that matched
+ */
+export function collapsePassageHits(hits: any[], topK: number): any[] {
+	const documents = new Map<string, any>();
+
+	for (const hit of hits) {
+		const { parent_id, passage, ...fields } = hit.fields || {};
+		const id = parent_id || hit._id;
+		const existing = documents.get(id);
+
+		if (existing) {
+			existing.passages.push(passage ?? 0);
+		} else {
+			documents.set(id, { ...hit, _id: id, fields, passages: [passage ?? 0] });
+		}
+	}
+
+	return Array.from(documents.values()).slice(0, topK);
+}
@@ -67,6 +67,7 @@ interface AppState {
 	// Complex actions
 	performSearch: (query: string, topK?: number) => Promise<void>;
 	processApiResponse: (data: any) => { nodes: Node[]; links: Link[] };
+	loadDocumentText: (ids: string[]) => Promise<void>; // Fill in full text from the document store
 
 	// Location filtering state
 	selectedContinents: string[]; // e.g., ['Europe', 'Asia']
@@ -380,6 +381,9 @@ export const useAppStore = create<AppState>()(
 				state.setSearchResults(nodes);
 				state.setLinks(links);
 				state.setHasSearched(true);
+
+				// Search hits carry lean metadata; fetch the full text in one batched lookup
+				state.loadDocumentText(nodes.map((node) => node.id));
 			} catch (err: any) {
 				console.error('Search error:', err);
 				state.setError(err.message || 'An error occurred during search');
@@ -388,6 +392,43 @@ export const useAppStore = create<AppState>()(
 			}
 		},
 
+		// Merge content, summary and chunk text from the local document store into the results
+		loadDocumentText: async (ids) => {
+			if (ids.length === 0) return;
+
+			try {
+				const response = await fetch('/api/documents/text', {
+					method: 'POST',
+					headers: { 'Content-Type': 'application/json' },
+					body: JSON.stringify({ ids, fields: ['content', 'summary', 'chunk_text'] }),
+				});
+				if (!response.ok) {
+					throw new Error(`Document text lookup failed with status ${response.status}`);
+				}
+
+				const { documents } = await response.json();
+				const withText = (nodes: Node[]) =>
+					nodes.map((node) => {
+						const text = documents[node.id];
+						return text
+							? {
+									...node,
+									content: text.content || node.content,
+									summary: text.summary || node.summary,
+									text: text.chunk_text || text.content || node.text,
+								}
+							: node;
+					});
+
+				set((state) => ({
+					searchResults: withText(state.searchResults),
+					filteredResults: withText(state.filteredResults),
+				}));
+			} catch (err) {
+				console.error('[Store] Failed to load document text:', err);
+			}
+		},
+
 		// Location filtering actions
 
 		clearLocationFilters: () => {
@@ -15,7 +15,8 @@ interface NetworkState {
 		| 'treeTd2d'
 		| 'treeLr2d'
 		| 'radialOut2d'
-		| 'forceatlas2';
+		| 'forceatlas2'
+		| 'custom';
 
 	// Actions
 	setNodes: (nodes: Node[]) => void;
@@ -34,6 +35,7 @@ interface NetworkState {
 			| 'treeLr2d'
 			| 'radialOut2d'
 			| 'forceatlas2'
+			| 'custom'
 	) => void;
 	clearSelections: () => void;
 }
@@ -14,7 +14,8 @@ export type NetworkLayoutType =
   | 'treeTd2d'
   | 'treeLr2d'
   | 'radialOut2d'
-  | 'forceatlas2';
+  | 'forceatlas2'
+  | 'custom';
 
 /**
  * Reagraph layout types (technical implementation names)
@@ -26,7 +27,8 @@ export type ReagraphLayoutType =
   | 'treeTd2d'
   | 'treeLr2d'
   | 'radialOut2d'
-  | 'forceatlas2';
+  | 'forceatlas2'
+  | 'custom';
 
 /**
  * LayoutMapper
@@ -71,6 +73,7 @@ export class LayoutMapper {
       treeLr2d: 'Tree Left-Right 2D - Hierarchical tree from left',
       radialOut2d: 'Radial Out 2D - Radiating from center',
       forceatlas2: 'ForceAtlas2 - Optimized for large graphs',
+      custom: 'Similarity Map - Precomputed server-side from document vectors',
     };
     
     return descriptions[layoutType] || 'Unknown layout';
@@ -0,0 +1,96 @@
+/**
+ * Run a Python CLI script with JSON over stdin/stdout
+ *
+ * Used by API routes that delegate to Python (clustering, graph index, ...).
+ * The script reads one JSON document from stdin and prints one JSON document;
+ * a top-level "error" field in the output rejects the promise.
+ */
+
+import { spawn } from 'child_process';
+import { existsSync } from 'fs';
+import path from 'path';
+
+/**
+ * Resolve the Python interpreter: PYTHON_PATH (Docker/Render), then the
+ * clustering venv when running locally, then python3
+ */
+function resolvePythonCommand(): string {
+	if (process.env.PYTHON_PATH) {
+		return process.env.PYTHON_PATH;
+	}
+
+	const projectRoot = process.cwd();
+	const venvPaths = [
+		path.join(projectRoot, 'backend', 'clustering', 'venv', 'Scripts', 'python.exe'), // Windows
+		path.join(projectRoot, 'backend', 'clustering', 'venv', 'bin', 'python'), // Unix
+	];
+
+	for (const venvPath of venvPaths) {
+		if (existsSync(venvPath)) {
+			return venvPath;
+		}
+	}
+
+	return 'python3';
+}
+
+/**
+ * Run a Python script and return its parsed JSON output
+ */
+export function runPythonScript(scriptPath: string, inputData: any, args: string[] = []): Promise<any> {
+	return new Promise((resolve, reject) => {
+		const pythonCommand = resolvePythonCommand();
+		console.log(`[Python] Using Python: ${pythonCommand}`);
+
+		const python = spawn(pythonCommand, [scriptPath, ...args]);
+
+		let stdout = '';
+		let stderr = '';
+
+		// Write input to stdin
+		python.stdin.write(JSON.stringify(inputData));
+		python.stdin.end();
+
+		// Collect stdout
+		python.stdout.on('data', (data) => {
+			stdout += data.toString();
+		});
+
+		// Collect stderr
+		python.stderr.on('data', (data) => {
+			stderr += data.toString();
+		});
+
+		// Handle process completion
+		python.on('close', (code) => {
+			let result: any;
+			try {
+				result = JSON.parse(stdout);
+			} catch (error) {
+				reject(
+					code !== 0
+						? new Error(`Python script failed with code ${code}: ${stderr}`)
+						: new Error(`Failed to parse Python output: ${stdout}`)
+				);
+				return;
+			}
+
+			if (result.error) {
+				reject(new Error(result.error));
+				return;
+			}
+
+			if (code !== 0) {
+				reject(new Error(`Python script failed with code ${code}: ${stderr}`));
+				return;
+			}
+
+			resolve(result);
+		});
+
+		// Handle errors
+		python.on('error', (error) => {
+			reject(new Error(`Failed to start Python process: ${error.message}`));
+		});
+	});
+}
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+EU AI Act Article Page Parser
+Single-parse field extraction for artificialintelligenceact.eu article pages.
+
+Each page is parsed once into an ArticlePage, which strips page chrome
+(scripts, styles, nav, header, footer) a single time and lazily caches the
+derived text views every extractor needs. Extractors only read the page, so
+the order they run in no longer changes their results.
+
+lxml (in requirements.txt) is the tree builder; html.parser is only a
+fallback for environments where lxml cannot be installed.
+
+All functions are module-level so they can run in worker processes.
+"""
+
+import re
+from datetime import datetime
+from functools import cached_property
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+def _pick_parser():
+    """Fastest available BeautifulSoup tree builder."""
+    try:
+        BeautifulSoup('', 'lxml')
+        return 'lxml'
+    except FeatureNotFound:
+        return 'html.parser'
+
+PARSER = _pick_parser()
+
+CHROME_TAGS = ["script", "style", "nav", "header", "footer"]
+NAV_CLASSES = {'navigation', 'nav'}
+CONTENT_AREA_CLASS = re.compile(r'content|main|post|article', re.IGNORECASE)
+TITLE_SELECTORS = ['h1.entry-title', 'h1', '.entry-title', '.title', '#title', '.post-title']
+TITLE_SUFFIX = re.compile(r'\s*\|\s*EU Artificial Intelligence Act.*$', re.IGNORECASE)
+
+CONTENT_PATTERNS = [
+    # Pattern for main regulation content
+    re.compile(r'(\d+\.\s+.*?(?:shall|means|includes|lays down|applies).*?)(?=(?:Previous|Next|Suitable Recitals|Summary|See here for))', re.DOTALL | re.IGNORECASE),
+    # More specific pattern for Article 1 type content
+    re.compile(r'(1\.\s+The purpose of this Regulation.*?)(?=(?:Previous|Next|Suitable Recitals|Summary|See here for))', re.DOTALL | re.IGNORECASE),
+    # General numbered paragraph pattern
+    re.compile(r'(\d+\.\s+.*?)(?=(?:Previous|Next|Suitable Recitals|Summary))', re.DOTALL | re.IGNORECASE),
+]
+MAIN_TEXT_PATTERN = re.compile(r'(\d+\.\s+.*?)(?=(?:Previous|Next|Suitable Recitals|Summary))', re.DOTALL)
+HTML_TAG = re.compile(r'<[^>]+>')
+WHITESPACE = re.compile(r'\s+')
+
+CHAPTER_PATTERNS = [
+    re.compile(r'Chapter\s+([IVX]+):\s*([^→\n<]+)', re.IGNORECASE),
+    re.compile(r'Part\s+of\s+Chapter\s+([IVX]+)', re.IGNORECASE),
+    re.compile(r'→\s*Chapter\s+([IVX]+):\s*([^→\n<]+)', re.IGNORECASE),
+]
+
+SUMMARY_PATTERNS = [
+    re.compile(r'Summary\s+((?:The EU AI Act|This (?:article|law|regulation)).*?)Generated by CLaiRK.*?edited by us', re.DOTALL | re.IGNORECASE),
+    re.compile(r'((?:The EU AI Act|This (?:article|law|regulation)).*?)Generated by CLaiRK.*?edited by us', re.DOTALL | re.IGNORECASE),
+    re.compile(r'Summary\s+(.*?)Generated by CLaiRK.*?edited by us', re.DOTALL | re.IGNORECASE),
+]
+SUMMARY_NOISE = re.compile(r'(function|var |\.css|\.js|\{|\}|#|border:|padding:|margin:)')
+ARTICLE_5_SUMMARY = "The EU AI Act prohibits certain uses of artificial intelligence (AI). These include AI systems that manipulate people's decisions or exploit their vulnerabilities, systems that evaluate or classify people based on their social behavior or personal traits, and systems that predict a person's risk of committing a crime. The Act also bans AI systems that scrape facial images from the internet or CCTV footage, infer emotions in the workplace or educational institutions, and categorize people based on their biometric data. However, some exceptions are made for law enforcement purposes, such as searching for missing persons or preventing terrorist attacks."
+
+DATE_PATTERNS = [
+    re.compile(r'Date of entry into force:\s*([^A-Z]*?)(?:[A-Z]|$)', re.IGNORECASE),
+    re.compile(r'Date of entry into force:\s*([^\n\r]*?)(?:\n|\r|$)', re.IGNORECASE),
+    re.compile(r'Date of entry into force:\s*(.*?)(?:According to:|Inherited from:|$)', re.IGNORECASE),
+]
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June',
+          'July', 'August', 'September', 'October', 'November', 'December']
+DAY_PATTERN = re.compile(r'\b(\d{1,2})\s+(?:' + '|'.join(MONTHS) + r')', re.IGNORECASE)
+
+class ArticlePage:
+    """One parsed article page plus lazily computed, shared text views."""
+
+    def __init__(self, html_content, html_text=None, parser=PARSER):
+        if html_text is None:
+            html_text = html_content.decode('utf-8', errors='replace') if isinstance(html_content, bytes) else html_content
+        self.html_text = html_text
+        self.soup = BeautifulSoup(html_content, parser)
+        for element in self.soup(CHROME_TAGS):
+            element.decompose()
+
+    @cached_property
+    def page_text(self):
+        """Text of the page without chrome, newline structure preserved."""
+        return self.soup.get_text()
+
+    @cached_property
+    def content_area_texts(self):
+        """Space-joined text of each content container (article/main/div with a content-like class)."""
+        areas = self.soup.find_all(['article', 'main', 'div'], class_=CONTENT_AREA_CLASS)
+        if not areas:
+            # Fallback to the entire body if no specific content area found
+            areas = [self.soup.body] if self.soup.body else [self.soup]
+        return [area.get_text(separator=' ', strip=True) for area in areas if area]
+
+    @cached_property
+    def main_text(self):
+        """Text of the main content container, skipping navigation blocks."""
+        main_elem = self.soup.find('main') or self.soup.find('div', class_=re.compile('content', re.I))
+        if not main_elem:
+            return ''
+        return ''.join(
+            string for string in main_elem.find_all(string=True)
+            if not any(NAV_CLASSES & set(parent.get('class') or []) for parent in string.parents if parent is not main_elem)
+        )
+
+def clean_text(text):
+    """Collapse whitespace."""
+    if not text:
+        return ""
+    return ' '.join(text.split()).strip()
+
+def clean_content_text(text):
+    """Clean extracted content text"""
+    if not text:
+        return ""
+
+    # Remove extra whitespace
+    text = re.sub(r'\s+', ' ', text)
+
+    # Remove common unwanted patterns
+    text = re.sub(r'(← Previous|Next →|Previous|Next)\s*', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'\s*(Share|Print|Email)\s*', '', text, flags=re.IGNORECASE)
+
+    # Remove HTML artifacts and navigation elements
+    text = re.sub(r'<span class="nav-[^>]*>', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'<[^>]*>', '', text)  # Remove any remaining HTML tags
+    text = re.sub(r'&[^;]+;', '', text)  # Remove HTML entities like &rarr;
+
+    # Remove navigation text patterns at the end
+    text = re.sub(r'\s*(Next|Previous|Suitable Recitals|Summary|See here for|Part of Chapter).*$', '', text, flags=re.IGNORECASE)
+
+    return text.strip()
+
+def extract_title(page):
+    """Extract title from the page"""
+    # Try multiple selectors in order of preference
+    for selector in TITLE_SELECTORS:
+        elem = page.soup.select_one(selector)
+        if elem:
+            title = clean_text(elem.get_text())
+            if title and not title.startswith('Chapter'):
+                return title
+
+    # Fallback to page title
+    title_elem = page.soup.find('title')
+    if title_elem:
+        # Clean up common title suffixes
+        return TITLE_SUFFIX.sub('', clean_text(title_elem.get_text()))
+
+    return "Untitled"
+
+def extract_content(page):
+    """Extract main article content"""
+    # Method 1: Extract from raw HTML text using regex
+    for pattern in CONTENT_PATTERNS:
+        match = pattern.search(page.html_text)
+        if match:
+            # Clean up HTML tags and extra whitespace
+            content = WHITESPACE.sub(' ', HTML_TAG.sub('', match.group(1).strip()))
+            if len(content) > 100:  # Must be substantial content
+                return clean_content_text(content)
+
+    # Method 2: Look for main content container
+    match = MAIN_TEXT_PATTERN.search(page.main_text)
+    if match:
+        content = match.group(1).strip()
+        if len(content) > 100:
+            return clean_content_text(content)
+
+    # Method 3: Extract from body
+    body_text = page.page_text
+    start = body_text.find("1. The purpose of this Regulation")
+    if start != -1:
+        end_markers = ["Previous", "Next", "Suitable Recitals", "Summary", "See here for"]
+        end_pos = len(body_text)
+        for marker in end_markers:
+            marker_pos = body_text.find(marker, start)
+            if marker_pos != -1 and marker_pos < end_pos:
+                end_pos = marker_pos
+
+        content = body_text[start:end_pos].strip()
+        if len(content) > 100:
+            return clean_content_text(content)
+
+    return ""
+
+def extract_references(page):
+    """Extract recital ids listed under the page's "Suitable Recitals" heading"""
+    connected_recitals = []
+    page_text = page.page_text
+
+    suitable_pos = page_text.find("Suitable Recitals")
+    if suitable_pos != -1:
+        # Text after "Suitable Recitals" (next 500 characters should be enough)
+        lines = page_text[suitable_pos:suitable_pos + 500].split('\n')
+        for line in lines[1:]:  # Skip the "Suitable Recitals" line itself
+            line = line.strip()
+
+            # Stop if we hit other sections
+            if any(stop_word in line.lower() for stop_word in
+                   ['summary', 'copy url', 'part of', 'according to', 'date of entry']):
+                break
+
+            # If line contains only numbers, spaces, and commas, extract numbers
+            if line and re.match(r'^[0-9\s,]+$', line):
+                for num in re.findall(r'\b\d+\b', line):
+                    if 1 <= int(num) <= 180:  # Valid recital range
+                        connected_recitals.append(f"R{num}")
+
+    # Remove duplicates and sort numerically
+    connected_recitals = sorted(set(connected_recitals), key=lambda r: int(r[1:]))
+
+    # Hundreds of ids means we picked up navigation, not the recital list
+    if len(connected_recitals) > 100:
+        connected_recitals = []
+
+    return connected_recitals
+
+def extract_chapter(page):
+    """Extract chapter information"""
+    html_text = page.html_text
+
+    # Special case for Article 5
+    if "Article 5:" in html_text or "article/5/" in html_text:
+        return "Part of Chapter II"
+
+    # Try to find chapter in metadata section
+    metadata_section = page.soup.find("div", class_="article-metadata")
+    if metadata_section:
+        # Look for "Inherited from:" text
+        for p in metadata_section.find_all("p"):
+            if "Inherited from:" in p.text:
+                chapter_text = p.text.split("Inherited from:")[1].strip()
+                return chapter_text if chapter_text.startswith("Chapter") else f"Part of {chapter_text}"
+
+    # Try to find chapter in breadcrumbs
+    breadcrumbs = page.soup.find("div", class_="breadcrumbs")
+    if breadcrumbs:
+        for link in breadcrumbs.find_all("a"):
+            if "Chapter" in link.text:
+                return link.text.strip()
+
+    # Try regex patterns as last resort
+    for pattern in CHAPTER_PATTERNS:
+        match = pattern.search(html_text)
+        if match:
+            if len(match.groups()) > 1:
+                return f"Chapter {match.group(1)}: {match.group(2).strip()}"
+            return match.group(0).strip()
+
+    return "Unknown Chapter"
+
+def _is_summary(text):
+    """Looks like a real summary (not navigation, CSS, etc.)"""
+    return (100 < len(text) < 2000 and
+            not SUMMARY_NOISE.search(text) and
+            any(keyword in text.lower() for keyword in
+                ['ai', 'artificial intelligence', 'system', 'regulation', 'article']))
+
+def extract_summary(page, number):
+    """Extract the CLaiRK-generated summary from an article page"""
+    # Special case for Article 5 - use article number for precise detection
+    if number == 5:
+        return ARTICLE_5_SUMMARY
+
+    summary_text = None
+    for content_text in page.content_area_texts:
+        for pattern in SUMMARY_PATTERNS:
+            match = pattern.search(content_text)
+            if match:
+                potential_summary = WHITESPACE.sub(' ', match.group(1).strip())
+                if _is_summary(potential_summary):
+                    summary_text = potential_summary
+                    break
+        if summary_text:
+            break
+
+    # Fallback: If no "Generated by CLaiRK" pattern, look for substantial AI content
+    if not summary_text:
+        for element in page.soup.find_all(['p', 'div', 'span']):
+            text = element.get_text(strip=True)
+            if (len(text) > 80 and
+                any(keyword in text.lower() for keyword in
+                    ['this article', 'this law', 'artificial intelligence', 'ai systems']) and
+                not text.startswith('Article ') and  # Avoid article titles
+                'Related:' not in text):  # Avoid navigation elements
+                summary_text = text
+                break
+
+    # Final cleanup if found
+    if summary_text:
+        summary_text = ' '.join(summary_text.split())
+        if len(summary_text) < 50:
+            summary_text = None
+
+    return summary_text if summary_text else "No summary available"
+
+def extract_entry_into_force(page):
+    """Date of entry into force as written on the page (e.g. "2 February 2025"), or None"""
+    for content_text in page.content_area_texts:
+        for pattern in DATE_PATTERNS:
+            match = pattern.search(content_text)
+            if match:
+                potential_date = WHITESPACE.sub(' ', match.group(1).strip())
+                # Validate it looks like a date (contains month/year patterns)
+                if (len(potential_date) < 100 and
+                    any(month in potential_date for month in MONTHS) and
+                    re.search(r'20\d{2}', potential_date)):
+                    return potential_date
+    return None
+
+def normalize_active_date(number, date_text):
+    """Convert an entry-into-force date to YYYY-MM-DD, falling back to the known phases"""
+    if date_text:
+        year_match = re.search(r'20\d{2}', date_text)
+        year = year_match.group(0) if year_match else "2026"
+
+        month = '08'  # Default to August
+        for index, month_name in enumerate(MONTHS, start=1):
+            if month_name.lower() in date_text.lower():
+                month = f"{index:02d}"
+                break
+
+        day_match = DAY_PATTERN.search(date_text)
+        day = day_match.group(1).zfill(2) if day_match else "02"  # Default to 2nd
+
+        return f"{year}-{month}-{day}"
+
+    # Fallback to hardcoded dates if extraction fails
+    # Phase 1: 2 February 2025 - Prohibited practices
+    if number in [5]:
+        return "2025-02-02"
+    # Phase 2: 2 August 2025 - GPAI obligations
+    if number in [53, 54, 55, 56]:
+        return "2025-08-02"
+    # Phase 3: 2 February 2026 - High-risk guidelines
+    if number in [6]:
+        return "2026-02-02"
+    # Phase 4: 2 August 2026 - Full application (most articles)
+    return "2026-08-02"
+
+def status_for(active_date):
+    """'active' once the active date has passed, otherwise 'pending'"""
+    return "active" if active_date <= datetime.now().strftime("%Y-%m-%d") else "pending"
+
+def parse_article(html_content, url, number, html_text=None, parser=PARSER):
+    """Parse an article page once and return the flattened article node"""
+    page = ArticlePage(html_content, html_text, parser)
+    content = extract_content(page)
+    summary = extract_summary(page, number)
+    active_date = normalize_active_date(number, extract_entry_into_force(page))
+
+    return {
+        'id': f"A{number}",
+        'type': 'article',
+        'title': extract_title(page),
+        'continent': 'Europe',
+        'sourceType': 'NGO',
+        'content': content,
+        'content_length': len(content) if content else 0,
+        'summary': summary,
+        'summary_length': len(summary) if summary else 0,
+        'connected_to': extract_references(page),
+        'active_date': active_date,
+        'status': status_for(active_date),
+        'url': url
+    }
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Scraper Benchmark
+Runs the EU article and recital scrapers against recorded HTTP fixtures (see
+replay.py) at full speed, with no network access.
+
+Reports:
+- Pages per second for each scraper end to end (replayed fetch + parse)
+- Pages per second and per-extractor milliseconds per page, for each
+  BeautifulSoup tree builder installed (lxml, html.parser)
+- Peak traced memory of each scraper run
+
+Shared text views on ArticlePage are computed lazily, so their cost is
+charged to the first extractor that reads them.
+
+Replay is offline: a page missing from the fixtures fails its fetch, and the
+benchmark exits non-zero, instead of reaching the network.
+
+On the committed synthetic set (scripts/fixtures/sample/) the run is a parser
+regression check: records must still be extracted, but the pages are small
+renderings of the corpus, so the timings say nothing about real pages. The
+report then carries "synthetic": true and the output says so.
+
+Usage:
+    python scripts/replay.py record                       # once, needs network
+    python scripts/bench_scrapers.py --dir scripts/fixtures/sample   # synthetic set: regression check only
+    python scripts/bench_scrapers.py [--dir DIR] [--repeat N] [--parser NAME ...] [--report PATH]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import List, Dict, Any, Callable, Tuple
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from article_parser import (ArticlePage, extract_content, extract_entry_into_force, extract_references,
+                            extract_summary, extract_title)
+from replay import DEFAULT_FIXTURE_DIR, SAMPLE_FIXTURE_DIR, fixture_cache, is_synthetic, replaying, scraper_urls
+from scrape_pipeline import run_pipeline
+from scraper_eu_articles import EUAIActStandardizedScraper
+from scraper_eu_recitals import build_recital, extract_recital_content
+
+CANDIDATE_PARSERS = ['lxml', 'html.parser']
+FULL_SPEED = 1e9  # Requests per second when replaying
+
+# Extractors run by parse_article, in the order it runs them
+ARTICLE_EXTRACTORS: List[Tuple[str, Callable[[ArticlePage, int], Any]]] = [
+    ('content', lambda page, number: extract_content(page)),
+    ('summary', extract_summary),
+    ('entry_into_force', lambda page, number: extract_entry_into_force(page)),
+    ('title', lambda page, number: extract_title(page)),
+    ('references', lambda page, number: extract_references(page)),
+]
+
+def available_parsers() -> List[str]:
+    """Tree builders installed in this environment."""
+    parsers = []
+    for name in CANDIDATE_PARSERS:
+        try:
+            BeautifulSoup('', name)
+            parsers.append(name)
+        except FeatureNotFound:
+            pass
+    return parsers
+
+def load_fixture_pages(directory: str) -> Dict[str, List[Tuple[int, str, bytes]]]:
+    """(number, url, body) for every recorded scraper page, by kind."""
+    cache = fixture_cache(directory)
+    pages = {}
+    for kind, urls in scraper_urls().items():
+        pages[kind] = []
+        for number, url in enumerate(urls, start=1):
+            cached = cache.get(url)
+            if cached:
+                pages[kind].append((number, url, cached[1]))
+    return pages
+
+def bench_article_extractors(pages: List[Tuple[int, str, bytes]], parser: str, repeat: int) -> Dict[str, Any]:
+    """Best-of-`repeat` pages/s and per-stage ms/page for article extraction."""
+    best = None
+    for _ in range(repeat):
+        stages = {'parse': 0.0, **{name: 0.0 for name, _ in ARTICLE_EXTRACTORS}}
+        for number, _, body in pages:
+            start = time.perf_counter()
+            page = ArticlePage(body, parser=parser)
+            stages['parse'] += time.perf_counter() - start
+            for name, extractor in ARTICLE_EXTRACTORS:
+                start = time.perf_counter()
+                extractor(page, number)
+                stages[name] += time.perf_counter() - start
+        if best is None or sum(stages.values()) < sum(best.values()):
+            best = stages
+
+    total = sum(best.values())
+    return {
+        'pages_per_sec': len(pages) / total,
+        'ms_per_page': {name: 1000 * seconds / len(pages) for name, seconds in best.items()},
+    }
+
+def bench_recital_extractor(pages: List[Tuple[int, str, bytes]], repeat: int) -> Dict[str, Any]:
+    """Best-of-`repeat` pages/s for extract_recital_content (it parses internally)."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for number, _, body in pages:
+            extract_recital_content(body, f"R{number}")
+        best = min(best, time.perf_counter() - start)
+    return {
+        'pages_per_sec': len(pages) / best,
+        'ms_per_page': {'extract_recital_content': 1000 * best / len(pages)},
+    }
+
+def scrape_articles(numbers: List[int]) -> List[Dict[str, Any]]:
+    """Full article scraper run (fetch stage + in-process parse)."""
+    scraper = EUAIActStandardizedScraper(rate=FULL_SPEED, workers=1)
+    return scraper.scrape_articles(numbers)
+
+def scrape_recitals(numbers: List[int]) -> List[Dict[str, Any]]:
+    """Full recital scraper run without writing its output file."""
+    jobs = [(n, scraper_urls()['recital'][n - 1]) for n in numbers]
+    return [record for _, _, record, _ in run_pipeline(jobs, build_recital, workers=1, rate=FULL_SPEED) if record]
+
+def bench_scraper(scrape: Callable[[List[int]], List[Dict[str, Any]]], numbers: List[int]) -> Dict[str, Any]:
+    """Time one scraper run, then trace a second run's peak memory."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        records = scrape(numbers)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        scrape(numbers)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        'pages': len(numbers),
+        'records': len(records),
+        'pages_per_sec': len(numbers) / elapsed,
+        'peak_memory_mb': peak / 1024 / 1024,
+    }
+
+def print_report(report: Dict[str, Any]) -> None:
+    """Human-readable summary of a benchmark report."""
+    print("\n" + "=" * 70)
+    print("📊 PARSER REGRESSION CHECK (SYNTHETIC PAGES)" if report['synthetic'] else "📊 SCRAPER BENCHMARK")
+    print("=" * 70)
+    if report['synthetic']:
+        print("\n⚠️  Fixtures were rendered from the corpus, not recorded: timings are not real scraping throughput")
+
+    for kind, result in report['scrapers'].items():
+        print(f"\n{kind.title()} scraper: {result['records']}/{result['pages']} records, "
+              f"{result['pages_per_sec']:.1f} pages/s, peak {result['peak_memory_mb']:.1f} MB")
+
+    for name, result in report['extractors'].items():
+        print(f"\n{name}: {result['pages_per_sec']:.1f} pages/s")
+        for stage, ms in result['ms_per_page'].items():
+            print(f"  • {stage:<24} {ms:7.2f} ms/page")
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the EU scrapers on recorded fixtures.")
+    parser.add_argument('--dir', default=DEFAULT_FIXTURE_DIR, help="Fixture directory recorded by replay.py")
+    parser.add_argument('--repeat', type=int, default=3, help="Extraction passes; the best is reported")
+    parser.add_argument('--parser', nargs='+', dest='parsers', help="Tree builders to compare (default: all installed)")
+    parser.add_argument('--report', metavar='PATH', help="Also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    pages = load_fixture_pages(args.dir) if os.path.isdir(args.dir) else {}
+    if not any(pages.values()):
+        print(f"❌ No fixtures in {args.dir}; record them with: python scripts/replay.py record "
+              f"(or check the parsers on the committed synthetic set with --dir {SAMPLE_FIXTURE_DIR})")
+        return 1
+    print(f"📼 {len(pages['article'])} article and {len(pages['recital'])} recital pages from {args.dir}")
+
+    report = {'fixtures': args.dir, 'synthetic': is_synthetic(args.dir), 'scrapers': {}, 'extractors': {}}
+    os.environ['SCRAPE_MANIFEST'] = 'off'  # Parse every page instead of reusing previous records
+    with replaying(args.dir):
+        for kind, scrape in (('article', scrape_articles), ('recital', scrape_recitals)):
+            if pages[kind]:
+                report['scrapers'][kind] = bench_scraper(scrape, [number for number, _, _ in pages[kind]])
+
+    for name in args.parsers or available_parsers():
+        if pages['article']:
+            report['extractors'][f"articles ({name})"] = bench_article_extractors(pages['article'], name, args.repeat)
+    if pages['recital']:
+        report['extractors']['recitals (html.parser)'] = bench_recital_extractor(pages['recital'], args.repeat)
+
+    print_report(report)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"\n💾 Report saved to: {args.report}")
+
+    # A page that no longer yields a record is an extraction regression
+    missing = {kind: result['pages'] - result['records'] for kind, result in report['scrapers'].items()
+               if result['records'] < result['pages']}
+    if missing:
+        print(f"\n❌ Pages without a record: {missing}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
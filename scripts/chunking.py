@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Passage Chunking
+Splits long documents into overlapping passages for the vector index instead
+of truncating their text, and folds passage hits back into documents.
+
+A document whose chunk_text is longer than PASSAGE_SIZE is uploaded as:
+
+    parent    its own _id and display fields; chunk_text is the title and
+              summary, so the document itself still matches by topic
+    passages  _id "<parent>#p<n>" with parent_id, passage (1-based) and a
+              PASSAGE_SIZE window of the full text, overlapping the previous
+              window by PASSAGE_OVERLAP characters, plus the parent's other
+              metadata so filters match them and a passage hit can be drawn
+
+Shorter documents are uploaded unchanged. Passages only exist in the vector
+index: the snapshot, document store, listing and graph indexes keep one record
+per document.
+
+Search over-fetches (PASSAGE_OVERFETCH × top_k) and collapse_hits keeps the
+best-scoring hit per document, reporting which passages matched.
+"""
+
+import re
+from typing import List, Dict, Any, Iterable, Iterator
+
+PASSAGE_SIZE = 2000      # Characters per passage window
+PASSAGE_OVERLAP = 300    # Characters shared by consecutive passages
+PASSAGE_OVERFETCH = 3    # Search top_k multiplier before collapsing passages
+PASSAGE_SEPARATOR = '#p'
+PASSAGE_EXCLUDED_FIELDS = ('_id', 'chunk_text', 'content', 'passage_count')
+WORD_START = re.compile(r'\s\S')
+
+def split_passages(text: str, size: int = PASSAGE_SIZE, overlap: int = PASSAGE_OVERLAP) -> List[str]:
+    """Overlapping windows of at most `size` characters, cut at whitespace where possible."""
+    text = text.strip()
+    if len(text) <= size:
+        return [text] if text else []
+
+    passages = []
+    start = 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        if end < len(text):
+            # Back off to the last space so words are not split, unless that loses half the window
+            cut = text.rfind(' ', start + size // 2, end)
+            end = cut if cut > 0 else end
+        passages.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        # Step back by the overlap, then forward to the next word start
+        start = max(end - overlap, start + 1)
+        match = WORD_START.search(text, start - 1)
+        start = match.start() + 1 if match and match.start() < end else start
+    return passages
+
+def passage_id(parent_id: str, number: int) -> str:
+    """Vector id of a document's nth passage (1-based)."""
+    return f"{parent_id}{PASSAGE_SEPARATOR}{number}"
+
+def document_id(_id: str) -> str:
+    """Document id of a vector id (passage ids map to their parent)."""
+    return _id.split(PASSAGE_SEPARATOR, 1)[0]
+
+def passage_records(record: Dict[str, Any], size: int = PASSAGE_SIZE,
+                    overlap: int = PASSAGE_OVERLAP) -> List[Dict[str, Any]]:
+    """The vector records for one document: itself when short, else a parent plus its passages."""
+    passages = split_passages(record['chunk_text'], size, overlap)
+    if len(passages) <= 1:
+        return [record]
+
+    parent = dict(record)
+    heading = '. '.join(part for part in (record.get('label'), record.get('summary')) if part)
+    parent['chunk_text'] = (heading or passages[0])[:size]
+    parent['passage_count'] = len(passages)
+
+    shared = {key: value for key, value in record.items() if key not in PASSAGE_EXCLUDED_FIELDS}
+    children = [{**shared, '_id': passage_id(record['_id'], number), 'parent_id': record['_id'],
+                 'passage': number, 'chunk_text': text}
+                for number, text in enumerate(passages, start=1)]
+    return [parent] + children
+
+def expand_passages(records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Replace each long document in a record stream by its parent and passage records."""
+    for record in records:
+        yield from passage_records(record)
+
+def collapse_hits(hits: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+    """
+    Fold passage hits into their documents, best score first.
+
+    Each document keeps its best hit's score and fields; `passages` lists the
+    matching passage numbers (0 = the parent record itself).
+    """
+    documents: Dict[str, Dict[str, Any]] = {}
+    for hit in sorted(hits, key=lambda hit: -hit['_score']):
+        fields = hit.get('fields', {})
+        _id = fields.get('parent_id') or document_id(hit['_id'])
+        if _id not in documents:
+            documents[_id] = {'_id': _id, '_score': hit['_score'],
+                              'fields': {key: value for key, value in fields.items() if key not in ('parent_id', 'passage')},
+                              'passages': []}
+        documents[_id]['passages'].append(fields.get('passage', 0))
+    return list(documents.values())[:top_k]
@@ -1,8 +1,48 @@
-import requests
-from bs4 import BeautifulSoup
 import json
-import time
-import re
+
+from article_parser import ArticlePage, extract_entry_into_force
+from fetch import fetch_all
+
+BASE_URL = "https://artificialintelligenceact.eu/article/"
+DEFAULT_RATE = 1.0  # Requests per second; the old 2-second sleep averaged about 0.4/s
+
+def article_date_url(article_number):
+    """URL of the article page that carries its date of entry into force."""
+    return f"{BASE_URL}{article_number}/"
+
+def extract_article_date(html_content):
+    """
+    Extract the date of entry into force from an article page.
+    
+    Args:
+        html_content (bytes or str): Raw HTML of the article page
+        
+    Returns:
+        str or None: Date text such as "2 February 2025", or None if not found
+    """
+    return extract_entry_into_force(ArticlePage(html_content))
+
+def date_result(article_number, fetch_result):
+    """Build the per-article result dict from a fetch result."""
+    result = {
+        'article_number': article_number,
+        'url': fetch_result.url,
+        'date_of_entry_into_force': None,
+        'status': 'no_date_found'
+    }
+    
+    if not fetch_result.ok:
+        result['status'] = f'error: {fetch_result.error}'
+        return result
+    
+    try:
+        result['date_of_entry_into_force'] = extract_article_date(fetch_result.content)
+        if result['date_of_entry_into_force']:
+            result['status'] = 'success'
+    except Exception as e:
+        result['status'] = f'parsing_error: {str(e)}'
+    
+    return result
 
 def scrape_article_date(article_number):
     """
@@ -14,120 +54,40 @@ def scrape_article_date(article_number):
     Returns:
         dict: Dictionary containing article number and date of entry into force
     """
-    base_url = "https://artificialintelligenceact.eu/article/"
-    url = f"{base_url}{article_number}/"
-    
-    try:
-        # Add headers to mimic a real browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for the date of entry into force
-        entry_into_force_date = None
-        
-        # Remove script, style, navigation elements that might contain unwanted text
-        for element in soup(["script", "style", "nav", "header", "footer"]):
-            element.decompose()
-        
-        # Look for the main content area - usually in article, main, or content divs
-        main_content_areas = soup.find_all(['article', 'main', 'div'], 
-                                         class_=re.compile(r'content|main|post|article', re.IGNORECASE))
-        
-        if not main_content_areas:
-            # Fallback to the entire body if no specific content area found
-            main_content_areas = [soup.body] if soup.body else [soup]
-        
-        # Extract Date of entry into force
-        # Look for patterns like "Date of entry into force: 2 February 2025"
-        for content_area in main_content_areas:
-            if content_area:
-                content_text = content_area.get_text(separator=' ', strip=True)
-                
-                # Look for date patterns
-                date_patterns = [
-                    r'Date of entry into force:\s*([^A-Z]*?)(?:[A-Z]|$)',
-                    r'Date of entry into force:\s*([^\n\r]*?)(?:\n|\r|$)',
-                    r'Date of entry into force:\s*(.*?)(?:According to:|Inherited from:|$)'
-                ]
-                
-                for pattern in date_patterns:
-                    match = re.search(pattern, content_text, re.IGNORECASE)
-                    if match:
-                        potential_date = match.group(1).strip()
-                        
-                        # Clean up the date - remove extra text after the actual date
-                        potential_date = re.sub(r'\s+', ' ', potential_date)  # Normalize whitespace
-                        
-                        # Validate it looks like a date (contains month/year patterns)
-                        if (len(potential_date) < 100 and  # Not too long
-                            any(month in potential_date for month in 
-                                ['January', 'February', 'March', 'April', 'May', 'June',
-                                 'July', 'August', 'September', 'October', 'November', 'December']) and
-                            re.search(r'20\d{2}', potential_date)):  # Contains a year like 2025
-                            entry_into_force_date = potential_date
-                            break
-                
-                if entry_into_force_date:
-                    break
-        
-        return {
-            'article_number': article_number,
-            'url': url,
-            'date_of_entry_into_force': entry_into_force_date,
-            'status': 'success' if entry_into_force_date else 'no_date_found'
-        }
-        
-    except requests.RequestException as e:
-        return {
-            'article_number': article_number,
-            'url': url,
-            'date_of_entry_into_force': None,
-            'status': f'error: {str(e)}'
-        }
-    except Exception as e:
-        return {
-            'article_number': article_number,
-            'url': url,
-            'date_of_entry_into_force': None,
-            'status': f'parsing_error: {str(e)}'
-        }
+    return scrape_multiple_articles([article_number], verbose=False)[0]
 
-def scrape_multiple_articles(article_numbers, delay=2):
+def scrape_multiple_articles(article_numbers, rate=DEFAULT_RATE, verbose=True):
     """
     Scrape dates from multiple articles.
     
+    Pages are fetched concurrently through the shared fetch layer, which
+    spaces requests to `rate` per second instead of sleeping after each one.
+    
     Args:
         article_numbers (list): List of article numbers to scrape
-        delay (float): Delay between requests in seconds
+        rate (float): Maximum requests per second to the site
+        verbose (bool): Print per-article progress
         
     Returns:
         list: List of dictionaries containing article data
     """
+    fetched = fetch_all([article_date_url(n) for n in article_numbers], rate=rate, burst=1)
     results = []
     
-    for i, article_num in enumerate(article_numbers):
-        print(f"Scraping article {article_num} ({i+1}/{len(article_numbers)})...")
-        
-        result = scrape_article_date(article_num)
+    for i, (article_num, fetch_result) in enumerate(zip(article_numbers, fetched)):
+        result = date_result(article_num, fetch_result)
         results.append(result)
         
+        if not verbose:
+            continue
+        
         # Print status and date
+        print(f"Scraped article {article_num} ({i+1}/{len(article_numbers)})")
         if result['status'] == 'success':
             print(f"✓ Successfully scraped article {article_num}")
-            if result['date_of_entry_into_force']:
-                print(f"  Date of entry into force: {result['date_of_entry_into_force']}")
+            print(f"  Date of entry into force: {result['date_of_entry_into_force']}")
         else:
             print(f"✗ Failed to scrape article {article_num}: {result['status']}")
-        
-        # Add delay to be respectful to the server
-        if i < len(article_numbers) - 1:
-            time.sleep(delay)
     
     return results
 
@@ -146,10 +106,10 @@ if __name__ == "__main__":
     all_articles = list(range(1, 114))
     
     print(f"Scraping dates from all {len(all_articles)} articles...")
-    print("This will take approximately 6-8 minutes with 2-second delays between requests.")
+    print(f"Requests are rate-limited to {DEFAULT_RATE:g}/s (about {len(all_articles) / DEFAULT_RATE / 60:.0f} minutes).")
     print("=" * 60)
     
-    results = scrape_multiple_articles(all_articles, delay=2)
+    results = scrape_multiple_articles(all_articles)
     
     # Save results
     save_to_json(results, 'eu_ai_act_dates_all_articles.json')
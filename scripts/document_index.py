@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Document Index
+Sorted id → metadata listing of the uploaded corpus, so listing documents is a
+sequential scan of a small file instead of a similarity query.
+
+Rows hold the light display/filter fields only (no content, summary or
+chunk_text) and are ordered by id in natural order (A2 before A10). Pages are
+addressed by cursor: the last id of the previous page, so a page stays correct
+when documents are added or removed between requests.
+
+Saved as JSON (default scripts/data/document_index.json, override with
+DOCUMENT_INDEX). A full upload rewrites it; an --ids/--changed/--only upload
+updates just those rows.
+
+Usage:
+    python scripts/document_index.py build [--from-snapshot [PATH]]
+    python scripts/document_index.py list [--cursor ID] [--limit N] [--fields label,type]
+    echo '{"cursor": "A10", "limit": 20}' | python scripts/document_index.py query
+"""
+
+import argparse
+import bisect
+import json
+import os
+import re
+import sys
+from typing import List, Dict, Any, Iterable, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DOCUMENT_INDEX_PATH = os.path.join(SCRIPT_DIR, 'data', 'document_index.json')
+DOCUMENT_INDEX_VERSION = 1
+LISTED_FIELDS = ('label', 'type', 'category', 'continent', 'country', 'sourceType', 'tags', 'url')
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 1000
+
+def default_document_index_path() -> str:
+    """Index location, overridable with DOCUMENT_INDEX."""
+    return os.getenv('DOCUMENT_INDEX', DEFAULT_DOCUMENT_INDEX_PATH)
+
+def sort_key(_id: str) -> tuple:
+    """Natural ordering key: digit runs compare as numbers."""
+    return tuple((0, int(part), '') if part.isdigit() else (1, 0, part) for part in re.findall(r'\d+|\D+', _id))
+
+class DocumentIndex:
+    """Id-sorted rows of listing metadata with cursor pagination and field projection."""
+
+    def __init__(self, rows: Dict[str, Dict[str, Any]]):
+        self.ids = sorted(rows, key=sort_key)
+        self.rows = rows
+        self._keys = [sort_key(_id) for _id in self.ids]
+
+    @staticmethod
+    def row(record: Dict[str, Any]) -> Dict[str, Any]:
+        """The listed fields of an upload record."""
+        return {field: record[field] for field in LISTED_FIELDS if record.get(field) is not None}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'DocumentIndex':
+        """Build from upload records."""
+        return cls({record['_id']: cls.row(record) for record in records})
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> 'DocumentIndex':
+        """Load a saved index."""
+        with open(path or default_document_index_path(), 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        if data.get('version') != DOCUMENT_INDEX_VERSION:
+            raise ValueError(f"Unsupported document index version {data.get('version')}")
+        return cls(dict(zip(data['ids'], data['rows'])))
+
+    def save(self, path: Optional[str] = None) -> str:
+        """Write the index atomically and return its path."""
+        path = path or default_document_index_path()
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({'version': DOCUMENT_INDEX_VERSION, 'ids': self.ids,
+                       'rows': [self.rows[_id] for _id in self.ids]}, file, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
+    def updated(self, records: Iterable[Dict[str, Any]]) -> 'DocumentIndex':
+        """A copy with these records' rows added or replaced."""
+        rows = dict(self.rows)
+        rows.update((record['_id'], self.row(record)) for record in records)
+        return DocumentIndex(rows)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def page(self, cursor: Optional[str] = None, limit: int = DEFAULT_LIMIT,
+             fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Up to `limit` documents after `cursor` (from the start when None), each
+        as {'id', ...fields}. `next_cursor` is None on the last page.
+        """
+        limit = max(1, min(limit, MAX_LIMIT))
+        start = bisect.bisect_right(self._keys, sort_key(cursor)) if cursor else 0
+        ids = self.ids[start:start + limit]
+        documents = []
+        for _id in ids:
+            row = self.rows[_id]
+            projected = row if fields is None else {field: row[field] for field in fields if field in row}
+            documents.append({'id': _id, **projected})
+
+        has_more = start + limit < len(self.ids)
+        return {'total': len(self.ids), 'documents': documents, 'next_cursor': ids[-1] if has_more else None}
+
+def save_upload(records: List[Dict[str, Any]], partial: bool, path: Optional[str] = None) -> DocumentIndex:
+    """Write the index after an upload: replace it after a full upload, update it after a partial one."""
+    path = path or default_document_index_path()
+    if partial and os.path.exists(path):
+        index = DocumentIndex.load(path).updated(records)
+    else:
+        index = DocumentIndex.from_records(records)
+    index.save(path)
+    return index
+
+def build_index(snapshot_path: Optional[str] = None) -> DocumentIndex:
+    """Build the index from a corpus snapshot, or from the registered sources."""
+    if snapshot_path:
+        from snapshot import CorpusSnapshot
+        with CorpusSnapshot(snapshot_path) as snapshot:
+            return DocumentIndex.from_records(snapshot)
+
+    from sources import discover_sources, iter_source_records
+    return DocumentIndex.from_records(record for spec in discover_sources() for record in iter_source_records(spec))
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Build or page through the document listing index.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="Build the index from the sources (or a snapshot)")
+    build.add_argument('--out', default=default_document_index_path())
+    build.add_argument('--from-snapshot', nargs='?', const='', metavar='PATH',
+                       help="Read records from a corpus snapshot instead of the sources")
+
+    listing = commands.add_parser('list', help="Print one page of documents")
+    listing.add_argument('--cursor', help="Last id of the previous page")
+    listing.add_argument('--limit', type=int, default=DEFAULT_LIMIT)
+    listing.add_argument('--fields', help="Comma-separated fields to include (default: all listed fields)")
+    listing.add_argument('--index', default=default_document_index_path())
+
+    query = commands.add_parser('query', help='Answer {"cursor", "limit", "fields"} read from stdin (used by the API)')
+    query.add_argument('--index', default=default_document_index_path())
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        snapshot_path = None
+        if args.from_snapshot is not None:
+            from snapshot import default_snapshot_path
+            snapshot_path = args.from_snapshot or default_snapshot_path()
+        index = build_index(snapshot_path)
+        index.save(args.out)
+        print(f"\n✅ Document index: {len(index)} documents → {args.out}")
+        return 0
+
+    if not os.path.exists(args.index):
+        print(json.dumps({'error': f"Document index not found at {args.index}; run: python scripts/document_index.py build"}))
+        return 1
+    index = DocumentIndex.load(args.index)
+
+    if args.command == 'list':
+        fields = args.fields.split(',') if args.fields else None
+        print(json.dumps(index.page(args.cursor, args.limit, fields), ensure_ascii=False, indent=2))
+        return 0
+
+    request = json.loads(sys.stdin.read() or '{}')
+    print(json.dumps(index.page(request.get('cursor'), int(request.get('limit') or DEFAULT_LIMIT),
+                                request.get('fields')), ensure_ascii=False))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
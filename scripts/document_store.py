@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Document Store
+Keeps the full text of every uploaded record in SQLite, so Pinecone metadata
+only carries what filtering, ranking and result display need.
+
+    documents(id TEXT PRIMARY KEY, content, summary, chunk_text)
+
+upload_all_data.py writes the store while it streams batches and uploads lean
+vector records (without `content` or `summary`, see lean_record). `chunk_text`
+stays in the vector record because the index embeds it. A full upload builds a fresh store and
+swaps it in once every batch is written; --ids/--changed/--only uploads update
+rows in place.
+
+Text is read back by id in one batched query (default scripts/data/documents.db,
+override with DOCUMENT_STORE).
+
+Usage:
+    python scripts/document_store.py build [--from-snapshot [PATH]]
+    python scripts/document_store.py get ID [ID ...]
+    echo '{"ids": ["A5", "R28"], "fields": ["content"]}' | python scripts/document_store.py query
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DOCUMENT_STORE_PATH = os.path.join(SCRIPT_DIR, 'data', 'documents.db')
+STORED_FIELDS = ('content', 'summary', 'chunk_text')
+METADATA_EXCLUDED_FIELDS = ('content', 'summary')  # Served from the store instead of vector metadata
+LOOKUP_CHUNK_SIZE = 500  # Ids per query, well under SQLite's bound-parameter limit
+
+def default_document_store_path() -> str:
+    """Store location, overridable with DOCUMENT_STORE."""
+    return os.getenv('DOCUMENT_STORE', DEFAULT_DOCUMENT_STORE_PATH)
+
+def lean_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    A vector record as uploaded to Pinecone: full text fields left to the store.
+
+    Apply it after passage expansion, which builds a long document's parent
+    chunk_text from its label and summary.
+    """
+    return {key: value for key, value in record.items() if key not in METADATA_EXCLUDED_FIELDS}
+
+class DocumentStore:
+    """SQLite table of document text keyed by _id, with batched lookups."""
+
+    def __init__(self, path: Optional[str] = None, fresh: bool = False):
+        self.path = path or default_document_store_path()
+        if fresh and os.path.exists(self.path):
+            os.remove(self.path)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute(f"CREATE TABLE IF NOT EXISTS documents (id TEXT PRIMARY KEY, {', '.join(f'{field} TEXT' for field in STORED_FIELDS)})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def put_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Insert or replace the text of these records in one transaction."""
+        placeholders = ', '.join('?' * (len(STORED_FIELDS) + 1))
+        with self.db:
+            self.db.executemany(f"INSERT OR REPLACE INTO documents VALUES ({placeholders})",
+                                ([record['_id']] + [record.get(field) for field in STORED_FIELDS] for record in records))
+
+    def get_many(self, ids: Iterable[str], fields: Iterable[str] = STORED_FIELDS) -> Dict[str, Dict[str, Any]]:
+        """Text of the ids that exist, as {id: {field: text}}."""
+        fields = [field for field in fields if field in STORED_FIELDS] or list(STORED_FIELDS)
+        ids = list(dict.fromkeys(ids))
+        found = {}
+        for start in range(0, len(ids), LOOKUP_CHUNK_SIZE):
+            chunk = ids[start:start + LOOKUP_CHUNK_SIZE]
+            rows = self.db.execute(f"SELECT id, {', '.join(fields)} FROM documents WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+            for row in rows:
+                found[row[0]] = {field: value for field, value in zip(fields, row[1:]) if value is not None}
+        return found
+
+    def store_batches(self, batches: Iterable[List[Dict[str, Any]]]) -> Iterator[List[Dict[str, Any]]]:
+        """Write each batch's text to the store and pass it on unchanged."""
+        for batch in batches:
+            self.put_many(batch)
+            yield batch
+
+    def close(self) -> None:
+        self.db.close()
+
+def open_for_upload(partial: bool, path: Optional[str] = None) -> DocumentStore:
+    """The store an upload writes to: the live one for partial uploads, a fresh copy otherwise."""
+    path = path or default_document_store_path()
+    return DocumentStore(path) if partial else DocumentStore(path + '.tmp', fresh=True)
+
+def finish_upload(store: DocumentStore, path: Optional[str] = None) -> None:
+    """Close an upload's store, swapping a freshly built one into place."""
+    path = path or default_document_store_path()
+    store.close()
+    if store.path != path:
+        os.replace(store.path, path)
+
+def build_store(path: str, snapshot_path: Optional[str] = None) -> int:
+    """Build the store from a corpus snapshot, or from the registered sources. Returns the row count."""
+    store = open_for_upload(partial=False, path=path)
+    if snapshot_path:
+        from snapshot import CorpusSnapshot
+        with CorpusSnapshot(snapshot_path) as snapshot:
+            store.put_many(snapshot)
+    else:
+        from sources import discover_sources, iter_batches, iter_source_records
+        for batch in iter_batches(record for spec in discover_sources() for record in iter_source_records(spec)):
+            store.put_many(batch)
+    count = len(store)
+    finish_upload(store, path)
+    return count
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Build or read the document text store.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="Build the store from the sources (or a snapshot)")
+    build.add_argument('--out', default=default_document_store_path())
+    build.add_argument('--from-snapshot', nargs='?', const='', metavar='PATH',
+                       help="Read records from a corpus snapshot instead of the sources")
+
+    get = commands.add_parser('get', help="Print stored text by _id as JSON")
+    get.add_argument('ids', nargs='+')
+    get.add_argument('--store', default=default_document_store_path())
+
+    query = commands.add_parser('query', help='Answer {"ids": [...], "fields": [...]} read from stdin (used by the API)')
+    query.add_argument('--store', default=default_document_store_path())
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        snapshot_path = None
+        if args.from_snapshot is not None:
+            from snapshot import default_snapshot_path
+            snapshot_path = args.from_snapshot or default_snapshot_path()
+        count = build_store(args.out, snapshot_path)
+        print(f"\n✅ Document store: {count} documents → {args.out} ({os.path.getsize(args.out) / 1024:.0f} KB)")
+        return 0
+
+    if not os.path.exists(args.store):
+        print(json.dumps({'error': f"Document store not found at {args.store}; run: python scripts/document_store.py build"}))
+        return 1
+
+    with DocumentStore(args.store) as store:
+        if args.command == 'get':
+            print(json.dumps(store.get_many(args.ids), ensure_ascii=False, indent=2))
+            return 0
+
+        request = json.loads(sys.stdin.read() or '{}')
+        print(json.dumps({'documents': store.get_many(request.get('ids') or [], request.get('fields') or STORED_FIELDS)},
+                         ensure_ascii=False))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
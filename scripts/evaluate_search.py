@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Search Evaluation
+Measures how much relevance the serving path gives up against exact search.
+
+The corpus vectors are exported from the backend and every query is embedded
+with the backend's own model, so a vectorised brute-force top-k over the same
+vector space is the ground truth. Each query in the query set is then sent
+through the normal search path and scored:
+
+    recall@k  share of the exact top-k that search returned
+    nDCG@k    rank-weighted agreement with the exact order (graded gain k - exact rank)
+
+Filters in the query set are applied to the ground truth as well, and
+passages score for their document (best passage wins, as in search), so the
+numbers isolate approximate search, reranking and top_k choices.
+
+Usage:
+    python scripts/evaluate_search.py [--backend local|pinecone] [--queries FILE]
+                                      [--k 5 10 20] [--rerank] [--vectors [DIR]]
+                                      [--concurrency N] [--report PATH]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from filter_engine import FilterEngine
+from search_backends import BACKENDS, get_backend
+from search_client import search_batch
+from test_pinecone_search import DEFAULT_QUERIES_PATH, load_queries, summarize
+
+DEFAULT_K = (10,)
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    """Unit-length rows, so dot products are cosine similarities."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+def exact_top_k(queries: np.ndarray, corpus: np.ndarray, k: int,
+                masks: Optional[np.ndarray] = None, groups: Optional[np.ndarray] = None) -> List[np.ndarray]:
+    """
+    Exact top-k corpus rows per query by cosine similarity, best first.
+
+    `masks` (queries × corpus, bool) excludes filtered-out rows; a query with
+    fewer than k eligible rows gets all of them. With `groups` (a group number
+    per row, e.g. the document of each passage) the top-k is over groups, each
+    scored by its best row.
+    """
+    scores = normalize(queries) @ normalize(corpus).T
+    if masks is not None:
+        scores = np.where(masks, scores, -np.inf)
+    if groups is not None:
+        grouped = np.full((len(scores), groups.max() + 1), -np.inf, dtype=scores.dtype)
+        np.maximum.at(grouped, (np.arange(len(scores))[:, None], groups[None, :]), scores)
+        scores = grouped
+
+    k = min(k, scores.shape[1])
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=1), axis=1, kind='stable')
+    ranked = np.take_along_axis(candidates, order, axis=1)
+    return [row[np.isfinite(scores[i, row])] for i, row in enumerate(ranked)]
+
+def recall_at_k(retrieved: List[str], truth: List[str]) -> float:
+    """Share of the exact top-k found in the retrieved list (1.0 when nothing is eligible)."""
+    if not truth:
+        return 1.0
+    return len(set(retrieved) & set(truth)) / len(truth)
+
+def ndcg_at_k(retrieved: List[str], truth: List[str]) -> float:
+    """nDCG with gain k - rank for the exact top-k (the best exact match is worth most)."""
+    if not truth:
+        return 1.0
+    gains = {_id: len(truth) - rank for rank, _id in enumerate(truth)}
+    discounts = 1 / np.log2(np.arange(2, len(truth) + 2))
+    dcg = sum(gains.get(_id, 0) * discounts[i] for i, _id in enumerate(retrieved[:len(truth)]))
+    ideal = float(np.dot(sorted(gains.values(), reverse=True), discounts))
+    return dcg / ideal
+
+def evaluate(backend, queries: List[Dict[str, Any]], ks=DEFAULT_K, rerank: bool = False,
+             vectors=None, concurrency: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Recall@k, nDCG@k and latency of `backend.search` against brute-force ground truth.
+
+    `vectors` (an exported VectorSnapshot) supplies the corpus instead of
+    paging it out of the backend. Each k's searches run as one concurrent
+    batch (search_client.search_batch); latency is the backend's own per-query timing.
+    """
+    start = time.perf_counter()
+    ids, corpus, fields = (vectors or backend).export_vectors()
+    exported = time.perf_counter()
+    query_vectors = backend.embed([query['query'] for query in queries])
+
+    masks = None
+    if any(query.get('filter') for query in queries):
+        engine = FilterEngine(fields)
+        masks = np.array([engine.mask(query.get('filter')) for query in queries])
+    # Passages count towards their document, as search collapses them
+    documents, groups = np.unique([f.get('parent_id') or _id for _id, f in zip(ids, fields)], return_inverse=True)
+    truth_start = time.perf_counter()
+    truths = exact_top_k(query_vectors, corpus, max(ks), masks, groups)
+    truth_time = time.perf_counter() - truth_start
+
+    results = {}
+    for k in ks:
+        per_query, latencies = [], []
+        started = time.perf_counter()
+        responses = search_batch(backend, [{'query': query['query'], 'filter': query.get('filter')} for query in queries],
+                                 concurrency, top_k=k, rerank=rerank)
+        batch_time = time.perf_counter() - started
+        for query, truth_rows, response in zip(queries, truths, responses):
+            if 'error' in response:
+                raise RuntimeError(f"Search failed for {query['query']!r}: {response['error']}")
+            truth = [str(documents[row]) for row in truth_rows[:k]]
+            latencies.append(sum(response['timings'].values()))
+            retrieved = [hit['_id'] for hit in response['hits']]
+            per_query.append({
+                'query': query['query'],
+                'recall': recall_at_k(retrieved, truth),
+                'ndcg': ndcg_at_k(retrieved, truth),
+                'missed': [_id for _id in truth if _id not in retrieved],
+            })
+
+        results[str(k)] = {
+            'recall': float(np.mean([q['recall'] for q in per_query])),
+            'ndcg': float(np.mean([q['ndcg'] for q in per_query])),
+            'latency_ms': summarize(latencies),
+            'batch_s': batch_time,
+            'worst': sorted(per_query, key=lambda q: (q['recall'], q['ndcg']))[:5],
+        }
+
+    return {
+        'backend': backend.name,
+        'rerank': rerank,
+        'queries': len(queries),
+        'corpus': {'vectors': len(ids), 'documents': len(documents), 'dimension': int(corpus.shape[1]) if corpus.size else 0,
+                   'export_s': exported - start},
+        # Heap memory of the searched vectors (local backend; Pinecone holds them server-side)
+        'resident_mb': backend.resident_bytes / 1e6 if hasattr(backend, 'resident_bytes') else None,
+        'ground_truth_ms': truth_time * 1000,
+        'k': results,
+    }
+
+def print_evaluation(report: Dict[str, Any]) -> None:
+    """Human-readable summary of an evaluation report."""
+    corpus = report['corpus']
+    print("\n" + "=" * 70)
+    print(f"🎯 SEARCH EVALUATION ({report['backend']}{', rerank' if report['rerank'] else ''})")
+    print("=" * 70)
+    print(f"\n{report['queries']} queries over {corpus['documents']} documents, {corpus['vectors']} vectors ({corpus['dimension']} dims); "
+          f"exact ground truth in {report['ground_truth_ms']:.1f}ms")
+    if report.get('resident_mb') is not None:
+        print(f"Vectors resident in memory: {report['resident_mb']:.2f} MB")
+
+    print(f"\n  {'k':>4}  {'recall':>7}  {'nDCG':>7}  {'p50 ms':>8}  {'p95 ms':>8}  {'batch s':>8}")
+    for k, result in report['k'].items():
+        latency = result['latency_ms']
+        print(f"  {k:>4}  {result['recall']:7.3f}  {result['ndcg']:7.3f}  {latency['p50']:8.2f}  {latency['p95']:8.2f}"
+              f"  {result['batch_s']:8.2f}")
+
+    for k, result in report['k'].items():
+        misses = [q for q in result['worst'] if q['recall'] < 1]
+        if misses:
+            print(f"\n⚠️  Lowest recall@{k}:")
+            for q in misses:
+                print(f"  • {q['recall']:.2f}  {q['query'][:60]}  (missed {', '.join(q['missed'][:5])})")
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Evaluate search recall@k and nDCG against exact brute force.")
+    parser.add_argument('--backend', choices=BACKENDS, default=os.getenv('SEARCH_BACKEND', 'pinecone'))
+    parser.add_argument('--queries', default=DEFAULT_QUERIES_PATH, help="Query file (text or JSON lines)")
+    parser.add_argument('--k', type=int, nargs='+', default=list(DEFAULT_K), help="Cut-offs to evaluate")
+    parser.add_argument('--rerank', action='store_true', help="Rerank search results (Pinecone only)")
+    parser.add_argument('--vectors', nargs='?', const='', metavar='DIR',
+                        help="Read corpus vectors from an export (export_vectors.py) instead of the backend")
+    parser.add_argument('--concurrency', type=int, help="Searches in flight (default $SEARCH_BATCH_CONCURRENCY or 8)")
+    parser.add_argument('--report', metavar='PATH', help="Also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    queries = load_queries(args.queries)
+    if not queries:
+        print(f"❌ No queries in {args.queries}")
+        return 1
+
+    vectors = None
+    if args.vectors is not None:
+        from export_vectors import VectorSnapshot
+        vectors = VectorSnapshot(args.vectors or None)
+
+    print(f"🔌 Preparing {args.backend} backend...")
+    report = evaluate(get_backend(args.backend), queries, sorted(set(args.k)), rerank=args.rerank, vectors=vectors,
+                      concurrency=args.concurrency)
+    print_evaluation(report)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"\n💾 Report saved to: {args.report}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
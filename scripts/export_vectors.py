@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Vector Export
+Pages every vector out of a search backend into a memory-mappable snapshot,
+so offline jobs (clustering, kNN edges, evaluation, dedup) read one local file
+instead of querying the index.
+
+Format (a directory, default scripts/data/vectors/, override with VECTOR_SNAPSHOT):
+    vectors.npy         float32[count, dimension], row i is ids[i]
+    ids.npy             unicode[count] vector ids (passages included)
+    columns/FIELD.npy   one metadata column per field:
+                          category  int32 codes into the manifest's values, -1 = missing
+                          number    float64, NaN = missing
+                          list      int32 codes, split per row by FIELD.offsets.npy (int64[count + 1])
+    manifest.json       {"version", "backend", "count", "dimension", "exported_at", "columns"}
+
+Full text fields (content, summary, chunk_text) are left to the document store.
+Readers open the arrays with np.load(mmap_mode='r'), so processes reading the
+same snapshot share its pages; a re-export replaces each file atomically and
+writes the manifest last.
+
+Usage:
+    python scripts/export_vectors.py export [--backend local|pinecone] [--out DIR]
+    python scripts/export_vectors.py info [--snapshot DIR]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_VECTOR_SNAPSHOT_PATH = os.path.join(SCRIPT_DIR, 'data', 'vectors')
+VECTOR_SNAPSHOT_VERSION = 1
+TEXT_FIELDS = ('content', 'summary', 'chunk_text')  # Served by the document store, not exported
+
+def default_vector_snapshot_path() -> str:
+    """Snapshot directory, overridable with VECTOR_SNAPSHOT."""
+    return os.getenv('VECTOR_SNAPSHOT', DEFAULT_VECTOR_SNAPSHOT_PATH)
+
+def encode_columns(fields: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Metadata fields as column arrays: {field: {'kind', 'values', 'arrays': {suffix: array}}}.
+
+    Numbers (and booleans) become float columns, lists become code lists with
+    row offsets, anything else is a category column of its string value.
+    """
+    names = sorted({key for row in fields for key in row if key not in TEXT_FIELDS})
+    columns = {}
+    for name in names:
+        present = [row[name] for row in fields if row.get(name) is not None]
+        if any(isinstance(value, list) for value in present):
+            items = [row.get(name) or [] for row in fields]
+            items = [item if isinstance(item, list) else [item] for item in items]
+            values = sorted({str(value) for item in items for value in item})
+            lookup = {value: code for code, value in enumerate(values)}
+            offsets = np.zeros(len(items) + 1, dtype=np.int64)
+            np.cumsum([len(item) for item in items], out=offsets[1:])
+            codes = np.array([lookup[str(value)] for item in items for value in item], dtype=np.int32)
+            columns[name] = {'kind': 'list', 'values': values, 'arrays': {'': codes, '.offsets': offsets}}
+        elif all(isinstance(value, (int, float)) for value in present):
+            numbers = np.array([float(row[name]) if row.get(name) is not None else np.nan for row in fields], dtype=np.float64)
+            columns[name] = {'kind': 'number', 'values': None, 'arrays': {'': numbers}}
+        else:
+            values = sorted({str(value) for value in present})
+            lookup = {value: code for code, value in enumerate(values)}
+            codes = np.array([lookup[str(row[name])] if row.get(name) is not None else -1 for row in fields], dtype=np.int32)
+            columns[name] = {'kind': 'category', 'values': values, 'arrays': {'': codes}}
+    return columns
+
+def write_vector_snapshot(ids: List[str], vectors: np.ndarray, fields: List[Dict[str, Any]],
+                          path: str, backend: str = '') -> Dict[str, Any]:
+    """Write vectors, ids and metadata columns to a snapshot directory. Returns the manifest."""
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    if vectors.ndim != 2:
+        # reshape(0, -1) is ambiguous, so an empty export without a width gets width 0
+        vectors = vectors.reshape(len(ids), -1 if len(ids) else 0)
+    columns = encode_columns(fields)
+    os.makedirs(os.path.join(path, 'columns'), exist_ok=True)
+
+    arrays = {'vectors.npy': vectors, 'ids.npy': np.array(ids, dtype=str)}
+    for name, column in columns.items():
+        for suffix, array in column['arrays'].items():
+            arrays[os.path.join('columns', f"{name}{suffix}.npy")] = array
+
+    # Write everything first, then swap in; open memory maps keep the old files
+    for relative, array in arrays.items():
+        np.save(os.path.join(path, relative + '.tmp.npy'), array)
+    for relative in arrays:
+        os.replace(os.path.join(path, relative + '.tmp.npy'), os.path.join(path, relative))
+
+    manifest = {
+        'version': VECTOR_SNAPSHOT_VERSION,
+        'backend': backend,
+        'count': len(ids),
+        'dimension': int(vectors.shape[1]),
+        'exported_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'columns': {name: {'kind': column['kind'], 'values': column['values']} for name, column in columns.items()},
+    }
+    tmp_path = os.path.join(path, 'manifest.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False)
+    os.replace(tmp_path, os.path.join(path, 'manifest.json'))
+    return manifest
+
+class VectorSnapshot:
+    """Read-only view of an exported vector snapshot; arrays are memory-mapped."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_vector_snapshot_path()
+        with open(os.path.join(self.path, 'manifest.json'), encoding='utf-8') as file:
+            self.manifest = json.load(file)
+        if self.manifest.get('version') != VECTOR_SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported vector snapshot version {self.manifest.get('version')} in {self.path}")
+        self.vectors = np.load(os.path.join(self.path, 'vectors.npy'), mmap_mode='r')
+        self.ids = np.load(os.path.join(self.path, 'ids.npy'), mmap_mode='r')
+        self._positions = None
+
+    def __len__(self) -> int:
+        return self.manifest['count']
+
+    @property
+    def dimension(self) -> int:
+        return self.manifest['dimension']
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.manifest['columns'])
+
+    def position(self, _id: str) -> int:
+        """Row of a vector id (KeyError if absent)."""
+        if self._positions is None:
+            self._positions = {_id: row for row, _id in enumerate(self.ids.tolist())}
+        return self._positions[_id]
+
+    def codes(self, field: str) -> np.ndarray:
+        """The raw column array (codes for category/list columns), memory-mapped."""
+        return np.load(os.path.join(self.path, 'columns', f"{field}.npy"), mmap_mode='r')
+
+    def column(self, field: str) -> List[Any]:
+        """A metadata column decoded to one value per row (None where missing)."""
+        spec = self.manifest['columns'][field]
+        codes = self.codes(field)
+        if spec['kind'] == 'number':
+            return [None if np.isnan(value) else value for value in codes.tolist()]
+        values = spec['values']
+        if spec['kind'] == 'list':
+            offsets = np.load(os.path.join(self.path, 'columns', f"{field}.offsets.npy"), mmap_mode='r').tolist()
+            codes = codes.tolist()
+            return [[values[code] for code in codes[offsets[row]:offsets[row + 1]]] for row in range(len(self))]
+        return [values[code] if code >= 0 else None for code in codes.tolist()]
+
+    def export_vectors(self):
+        """The snapshot as (ids, vectors, fields), the same shape as backend.export_vectors()."""
+        fields = [{} for _ in range(len(self))]
+        for name in self.columns:
+            for row, value in enumerate(self.column(name)):
+                if value is not None and value != []:
+                    fields[row][name] = value
+        return self.ids.tolist(), self.vectors, fields
+
+def export(backend_name: Optional[str], path: str) -> Dict[str, Any]:
+    """Export every vector of a backend to a snapshot directory. Returns the manifest."""
+    from search_backends import get_backend
+    backend = get_backend(backend_name)
+    ids, vectors, fields = backend.export_vectors()
+    return write_vector_snapshot(ids, vectors, fields, path, backend=backend.name)
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    from search_backends import BACKENDS
+
+    parser = argparse.ArgumentParser(description="Export index vectors to a memory-mappable snapshot.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export_command = commands.add_parser('export', help="Page every vector out of a backend into a snapshot")
+    export_command.add_argument('--backend', choices=BACKENDS, default=os.getenv('SEARCH_BACKEND', 'pinecone'))
+    export_command.add_argument('--out', default=default_vector_snapshot_path())
+
+    info = commands.add_parser('info', help="Describe an exported snapshot")
+    info.add_argument('--snapshot', default=default_vector_snapshot_path())
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        print(f"📤 Exporting vectors from the {args.backend} backend...")
+        start = time.perf_counter()
+        manifest = export(args.backend, args.out)
+        size = os.path.getsize(os.path.join(args.out, 'vectors.npy'))
+        print(f"\n✅ Exported {manifest['count']} vectors ({manifest['dimension']} dims, {size / 1024:.0f} KB) "
+              f"and {len(manifest['columns'])} metadata columns to {args.out} in {time.perf_counter() - start:.1f}s")
+        return 0
+
+    if not os.path.exists(os.path.join(args.snapshot, 'manifest.json')):
+        print(f"❌ No vector snapshot at {args.snapshot}; run: python scripts/export_vectors.py export")
+        return 1
+    snapshot = VectorSnapshot(args.snapshot)
+    manifest = snapshot.manifest
+    print(f"📦 {args.snapshot}: {manifest['count']} vectors × {manifest['dimension']} dims "
+          f"from {manifest['backend'] or 'unknown'} at {manifest['exported_at']}")
+    for name, spec in manifest['columns'].items():
+        detail = f"{len(spec['values'])} values" if spec['values'] is not None else ''
+        print(f"  • {name:<14} {spec['kind']:<9} {detail}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
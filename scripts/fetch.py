@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Shared Fetch Layer
+One asyncio HTTP engine used by every scraper.
+
+- Connection pooling through a single httpx.AsyncClient
+- A token bucket per host, so requests go out at the allowed rate instead of
+  sleeping a fixed delay after each one
+- A global concurrency cap plus a per-host cap
+- Retries with backoff on 429/5xx, honouring Retry-After
+- A per-run memo: each URL is fetched at most once per fetcher, and
+  concurrent requests for the same URL share one in-flight request
+- A persistent on-disk cache (http_cache.py) with ETag / Last-Modified
+  revalidation, so repeat scrapes mostly cost a 304 or nothing at all
+
+Scrapers that are written synchronously call fetch_all(), which runs the
+event loop for them.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from http_cache import HttpCache, default_cache
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+DEFAULT_RATE = 2.0          # Requests per second per host
+DEFAULT_BURST = 2           # Requests allowed back-to-back before the rate applies
+DEFAULT_CONCURRENCY = 8     # Requests in flight across all hosts
+DEFAULT_HOST_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 30.0
+MAX_RETRIES = 3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+@dataclass
+class FetchResult:
+    """Outcome of one fetch. `error` is set instead of raising."""
+    url: str
+    status: int = 0
+    content: bytes = b''
+    headers: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status < 300
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+def normalize_url(url: str) -> str:
+    """Memo key for a URL: lower-case scheme/host, no fragment, no trailing slash."""
+    parts = urlsplit(url)
+    path = parts.path.rstrip('/') or '/'
+    query = f"?{parts.query}" if parts.query else ''
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}{query}"
+
+class TokenBucket:
+    """Async token bucket: at most `rate` acquisitions per second after an initial burst."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Holding the lock while waiting keeps callers in FIFO order
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class AsyncFetcher:
+    """Rate-limited, pooled HTTP fetcher. Use as `async with AsyncFetcher() as fetcher:`."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 concurrency: int = DEFAULT_CONCURRENCY, host_concurrency: int = DEFAULT_HOST_CONCURRENCY,
+                 timeout: float = DEFAULT_TIMEOUT, headers: Optional[Dict[str, str]] = None,
+                 cache: Optional[HttpCache] = None, use_cache: bool = True, memoize: bool = True):
+        self.rate = rate
+        self.burst = burst
+        self.host_concurrency = host_concurrency
+        self.timeout = timeout
+        self.headers = {'User-Agent': USER_AGENT, **(headers or {})}
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._memo: Dict[str, asyncio.Task] = {}
+        self.memoize = memoize  # Off for streaming callers that must not keep every body alive
+        self.cache = (cache or default_cache()) if use_cache else None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async def __aenter__(self):
+        self._client = httpx.AsyncClient(headers=self.headers, timeout=self.timeout,
+                                         limits=self._limits, follow_redirects=True)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._client.aclose()
+        if self.cache:
+            self.cache.evict()
+
+    def _host_limits(self, url: str):
+        """Token bucket and semaphore for the URL's host, created on first use."""
+        host = urlsplit(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.burst)
+            self._host_semaphores[host] = asyncio.Semaphore(self.host_concurrency)
+        return self._buckets[host], self._host_semaphores[host]
+
+    async def _request(self, url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """One rate-limited GET."""
+        bucket, host_semaphore = self._host_limits(url)
+        async with self._semaphore, host_semaphore:
+            await bucket.acquire()
+            return await self._client.get(url, headers=headers)
+
+    async def fetch(self, url: str) -> FetchResult:
+        """GET a URL once per run; repeat and concurrent callers share the same result."""
+        if not self.memoize:
+            return await self._fetch_uncached(url)
+        key = normalize_url(url)
+        if key not in self._memo:
+            self._memo[key] = asyncio.ensure_future(self._fetch_uncached(url))
+        return await asyncio.shield(self._memo[key])
+
+    async def _fetch_uncached(self, url: str) -> FetchResult:
+        """Serve from the disk cache when fresh, otherwise fetch (conditionally if we hold validators)."""
+        cached = self.cache.get(url) if self.cache else None
+        if cached and self.cache.is_fresh(cached[0]):
+            return _cached_result(url, *cached)
+        if self.cache and self.cache.offline:
+            return FetchResult(url=url, error="Not in offline cache")
+
+        headers = self.cache.conditional_headers(cached[0]) if cached else None
+        result = await self._fetch_network(url, headers)
+
+        if cached and result.status == 304:
+            self.cache.refresh(url, cached[0])
+            return _cached_result(url, *cached)
+        if self.cache and result.ok:
+            self.cache.put(url, result.status, result.headers, result.content)
+        return result
+
+    async def _fetch_network(self, url: str, headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        """GET a URL, retrying throttled or failed responses with backoff."""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = await self._request(url, headers)
+            except httpx.HTTPError as e:
+                error = f"{type(e).__name__}: {e}"
+                if attempt == MAX_RETRIES:
+                    return FetchResult(url=url, error=error)
+                await asyncio.sleep(2 ** attempt)
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+                retry_after = response.headers.get('Retry-After', '')
+                await asyncio.sleep(float(retry_after) if retry_after.isdigit() else 2 ** attempt)
+                continue
+
+            error = None if response.is_success or response.status_code == 304 else f"HTTP {response.status_code}"
+            return FetchResult(url=url, status=response.status_code, content=response.content,
+                               headers=dict(response.headers), error=error)
+
+    async def fetch_many(self, urls: List[str]) -> List[FetchResult]:
+        """Fetch URLs concurrently within the rate limits; results keep the input order (duplicates fetched once)."""
+        return await asyncio.gather(*(self.fetch(url) for url in urls))
+
+def _cached_result(url: str, meta: Dict, body: bytes) -> FetchResult:
+    """FetchResult for a response served from the disk cache."""
+    return FetchResult(url=url, status=meta['status'], content=body, headers=meta.get('headers', {}))
+
+def fetch_all(urls: List[str], **fetcher_options) -> List[FetchResult]:
+    """Synchronous entry point: fetch every URL through one AsyncFetcher."""
+    async def run():
+        async with AsyncFetcher(**fetcher_options) as fetcher:
+            return await fetcher.fetch_many(urls)
+    return asyncio.run(run())
+
+def fetch_one(url: str, **fetcher_options) -> FetchResult:
+    """Synchronous single fetch."""
+    return fetch_all([url], **fetcher_options)[0]
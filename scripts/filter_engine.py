@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Filter Engine
+Evaluates Pinecone metadata filters (as built by lib/utils/pinecone-filters.ts)
+locally over the corpus with bitmap indexes, and counts facets in the same pass.
+
+Every (field, value) pair gets a packed bitmap (one bit per record, np.packbits);
+list fields such as tags set the bit for each element. A filter tree becomes
+bitwise AND / OR / NOT over those bitmaps, and facet counts are popcounts of
+each value bitmap ANDed with the result. Numeric comparisons ($gt, $gte, $lt,
+$lte) scan a flat (row, value) column instead.
+
+A list field matches if any element does, and $ne / $nin match records that
+lack the field.
+
+Usage:
+    echo '{"filter": {"country": {"$in": ["Canada"]}}}' | python scripts/filter_engine.py query
+    python scripts/filter_engine.py facets
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Dict, Any, Iterable, Optional
+
+import numpy as np
+
+FACET_FIELDS = ('continent', 'country', 'sourceType', 'category', 'type', 'tags')
+COMPARISONS = {'$gt': np.greater, '$gte': np.greater_equal, '$lt': np.less, '$lte': np.less_equal}
+
+class FilterEngine:
+    """Bitmap indexes over record metadata: filter evaluation plus facet counts."""
+
+    def __init__(self, records: Iterable[Dict[str, Any]]):
+        self.records = list(records)
+        self.ids = [record.get('_id') for record in self.records]
+        self.size = len(self.records)
+        self.all = np.packbits(np.ones(self.size, dtype=bool))
+        self.none = np.packbits(np.zeros(self.size, dtype=bool))
+        self._fields: Dict[str, Dict[Any, np.ndarray]] = {}
+        self._numbers: Dict[str, tuple] = {}
+        self._facets: Dict[str, tuple] = {}
+
+    def _field(self, field: str) -> Dict[Any, np.ndarray]:
+        """Value → bitmap for one field, built on first use."""
+        if field not in self._fields:
+            rows: Dict[Any, List[int]] = {}
+            for row, record in enumerate(self.records):
+                value = record.get(field)
+                for item in (value if isinstance(value, list) else [value]):
+                    if item is not None and not isinstance(item, (dict, list)):
+                        rows.setdefault(item, []).append(row)
+
+            bitmaps = {}
+            for value, members in rows.items():
+                mask = np.zeros(self.size, dtype=bool)
+                mask[members] = True
+                bitmaps[value] = np.packbits(mask)
+            self._fields[field] = bitmaps
+        return self._fields[field]
+
+    def _numeric(self, field: str) -> tuple:
+        """Flat (rows, values) of the numeric entries of a field."""
+        if field not in self._numbers:
+            pairs = [(row, item) for row, record in enumerate(self.records)
+                     for item in (record.get(field) if isinstance(record.get(field), list) else [record.get(field)])
+                     if isinstance(item, (int, float)) and not isinstance(item, bool)]
+            rows = np.array([row for row, _ in pairs], dtype=np.int64)
+            self._numbers[field] = (rows, np.array([value for _, value in pairs], dtype=np.float64))
+        return self._numbers[field]
+
+    def _any_of(self, field: str, values: Iterable[Any]) -> np.ndarray:
+        bitmaps = self._field(field)
+        result = self.none.copy()
+        for value in values:
+            if value in bitmaps:
+                result |= bitmaps[value]
+        return result
+
+    def _compare(self, field: str, op: str, operand: float) -> np.ndarray:
+        rows, values = self._numeric(field)
+        mask = np.zeros(self.size, dtype=bool)
+        mask[rows[COMPARISONS[op](values, operand)]] = True
+        return np.packbits(mask)
+
+    def _match_field(self, field: str, operators: Dict[str, Any]) -> np.ndarray:
+        result = self.all.copy()
+        for op, operand in operators.items():
+            if op == '$eq':
+                result &= self._any_of(field, [operand])
+            elif op == '$ne':
+                result &= self.all & ~self._any_of(field, [operand])
+            elif op == '$in':
+                result &= self._any_of(field, operand)
+            elif op == '$nin':
+                result &= self.all & ~self._any_of(field, operand)
+            elif op in COMPARISONS:
+                result &= self._compare(field, op, operand)
+            else:
+                raise ValueError(f"Unsupported filter operator {op}")
+        return result
+
+    def bitmap(self, condition: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Packed bitmap of records passing a filter (all records when the filter is empty)."""
+        result = self.all.copy()
+        for key, expected in (condition or {}).items():
+            if key == '$and':
+                for part in expected:
+                    result &= self.bitmap(part)
+            elif key == '$or':
+                either = self.none.copy()
+                for part in expected:
+                    either |= self.bitmap(part)
+                result &= either
+            else:
+                result &= self._match_field(key, expected if isinstance(expected, dict) else {'$eq': expected})
+        return result
+
+    def mask(self, condition: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Boolean mask (one entry per record) of records passing a filter."""
+        return np.unpackbits(self.bitmap(condition), count=self.size).astype(bool)
+
+    def rows(self, condition: Optional[Dict[str, Any]]) -> np.ndarray:
+        """Row numbers of records passing a filter."""
+        return np.flatnonzero(np.unpackbits(self.bitmap(condition), count=self.size))
+
+    def facet_counts(self, bitmap: np.ndarray, fields: Iterable[str] = FACET_FIELDS) -> Dict[str, Dict[str, int]]:
+        """Per-value record counts within a bitmap, largest first."""
+        counts = {}
+        for field in fields:
+            if field not in self._facets:
+                bitmaps = self._field(field)
+                matrix = np.stack(list(bitmaps.values())) if bitmaps else np.empty((0, len(self.all)), dtype=np.uint8)
+                self._facets[field] = (list(bitmaps), matrix)
+            values, matrix = self._facets[field]
+            totals = np.bitwise_count(matrix & bitmap).sum(axis=1)
+            counts[field] = {str(value): int(total) for value, total in
+                             sorted(zip(values, totals.tolist()), key=lambda item: -item[1]) if total}
+        return counts
+
+    def query(self, condition: Optional[Dict[str, Any]] = None,
+              facets: Iterable[str] = FACET_FIELDS) -> Dict[str, Any]:
+        """Matching ids and facet counts over the matches, in one call."""
+        bitmap = self.bitmap(condition)
+        rows = np.flatnonzero(np.unpackbits(bitmap, count=self.size))
+        return {
+            'count': len(rows),
+            'ids': [self.ids[row] for row in rows.tolist()],
+            'facets': self.facet_counts(bitmap, facets),
+        }
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Evaluate metadata filters and facet counts over the corpus.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('query', help='Answer {"filter": ..., "facets": [...]} read from stdin (used by the API)')
+    facets = commands.add_parser('facets', help="Print facet counts for the whole corpus")
+    facets.add_argument('fields', nargs='*', default=list(FACET_FIELDS))
+    args = parser.parse_args(argv)
+
+    from search_backends import load_corpus
+    engine = FilterEngine(load_corpus())
+
+    if args.command == 'facets':
+        print(json.dumps(engine.facet_counts(engine.all, args.fields), indent=2))
+        return 0
+
+    request = json.loads(sys.stdin.read() or '{}')
+    try:
+        result = engine.query(request.get('filter'), request.get('facets') or FACET_FIELDS)
+    except ValueError as e:
+        result = {'error': str(e)}
+    print(json.dumps(result))
+    return 1 if 'error' in result else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Graph Index
+Bidirectional adjacency of document cross-references (connected_to), built at
+ingest time so graph expansion never needs per-node metadata lookups.
+
+Records only list their links in the article → recital direction; the index
+stores every link both ways in CSR form:
+
+    ids      document ids, sorted (row i is ids[i])
+    indptr   int32[n + 1], row i's neighbours are indices[indptr[i]:indptr[i + 1]]
+    indices  int32, neighbour rows, sorted within each row
+    declared bool, parallel to indices: the row's own record lists that link
+
+Saved as one .npz file (default scripts/data/graph_index.npz, override with
+GRAPH_INDEX). Links to ids that are not in the corpus are dropped. A full
+upload rebuilds it; an --ids/--changed/--only upload replaces the links its
+documents declare and keeps the links other documents declare to them.
+
+Usage:
+    python scripts/graph_index.py build [--out PATH] [--from-snapshot [PATH]]
+    python scripts/graph_index.py neighbors ID [--k N]
+    echo '{"op": "subgraph", "ids": ["A5", "R28"]}' | python scripts/graph_index.py query
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_GRAPH_INDEX_PATH = os.path.join(SCRIPT_DIR, 'data', 'graph_index.npz')
+
+def default_graph_index_path() -> str:
+    """Index location, overridable with GRAPH_INDEX."""
+    return os.getenv('GRAPH_INDEX', DEFAULT_GRAPH_INDEX_PATH)
+
+class GraphIndex:
+    """CSR adjacency over document ids with neighbour, k-hop and induced-subgraph queries."""
+
+    def __init__(self, ids: List[str], indptr: np.ndarray, indices: np.ndarray,
+                 declared: Optional[np.ndarray] = None):
+        self.ids = ids
+        self.indptr = indptr
+        self.indices = indices
+        self.declared = declared  # None for indexes saved before link direction was kept
+        self._positions = {_id: i for i, _id in enumerate(ids)}
+
+    @classmethod
+    def from_links(cls, links: Iterable[Tuple[str, Iterable[str]]]) -> 'GraphIndex':
+        """Build from (id, connected_to) pairs; every link is stored in both directions."""
+        links = [(str(_id), list(targets or [])) for _id, targets in links]
+        ids = sorted({_id for _id, _ in links})
+        positions = {_id: i for i, _id in enumerate(ids)}
+
+        pairs = [(positions[_id], positions[target]) for _id, targets in links
+                 for target in targets if target in positions and target != _id]
+        edges = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+        both = np.concatenate([edges, edges[:, ::-1]])
+
+        # One int64 key per directed edge: sorting and de-duplicating it orders rows and columns
+        keys, inverse = np.unique(both[:, 0] * len(ids) + both[:, 1], return_inverse=True)
+        declared = np.zeros(len(keys), dtype=bool)
+        declared[inverse[:len(edges)]] = True  # The first half holds the links as records list them
+        rows, cols = np.divmod(keys, max(len(ids), 1))
+        indptr = np.zeros(len(ids) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(rows, minlength=len(ids)), out=indptr[1:])
+        return cls(ids, indptr, cols.astype(np.int32), declared)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'GraphIndex':
+        """Build from upload records (_id, connected_to)."""
+        return cls.from_links((record['_id'], record.get('connected_to')) for record in records)
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> 'GraphIndex':
+        """Load a saved index."""
+        with np.load(path or default_graph_index_path()) as data:
+            declared = data['declared'] if 'declared' in data.files else None
+            return cls(data['ids'].tolist(), data['indptr'], data['indices'], declared)
+
+    def save(self, path: Optional[str] = None) -> str:
+        """Write the index atomically and return its path."""
+        path = path or default_graph_index_path()
+        tmp_path = path + '.tmp.npz'
+        arrays = {'ids': np.array(self.ids), 'indptr': self.indptr, 'indices': self.indices}
+        if self.declared is not None:
+            arrays['declared'] = self.declared
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+        return path
+
+    def declared_links(self) -> Iterator[Tuple[str, List[str]]]:
+        """(id, connected_to) for every document, as its record listed the links."""
+        if self.declared is None:
+            raise ValueError("Graph index has no link directions; rebuild it: python scripts/graph_index.py build")
+        for row, _id in enumerate(self.ids):
+            start, end = self.indptr[row], self.indptr[row + 1]
+            yield _id, [self.ids[col] for col in self.indices[start:end][self.declared[start:end]]]
+
+    def updated(self, records: Iterable[Dict[str, Any]]) -> 'GraphIndex':
+        """
+        A copy with these records' own links replaced. Links that other
+        documents declare to them are kept.
+        """
+        links = dict(self.declared_links())
+        links.update((record['_id'], list(record.get('connected_to') or [])) for record in records)
+        return GraphIndex.from_links(links.items())
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, _id: str) -> bool:
+        return _id in self._positions
+
+    @property
+    def edge_count(self) -> int:
+        """Undirected links."""
+        return len(self.indices) // 2
+
+    def _rows(self, ids: Iterable[str]) -> np.ndarray:
+        return np.array([self._positions[_id] for _id in ids if _id in self._positions], dtype=np.int32)
+
+    def _expand(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """All (row, neighbour) pairs for the given rows, gathered in one vectorised pass."""
+        starts = self.indptr[rows]
+        counts = self.indptr[rows + 1] - starts
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.repeat(rows, counts), self.indices[np.repeat(starts, counts) + offsets]
+
+    def neighbors(self, _id: str) -> List[str]:
+        """Documents linked to `_id` in either direction ([] if unknown)."""
+        row = self._positions.get(_id)
+        if row is None:
+            return []
+        return [self.ids[i] for i in self.indices[self.indptr[row]:self.indptr[row + 1]]]
+
+    def k_hop(self, ids: Iterable[str], k: int = 1) -> Dict[str, int]:
+        """Every document within k links of the seeds, mapped to its hop distance (seeds are 0)."""
+        hops = np.full(len(self.ids), -1, dtype=np.int32)
+        frontier = self._rows(ids)
+        hops[frontier] = 0
+
+        for depth in range(1, k + 1):
+            if not len(frontier):
+                break
+            _, reached = self._expand(frontier)
+            frontier = np.unique(reached[hops[reached] < 0])
+            hops[frontier] = depth
+
+        found = np.flatnonzero(hops >= 0)
+        return {self.ids[row]: int(hops[row]) for row in found}
+
+    def induced_subgraph(self, ids: Iterable[str]) -> List[Tuple[str, str]]:
+        """Links among the given documents, each once as (source, target) in id order."""
+        rows = np.unique(self._rows(ids))
+        inside = np.zeros(len(self.ids), dtype=bool)
+        inside[rows] = True
+
+        sources, targets = self._expand(rows)
+        keep = inside[targets] & (targets > sources)
+        return [(self.ids[source], self.ids[target]) for source, target in zip(sources[keep].tolist(), targets[keep].tolist())]
+
+def run_query(index: GraphIndex, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Answer one JSON query: {"op": "neighbors" | "khop" | "subgraph", "ids": [...], "k": N}."""
+    op = request.get('op')
+    ids = request.get('ids') or []
+
+    if op == 'neighbors':
+        return {'neighbors': {_id: index.neighbors(_id) for _id in ids}}
+    if op == 'khop':
+        hops = index.k_hop(ids, int(request.get('k', 1)))
+        return {'nodes': hops, 'edges': [list(edge) for edge in index.induced_subgraph(hops)]}
+    if op == 'subgraph':
+        return {'edges': [list(edge) for edge in index.induced_subgraph(ids)]}
+    return {'error': f"Unknown op '{op}' (expected neighbors, khop or subgraph)"}
+
+def save_upload(records: List[Dict[str, Any]], partial: bool, path: Optional[str] = None) -> GraphIndex:
+    """Write the index after an upload: rebuild it after a full upload, update the uploaded documents after a partial one."""
+    path = path or default_graph_index_path()
+    if partial and os.path.exists(path):
+        index = GraphIndex.load(path).updated(records)
+    else:
+        index = GraphIndex.from_records(records)
+    index.save(path)
+    return index
+
+def build_index(snapshot_path: Optional[str] = None) -> GraphIndex:
+    """Build the index from a corpus snapshot, or from the registered sources."""
+    if snapshot_path:
+        from snapshot import CorpusSnapshot
+        with CorpusSnapshot(snapshot_path) as snapshot:
+            return GraphIndex.from_records(snapshot)
+
+    from sources import discover_sources, iter_source_records
+    return GraphIndex.from_records(record for spec in discover_sources() for record in iter_source_records(spec))
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Build or query the document graph index.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="Build the index from the sources (or a snapshot)")
+    build.add_argument('--out', default=default_graph_index_path())
+    build.add_argument('--from-snapshot', nargs='?', const='', metavar='PATH',
+                       help="Read records from a corpus snapshot instead of the sources")
+
+    neighbors = commands.add_parser('neighbors', help="Print the k-hop neighbourhood of ids")
+    neighbors.add_argument('ids', nargs='+')
+    neighbors.add_argument('--k', type=int, default=1)
+    neighbors.add_argument('--index', default=default_graph_index_path())
+
+    query = commands.add_parser('query', help="Answer a JSON query read from stdin (used by the API)")
+    query.add_argument('--index', default=default_graph_index_path())
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        snapshot_path = None
+        if args.from_snapshot is not None:
+            from snapshot import default_snapshot_path
+            snapshot_path = args.from_snapshot or default_snapshot_path()
+        index = build_index(snapshot_path)
+        index.save(args.out)
+        print(f"\n✅ Graph index: {len(index)} documents, {index.edge_count} links → {args.out}")
+        return 0
+
+    if not os.path.exists(args.index):
+        print(json.dumps({'error': f"Graph index not found at {args.index}; run: python scripts/graph_index.py build"}))
+        return 1
+    index = GraphIndex.load(args.index)
+
+    if args.command == 'neighbors':
+        print(json.dumps(index.k_hop(args.ids, args.k), indent=2))
+        return 0
+
+    result = run_query(index, json.loads(sys.stdin.read() or '{}'))
+    print(json.dumps(result))
+    return 1 if 'error' in result else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+On-disk HTTP Cache
+Persistent response cache shared by all scrapers through fetch.py.
+
+Each URL is stored as two files named by the URL's SHA-256:
+    <hash>.json   url, status, headers, ETag / Last-Modified, stored_at
+    <hash>.body   raw response bytes
+
+Within the TTL a cached response is served without touching the network.
+After it expires the fetcher revalidates with If-None-Match /
+If-Modified-Since, and a 304 refreshes the entry without downloading the body.
+When the cache grows past its size limit, the least recently used entries are
+evicted.
+
+Offline mode serves every cached response regardless of age and never
+fetches, so a populated cache directory doubles as a recorded fixture set.
+
+Environment:
+    HTTP_CACHE=off            Disable caching
+    HTTP_CACHE_DIR=PATH       Cache directory (default: scripts/.http_cache)
+    HTTP_CACHE_TTL=SECONDS    Freshness lifetime (default: 1 day)
+    HTTP_CACHE_MAX_MB=N       Size bound before eviction (default: 200)
+    HTTP_CACHE_OFFLINE=1      Serve from cache only
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Any, Optional, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(SCRIPT_DIR, '.http_cache')
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+class HttpCache:
+    """Filesystem-backed HTTP response cache with TTL, revalidation metadata and LRU eviction."""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES, offline: bool = False):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url: str) -> Tuple[str, str]:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + '.json', base + '.body'
+
+    def get(self, url: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """Return (metadata, body) for a cached URL, or None. Marks the entry as recently used."""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as file:
+                meta = json.load(file)
+            with open(body_path, 'rb') as file:
+                body = file.read()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        os.utime(meta_path)  # mtime doubles as the LRU clock
+        return meta, body
+
+    def is_fresh(self, meta: Dict[str, Any]) -> bool:
+        """True if the entry can be served without revalidation."""
+        return self.offline or time.time() - meta['stored_at'] < self.ttl
+
+    @staticmethod
+    def conditional_headers(meta: Dict[str, Any]) -> Dict[str, str]:
+        """Validators to send when revalidating a stale entry."""
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        """Store a response atomically."""
+        meta_path, body_path = self._paths(url)
+        lowered = {key.lower(): value for key, value in headers.items()}
+        meta = {
+            'url': url,
+            'status': status,
+            'headers': {key: lowered[key] for key in ('content-type',) if key in lowered},
+            'etag': lowered.get('etag'),
+            'last_modified': lowered.get('last-modified'),
+            'stored_at': time.time(),
+            'size': len(body),
+        }
+        _write_atomic(body_path, body)
+        _write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def refresh(self, url: str, meta: Dict[str, Any]) -> None:
+        """Restart an entry's TTL after a 304 Not Modified."""
+        meta_path, _ = self._paths(url)
+        _write_atomic(meta_path, json.dumps({**meta, 'stored_at': time.time()}).encode('utf-8'))
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits max_bytes. Returns entries removed."""
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            body_path = meta_path[:-len('.json')] + '.body'
+            size = os.path.getsize(meta_path) + (os.path.getsize(body_path) if os.path.exists(body_path) else 0)
+            entries.append((os.path.getmtime(meta_path), meta_path, body_path, size))
+            total += size
+
+        removed = 0
+        for _, meta_path, body_path, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for path in (meta_path, body_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            total -= size
+            removed += 1
+        return removed
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as file:
+        file.write(data)
+    os.replace(tmp_path, path)
+
+def default_cache() -> Optional[HttpCache]:
+    """Cache configured from the environment, or None when HTTP_CACHE=off."""
+    if os.getenv('HTTP_CACHE', 'on').lower() in ('off', '0', 'false'):
+        return None
+    return HttpCache(
+        directory=os.getenv('HTTP_CACHE_DIR', DEFAULT_CACHE_DIR),
+        ttl=float(os.getenv('HTTP_CACHE_TTL', DEFAULT_TTL)),
+        max_bytes=int(float(os.getenv('HTTP_CACHE_MAX_MB', DEFAULT_MAX_BYTES / 1024 / 1024)) * 1024 * 1024),
+        offline=os.getenv('HTTP_CACHE_OFFLINE', '').lower() in ('1', 'true', 'yes'),
+    )
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Quantized Vector Index
+Compressed in-memory codes for offline cosine search, with an exact float32
+re-score of the best candidates.
+
+Methods:
+    float32  The unit vectors themselves (the exact baseline)
+    int8     One signed byte per dimension with a per-dimension scale (4x smaller)
+    pq       Product quantization: the vector is cut into `subspaces` slices and
+             each slice stored as the byte id of its nearest k-means centroid
+             (default 4 dimensions per byte, 16x smaller)
+
+Both quantized methods score by asymmetric distance computation: the query
+stays float32 and is compared with the codes directly (int8: scaled query
+dotted with the codes; pq: one query-vs-centroid table per subspace, summed by
+code lookup), in row chunks so no float32 copy of the corpus is made. The top
+`rescore` candidates are then re-scored exactly against the float32 vectors,
+which should be memory-mapped (an export from export_vectors.py, or a
+disk_backed copy) so only the pages of re-scored rows are read in.
+
+Usage:
+    python scripts/quantized_index.py bench [--vectors [DIR] | --synthetic N] [--dimension D]
+                                            [--queries N] [--k 10] [--rescore 50] [--report PATH]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+METHODS = ('float32', 'int8', 'pq')
+DEFAULT_RESCORE = 50          # Candidates re-scored exactly per query
+PQ_CENTROIDS = 256            # One byte per subspace code
+PQ_DIMENSIONS_PER_CODE = 4
+PQ_TRAINING_SAMPLE = 10000    # Rows used to fit the codebooks
+PQ_ITERATIONS = 20
+SCORE_CHUNK_ROWS = 8192       # Rows decoded per scoring step
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    """Unit-length float32 rows, so dot products are cosine similarities."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+def disk_backed(vectors: np.ndarray) -> np.ndarray:
+    """
+    The vectors copied into an unnamed temporary file and memory-mapped
+    read-only, so the float32 rows leave the heap and are paged in on demand.
+    A memory-mapped array is returned as is.
+    """
+    if isinstance(vectors, np.memmap):
+        return vectors
+    vectors = np.asarray(vectors, dtype=np.float32)
+    with tempfile.TemporaryFile() as file:  # The maps keep their own handle; the file goes on close
+        np.memmap(file, dtype=np.float32, mode='w+', shape=vectors.shape)[:] = vectors
+        return np.memmap(file, dtype=np.float32, mode='r', shape=vectors.shape)
+
+def default_subspaces(dimension: int) -> int:
+    """The largest subspace count with at least PQ_DIMENSIONS_PER_CODE dimensions each that divides the dimension."""
+    for subspaces in range(max(dimension // PQ_DIMENSIONS_PER_CODE, 1), 0, -1):
+        if dimension % subspaces == 0:
+            return subspaces
+    return 1
+
+def nearest_centroids(data: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the nearest centroid per subspace and row: data [s, n, w], centroids [s, k, w] -> [s, n]."""
+    labels = np.empty(data.shape[:2], dtype=np.int64)
+    squared = (centroids ** 2).sum(axis=2)[:, None, :]
+    for start in range(0, data.shape[1], SCORE_CHUNK_ROWS // 4):
+        chunk = data[:, start:start + SCORE_CHUNK_ROWS // 4]
+        labels[:, start:start + chunk.shape[1]] = np.argmin(squared - 2 * chunk @ centroids.transpose(0, 2, 1), axis=2)
+    return labels
+
+def train_codebooks(data: np.ndarray, centroids: int, iterations: int = PQ_ITERATIONS, seed: int = 0) -> np.ndarray:
+    """Lloyd's k-means run for every subspace at once: data [s, n, w] -> codebooks [s, k, w]."""
+    subspaces, count, width = data.shape
+    rng = np.random.default_rng(seed)
+    codebooks = data[np.arange(subspaces)[:, None], np.stack([rng.choice(count, centroids, replace=False)
+                                                             for _ in range(subspaces)])]
+    # Offset each subspace's labels so one bincount sums all subspaces
+    offsets = (np.arange(subspaces) * centroids)[:, None]
+    for _ in range(iterations):
+        labels = (nearest_centroids(data, codebooks) + offsets).ravel()
+        sizes = np.bincount(labels, minlength=subspaces * centroids)
+        sums = np.stack([np.bincount(labels, weights=data[:, :, dim].ravel(), minlength=subspaces * centroids)
+                         for dim in range(width)], axis=1)
+        filled = sizes > 0  # Empty clusters keep their previous centroid
+        flat = codebooks.reshape(-1, width)
+        flat[filled] = sums[filled] / sizes[filled, None]
+    return codebooks
+
+class QuantizedIndex:
+    """Cosine top-k over quantized codes, re-scored exactly from the float32 vectors."""
+
+    def __init__(self, vectors: np.ndarray, method: str = 'int8', subspaces: Optional[int] = None,
+                 rescore: int = DEFAULT_RESCORE, seed: int = 0):
+        if method not in METHODS:
+            raise ValueError(f"Unknown quantization '{method}' (expected one of {', '.join(METHODS)})")
+        self.method = method
+        self.rescore = rescore
+        # Kept for the exact re-score only (float32 scores the codes exactly); a memory-mapped array stays on disk
+        self.vectors = None if method == 'float32' else vectors
+        units = normalize(vectors)
+        self.count, self.dimension = units.shape
+
+        if method == 'float32':
+            self.codes = units
+        elif method == 'int8':
+            # Symmetric per-dimension scale, so the largest magnitude maps to ±127
+            peak = np.abs(units).max(axis=0)
+            self.scale = np.where(peak == 0, 1, peak / 127).astype(np.float32)
+            self.codes = np.clip(np.rint(units / self.scale), -127, 127).astype(np.int8)
+        else:
+            self._train_pq(units, subspaces or default_subspaces(self.dimension), seed)
+
+    def _train_pq(self, units: np.ndarray, subspaces: int, seed: int) -> None:
+        if self.dimension % subspaces:
+            raise ValueError(f"{subspaces} subspaces do not divide dimension {self.dimension}")
+        self.subspaces = subspaces
+        width = self.dimension // subspaces
+        centroids = min(PQ_CENTROIDS, self.count)
+        rng = np.random.default_rng(seed)
+        sample = units[rng.choice(self.count, min(self.count, PQ_TRAINING_SAMPLE), replace=False)]
+
+        # [subspaces, rows, width] views of the vectors, one slice per code
+        self.codebooks = train_codebooks(sample.reshape(len(sample), subspaces, width).transpose(1, 0, 2), centroids, seed=seed)
+        self.codes = np.empty((self.count, subspaces), dtype=np.uint8)
+        for start in range(0, self.count, SCORE_CHUNK_ROWS):
+            chunk = units[start:start + SCORE_CHUNK_ROWS].reshape(-1, subspaces, width).transpose(1, 0, 2)
+            self.codes[start:start + len(chunk[0])] = nearest_centroids(chunk, self.codebooks).T
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the codes and their decoding tables (the float32 re-score source excluded)."""
+        extra = {'int8': lambda: self.scale.nbytes, 'pq': lambda: self.codebooks.nbytes}.get(self.method, lambda: 0)()
+        return self.codes.nbytes + extra
+
+    @property
+    def resident_bytes(self) -> int:
+        """Heap memory the index keeps: nbytes, plus the re-score vectors unless they are memory-mapped."""
+        in_memory = self.vectors is not None and not isinstance(self.vectors, np.memmap)
+        return self.nbytes + (self.vectors.nbytes if in_memory else 0)
+
+    def scores(self, query: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Approximate cosine similarity of one unit query to every row (or the given rows)."""
+        codes = self.codes if rows is None else self.codes[rows]
+        if self.method == 'pq':
+            # Asymmetric distance: query slice vs every centroid, then summed per code
+            table = np.einsum('sw,skw->sk', query.reshape(self.subspaces, -1), self.codebooks)
+            parts = np.arange(self.subspaces)
+            return np.concatenate([table[parts, codes[start:start + SCORE_CHUNK_ROWS]].sum(axis=1)
+                                   for start in range(0, len(codes), SCORE_CHUNK_ROWS)] or [np.zeros(0, np.float32)])
+        weights = query * self.scale if self.method == 'int8' else query
+        return np.concatenate([codes[start:start + SCORE_CHUNK_ROWS].astype(np.float32) @ weights
+                               for start in range(0, len(codes), SCORE_CHUNK_ROWS)] or [np.zeros(0, np.float32)])
+
+    def search(self, query: np.ndarray, top_k: int = 10, rows: Optional[np.ndarray] = None,
+               rescore: Optional[int] = None) -> List[tuple]:
+        """Top-k (row, score) pairs, best first; quantized candidates are re-scored exactly."""
+        query = normalize(np.asarray(query).reshape(1, -1))[0]
+        rows = np.arange(self.count) if rows is None else np.asarray(rows)
+        if not len(rows) or top_k <= 0:
+            return []
+        approximate = self.scores(query, None if len(rows) == self.count else rows)
+
+        rescore = self.rescore if rescore is None else rescore
+        keep = min(len(rows), top_k if self.method == 'float32' else max(top_k, rescore))
+        candidates = np.argpartition(-approximate, keep - 1)[:keep]
+        if self.method == 'float32' or not rescore:
+            final = approximate[candidates]
+        else:
+            # Exact scores for the candidates only, read in row order for page locality
+            candidates = np.sort(candidates)
+            final = normalize(self.vectors[rows[candidates]]) @ query
+        order = np.argsort(-final, kind='stable')[:top_k]
+        return list(zip(rows[candidates[order]].tolist(), final[order].tolist()))
+
+def synthetic_vectors(count: int, dimension: int, clusters: int = 64, rank: int = 64, seed: int = 0) -> np.ndarray:
+    """
+    Unit vectors shaped like document embeddings: topic clusters in a
+    low-rank latent space, projected up to `dimension` with a little noise.
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, rank))
+    latent = centers[rng.integers(clusters, size=count)] + 0.7 * rng.standard_normal((count, rank))
+    projection = rng.standard_normal((rank, dimension)) / np.sqrt(rank)
+    noise = 0.1 * rng.standard_normal((count, dimension))
+    return normalize(latent @ projection + noise)
+
+def benchmark(vectors: np.ndarray, queries: np.ndarray, k: int = 10, rescore: int = DEFAULT_RESCORE,
+              methods=METHODS) -> Dict[str, Any]:
+    """Memory, build time, latency and recall@k (before and after re-scoring) per method."""
+    from evaluate_search import exact_top_k
+    from test_pinecone_search import summarize
+
+    truth = [set(rows.tolist()) for rows in exact_top_k(queries, np.asarray(vectors, dtype=np.float32), k)]
+    float_bytes = len(vectors) * vectors.shape[1] * 4
+    vectors = disk_backed(vectors)  # Re-score from disk, as the local search backend does
+    results = {}
+    for method in methods:
+        start = time.perf_counter()
+        index = QuantizedIndex(vectors, method, rescore=rescore)
+        built = time.perf_counter() - start
+
+        latencies, raw_recall, recall = [], [], []
+        for query, expected in zip(queries, truth):
+            raw = index.search(query, k, rescore=0)
+            started = time.perf_counter()
+            hits = index.search(query, k)
+            latencies.append(time.perf_counter() - started)
+            raw_recall.append(len({row for row, _ in raw} & expected) / len(expected))
+            recall.append(len({row for row, _ in hits} & expected) / len(expected))
+
+        results[method] = {
+            'bytes_per_vector': index.nbytes / len(vectors),
+            'memory_mb': index.nbytes / 1e6,
+            'resident_mb': index.resident_bytes / 1e6,
+            'compression': float_bytes / index.nbytes,
+            'build_s': built,
+            'recall_quantized': float(np.mean(raw_recall)),
+            'recall_rescored': float(np.mean(recall)),
+            'latency_ms': summarize(latencies),
+        }
+    return {'vectors': len(vectors), 'dimension': int(vectors.shape[1]), 'queries': len(queries),
+            'k': k, 'rescore': rescore, 'methods': results}
+
+def print_benchmark(report: Dict[str, Any]) -> None:
+    """Human-readable summary of a benchmark report."""
+    print("\n" + "=" * 70)
+    print(f"🗜️  QUANTIZED INDEX ({report['vectors']} vectors × {report['dimension']} dims, "
+          f"{report['queries']} queries, recall@{report['k']}, re-score {report['rescore']})")
+    print("=" * 70)
+    print(f"\n  {'method':<8} {'B/vec':>8} {'MB':>8} {'heap MB':>8} {'ratio':>6} {'build s':>8} {'recall':>7} {'+rescore':>9} {'p50 ms':>7} {'p95 ms':>7}")
+    for method, result in report['methods'].items():
+        latency = result['latency_ms']
+        print(f"  {method:<8} {result['bytes_per_vector']:8.1f} {result['memory_mb']:8.2f} {result['resident_mb']:8.2f} {result['compression']:5.1f}x "
+              f"{result['build_s']:8.2f} {result['recall_quantized']:7.3f} {result['recall_rescored']:9.3f} "
+              f"{latency['p50']:7.2f} {latency['p95']:7.2f}")
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark quantized vector search against exact float32.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    bench = commands.add_parser('bench', help="Memory, latency and recall@k per quantization method")
+    source = bench.add_mutually_exclusive_group()
+    source.add_argument('--vectors', nargs='?', const='', metavar='DIR',
+                        help="Corpus from a vector export (export_vectors.py); default: the local backend")
+    source.add_argument('--synthetic', type=int, metavar='N', help="N clustered random vectors")
+    bench.add_argument('--dimension', type=int, default=1024, help="Dimension of synthetic vectors")
+    bench.add_argument('--queries', type=int, default=200, help="Queries, drawn as perturbed corpus vectors")
+    bench.add_argument('--k', type=int, default=10)
+    bench.add_argument('--rescore', type=int, default=DEFAULT_RESCORE, help="Candidates re-scored exactly")
+    bench.add_argument('--methods', nargs='+', choices=METHODS, default=list(METHODS))
+    bench.add_argument('--report', metavar='PATH', help="Also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        print(f"🎲 Generating {args.synthetic} synthetic vectors ({args.dimension} dims)...")
+        vectors = synthetic_vectors(args.synthetic, args.dimension)
+    elif args.vectors is not None:
+        from export_vectors import VectorSnapshot
+        vectors = VectorSnapshot(args.vectors or None).vectors
+    else:
+        from search_backends import LocalSearchBackend
+        print("🔌 Preparing local backend...")
+        vectors = LocalSearchBackend().vectors
+
+    rng = np.random.default_rng(1)
+    picked = np.asarray(vectors[np.sort(rng.choice(len(vectors), min(args.queries, len(vectors)), replace=False))])
+    queries = normalize(normalize(picked) + 0.3 * normalize(rng.standard_normal(picked.shape)))
+
+    report = benchmark(vectors, queries, args.k, args.rescore, args.methods)
+    print_benchmark(report)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"\n💾 Report saved to: {args.report}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+HTTP Record / Replay
+Captures scraper HTTP responses to a fixture directory and replays them
+without network access.
+
+A fixture directory is an HttpCache directory (see http_cache.py) that never
+expires and is never evicted. Recording fetches through the normal rate-limited
+fetch layer; replaying serves every request from the fixtures and fails any
+URL that was not recorded, so nothing reaches the network.
+
+Any scraper can run against fixtures by pointing the HTTP cache at them:
+
+    HTTP_CACHE_DIR=scripts/fixtures/http HTTP_CACHE_OFFLINE=1 python scripts/scraper_eu_recitals.py
+
+A small synthetic set (scripts/fixtures/sample/) is committed so CI can check
+the parsers without network access. Its pages are rendered from the committed
+corpus (data/eu_ai_act.json, data/test_recitals_1_to_180.json) in the site's
+page structure by `sample`, so it can be regenerated offline. They are a few KB
+each, far smaller than real pages, so timings on them are not scraping
+throughput; `sample` marks the directory with SYNTHETIC_MARKER.
+
+Usage:
+    python scripts/replay.py record [--dir DIR] [--articles N] [--recitals N]
+    python scripts/replay.py sample [--dir DIR] [--articles N] [--recitals N]
+"""
+
+import argparse
+import html
+import json
+import os
+import sys
+from contextlib import contextmanager
+from datetime import date
+from typing import List, Dict, Any
+
+from fetch import fetch_all
+from http_cache import HttpCache
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FIXTURE_DIR = os.path.join(SCRIPT_DIR, 'fixtures', 'http')
+SAMPLE_FIXTURE_DIR = os.path.join(SCRIPT_DIR, 'fixtures', 'sample')
+ARTICLES_PATH = os.path.join(SCRIPT_DIR, 'data', 'eu_ai_act.json')
+RECITALS_PATH = os.path.join(SCRIPT_DIR, 'data', 'test_recitals_1_to_180.json')
+ARTICLE_URL = "https://artificialintelligenceact.eu/article/{}"
+RECITAL_URL = "https://artificialintelligenceact.eu/recital/{}/"
+ARTICLE_COUNT = 113
+RECITAL_COUNT = 180
+SAMPLE_COUNT = 10  # Articles and recitals in the committed sample set
+SAMPLE_HEADERS = {'Content-Type': 'text/html; charset=UTF-8'}
+SYNTHETIC_MARKER = 'SYNTHETIC'  # File in a fixture directory whose pages were rendered, not recorded
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head><title>{title} | EU Artificial Intelligence Act</title>
+<style>.et_pb_post_content {{ margin: 0 auto; }}</style></head>
+<body>
+<header><nav class="nav"><a href="/">Home</a> <a href="/ai-act-explorer/">AI Act Explorer</a></nav></header>
+<main>
+<div class="et_pb_post_content entry-content">
+{body}
+</div>
+</main>
+<footer><p>This website is maintained by the Future of Life Institute.</p></footer>
+</body>
+</html>
+"""
+
+def fixture_cache(directory: str = DEFAULT_FIXTURE_DIR, record: bool = False) -> HttpCache:
+    """Cache over a fixture directory: never stale, never evicted, offline unless recording."""
+    return HttpCache(directory, ttl=float('inf'), max_bytes=sys.maxsize, offline=not record)
+
+def scraper_urls(articles: int = ARTICLE_COUNT, recitals: int = RECITAL_COUNT) -> Dict[str, List[str]]:
+    """The page URLs the EU scrapers request, by kind."""
+    return {
+        'article': [ARTICLE_URL.format(n) for n in range(1, articles + 1)],
+        'recital': [RECITAL_URL.format(n) for n in range(1, recitals + 1)],
+    }
+
+def record(urls: List[str], directory: str = DEFAULT_FIXTURE_DIR, rate: float = 2.0) -> int:
+    """Fetch URLs into the fixture directory (already recorded ones are kept). Returns failures."""
+    results = fetch_all(urls, rate=rate, cache=fixture_cache(directory, record=True))
+    failed = [result for result in results if not result.ok]
+    for result in failed:
+        print(f"❌ {result.url}: {result.error}")
+    return len(failed)
+
+def render_article_page(article: Dict[str, Any]) -> str:
+    """An article page in the site's structure, from a corpus record."""
+    number = int(article['id'][1:])
+    content = article['content'].split('<span')[0].strip()  # Corpus text still ends in navigation markup
+    entry_into_force = date.fromisoformat(article['active_date'])
+    recitals = ', '.join(_id[1:] for _id in article.get('connected_to', []) if _id.startswith('R'))
+    body = f"""<h1 class="entry-title">{html.escape(article['title'])}</h1>
+<div class="article-metadata"><p>Date of entry into force: {entry_into_force.day} {entry_into_force:%B %Y} According to: Article 113</p></div>
+<p>{html.escape(content)}</p>
+<span class="nav-previous">Previous</span> <span class="nav-next">Next</span>
+<h2>Suitable Recitals</h2>
+<p>
+{recitals}
+</p>
+<h2>Summary</h2>
+<p>{html.escape(article['summary'])}</p>
+<p>Generated by CLaiRK, edited by us.</p>
+<p><a href="{ARTICLE_URL.format(number)}">Copy URL</a></p>"""
+    return PAGE_TEMPLATE.format(title=html.escape(article['title']), body=body)
+
+def render_recital_page(recital: Dict[str, Any]) -> str:
+    """A recital page in the site's structure, from a corpus record."""
+    body = f"""<h1 class="entry-title">Recital {recital['id'][1:]}</h1>
+<p>{html.escape(recital['content'])}</p>"""
+    return PAGE_TEMPLATE.format(title=f"Recital {recital['id'][1:]}", body=body)
+
+def write_sample(directory: str = SAMPLE_FIXTURE_DIR, articles: int = SAMPLE_COUNT,
+                 recitals: int = SAMPLE_COUNT) -> int:
+    """Render the first N articles and recitals of the corpus into a fixture directory. Returns pages written."""
+    with open(ARTICLES_PATH, encoding='utf-8') as file:
+        article_records = {record['id']: record for record in json.load(file)}
+    with open(RECITALS_PATH, encoding='utf-8') as file:
+        recital_records = {record['id']: record for record in json.load(file)['recitals']}
+
+    cache = fixture_cache(directory, record=True)
+    urls = scraper_urls(articles, recitals)
+    for number, url in enumerate(urls['article'], start=1):
+        cache.put(url, 200, SAMPLE_HEADERS, render_article_page(article_records[f"A{number}"]).encode('utf-8'))
+    for number, url in enumerate(urls['recital'], start=1):
+        cache.put(url, 200, SAMPLE_HEADERS, render_recital_page(recital_records[f"R{number}"]).encode('utf-8'))
+    with open(os.path.join(directory, SYNTHETIC_MARKER), 'w', encoding='utf-8') as file:
+        file.write("Pages rendered from the corpus by 'python scripts/replay.py sample', not recorded from the site.\n")
+    return articles + recitals
+
+def is_synthetic(directory: str) -> bool:
+    """True for fixture directories rendered by write_sample rather than recorded."""
+    return os.path.exists(os.path.join(directory, SYNTHETIC_MARKER))
+
+@contextmanager
+def replaying(directory: str = DEFAULT_FIXTURE_DIR):
+    """Serve every fetch made inside the block from fixtures, without network access."""
+    overrides = {
+        'HTTP_CACHE': 'on',
+        'HTTP_CACHE_DIR': directory,
+        'HTTP_CACHE_OFFLINE': '1',
+        'HTTP_CACHE_MAX_MB': str(sys.maxsize >> 20),
+    }
+    saved = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Record scraper HTTP fixtures.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    rec = commands.add_parser('record', help="Fetch the scrapers' pages into a fixture directory")
+    rec.add_argument('--dir', default=DEFAULT_FIXTURE_DIR)
+    rec.add_argument('--articles', type=int, default=ARTICLE_COUNT, help="Record articles 1..N")
+    rec.add_argument('--recitals', type=int, default=RECITAL_COUNT, help="Record recitals 1..N")
+    rec.add_argument('--rate', type=float, default=2.0, help="Requests per second")
+    sample = commands.add_parser('sample', help="Render the committed synthetic fixtures from the corpus (offline)")
+    sample.add_argument('--dir', default=SAMPLE_FIXTURE_DIR)
+    sample.add_argument('--articles', type=int, default=SAMPLE_COUNT, help="Render articles 1..N")
+    sample.add_argument('--recitals', type=int, default=SAMPLE_COUNT, help="Render recitals 1..N")
+    args = parser.parse_args(argv)
+
+    if args.command == 'sample':
+        print(f"📼 Rendered {write_sample(args.dir, args.articles, args.recitals)} sample pages to {args.dir}")
+        return 0
+
+    urls = [url for kind in scraper_urls(args.articles, args.recitals).values() for url in kind]
+    print(f"📼 Recording {len(urls)} pages to {args.dir}...")
+    failed = record(urls, args.dir, args.rate)
+    print(f"\n✅ Recorded {len(urls) - failed}/{len(urls)} pages")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
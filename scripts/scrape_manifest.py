@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Scrape Manifest
+Remembers, per scraped page, a hash of the fetched HTML and the record that
+was extracted from it, so re-scrapes only parse pages that changed.
+
+    {
+      "version": 1,
+      "pages": {"<url>": {"id": "A5", "hash": "<sha256>", "record": {...}}},
+      "pending_upload": ["A5", "R12"]
+    }
+
+Scripts and styles are left out of the hash, so per-request nonces and
+inline tracking code do not make an unchanged page look new. Ids whose
+record actually changed collect in "pending_upload" until
+`upload_all_data.py --changed` uploads them.
+
+Environment:
+    SCRAPE_MANIFEST=off       Always re-parse every page
+    SCRAPE_MANIFEST_PATH=PATH Manifest location (default: scripts/data/scrape_manifest.json)
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import List, Dict, Any, Iterable, Optional, Set
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MANIFEST_PATH = os.path.join(SCRIPT_DIR, 'data', 'scrape_manifest.json')
+MANIFEST_VERSION = 1
+VOLATILE_BLOCKS = re.compile(rb'<(script|style)\b.*?</\1\s*>', re.DOTALL | re.IGNORECASE)
+
+def page_hash(content: bytes) -> str:
+    """Hash of a page with scripts and styles removed."""
+    return hashlib.sha256(VOLATILE_BLOCKS.sub(b'', content)).hexdigest()
+
+class ScrapeManifest:
+    """Per-URL page hashes and extracted records from previous scrapes."""
+
+    def __init__(self, path: str = DEFAULT_MANIFEST_PATH):
+        self.path = path
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.pending: Set[str] = set()
+        self.changed: Set[str] = set()  # Ids whose record changed during this run
+        self.skipped = 0
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('version') == MANIFEST_VERSION:
+                self.pages = data.get('pages', {})
+                self.pending = set(data.get('pending_upload', []))
+
+    def lookup(self, url: str, digest: str) -> Optional[Dict[str, Any]]:
+        """The stored entry for a URL if its page hash is unchanged, else None."""
+        entry = self.pages.get(url)
+        if entry and entry['hash'] == digest:
+            self.skipped += 1
+            return entry
+        return None
+
+    def update(self, url: str, digest: str, record: Optional[Dict[str, Any]]) -> None:
+        """Store a freshly parsed page, marking its id changed when the record differs."""
+        previous = self.pages.get(url, {}).get('record')
+        self.pages[url] = {'id': record['id'] if record else None, 'hash': digest, 'record': record}
+        if record and record != previous:
+            self.changed.add(record['id'])
+
+    def save(self) -> None:
+        """Write the manifest atomically, adding this run's changed ids to the upload queue."""
+        self.pending |= self.changed
+        data = {'version': MANIFEST_VERSION, 'pages': self.pages, 'pending_upload': sorted(self.pending)}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def mark_uploaded(self, ids: Iterable[str]) -> None:
+        """Drop uploaded ids from the upload queue and save."""
+        self.pending -= set(ids)
+        self.changed -= set(ids)
+        self.save()
+
+def default_manifest() -> Optional[ScrapeManifest]:
+    """Manifest configured from the environment, or None when SCRAPE_MANIFEST=off."""
+    if os.getenv('SCRAPE_MANIFEST', 'on').lower() in ('off', '0', 'false'):
+        return None
+    return ScrapeManifest(os.getenv('SCRAPE_MANIFEST_PATH', DEFAULT_MANIFEST_PATH))
+
+def _id_order(record: Dict[str, Any]):
+    """Sort key for ids like A5 / R12: prefix, then number."""
+    _id = str(record['id'])
+    return (_id[:1], int(_id[1:])) if _id[1:].isdigit() else (_id, 0)
+
+def patch_records(existing: List[Dict[str, Any]], records: List[Dict[str, Any]],
+                  changed: Set[str]) -> List[Dict[str, Any]]:
+    """Replace changed records and add new ones; records that were not re-scraped are kept."""
+    by_id = {record['id']: record for record in existing}
+    for record in records:
+        if record['id'] in changed or record['id'] not in by_id:
+            by_id[record['id']] = record
+    return sorted(by_id.values(), key=_id_order)
+
+def patch_output(path: str, records: List[Dict[str, Any]], changed: Set[str],
+                 key: Optional[str] = None, wrapper: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Merge scraped records into an output JSON file by id.
+
+    The file is only rewritten when a record changed or is new. `key` names
+    the list inside a wrapping object (e.g. "recitals"); `wrapper` holds the
+    object's other fields. Returns True if the file was written.
+    """
+    existing = []
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        existing = data.get(key, []) if key else data
+
+    known = {record['id'] for record in existing}
+    if os.path.exists(path) and not changed and all(record['id'] in known for record in records):
+        return False
+
+    merged = patch_records(existing, records, changed)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump({**(wrapper or {}), key: merged} if key else merged, file, ensure_ascii=False, indent=2)
+    return True
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Scrape Pipeline
+Two-stage fetch/parse pipeline shared by the EU scrapers.
+
+    fetch stage   asyncio workers pull URLs through AsyncFetcher (rate limits,
+                  retries, HTTP cache) and put raw bytes on a bounded queue
+    parse stage   pages are taken off the queue and parsed in a process pool,
+                  so HTML parsing no longer shares the GIL with network I/O
+
+Fetch workers wait for queue space before fetching the next page, and the
+parse stage only takes a page when a parser slot is free, so at most
+concurrency + queue size + pool slots raw pages are held at once, however
+many pages are scraped.
+
+Parse functions must be top-level (picklable) with the signature
+parse(key, url, content) -> record or None.
+
+With a ScrapeManifest, pages whose hash matches the previous scrape skip the
+parse stage and reuse the stored record.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import List, Any, Callable, Dict, Optional, Tuple
+
+from fetch import AsyncFetcher, DEFAULT_CONCURRENCY, FetchResult
+from scrape_manifest import ScrapeManifest, page_hash
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+Job = Tuple[Any, str]                                  # (key, url)
+Outcome = Tuple[Any, str, Optional[Dict], Optional[str]]  # (key, url, record, error)
+
+def parse_job(parse: Callable, key: Any, url: str, content: bytes) -> Tuple[Optional[Dict], Optional[str]]:
+    """Run a parse function, returning (record, error) instead of raising across the pool."""
+    try:
+        return parse(key, url, content), None
+    except Exception as e:
+        return None, str(e)
+
+async def _fetch_stage(fetcher: AsyncFetcher, jobs: List[Job], queue: asyncio.Queue, fetch_workers: int) -> None:
+    """Fetch every job and queue (key, url, FetchResult); ends with a None sentinel."""
+    pending = iter(jobs)
+
+    async def worker():
+        # Workers share one iterator, so each job is taken exactly once
+        for key, url in pending:
+            await queue.put((key, url, await fetcher.fetch(url)))
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(fetch_workers)))
+    finally:
+        await queue.put(None)
+
+async def _parse_stage(queue: asyncio.Queue, parse: Callable, pool: Optional[ProcessPoolExecutor],
+                       slots: int, manifest: Optional[ScrapeManifest] = None) -> Dict[Any, Tuple[Optional[Dict], Optional[str]]]:
+    """Parse queued pages with at most `slots` in flight; returns key -> (record, error)."""
+    loop = asyncio.get_running_loop()
+    free = asyncio.Semaphore(slots)
+    results = {}
+    tasks = []
+
+    async def run(key, url, fetched: FetchResult):
+        try:
+            if not fetched.ok:
+                results[key] = (None, f"Request failed - {fetched.error}")
+                return
+            digest = page_hash(fetched.content) if manifest else None
+            entry = manifest.lookup(url, digest) if manifest else None
+            if entry:
+                results[key] = (entry['record'], None)
+                return
+            if pool:
+                results[key] = await loop.run_in_executor(pool, parse_job, parse, key, url, fetched.content)
+            else:
+                results[key] = parse_job(parse, key, url, fetched.content)
+            if manifest and results[key][1] is None:
+                manifest.update(url, digest, results[key][0])
+        finally:
+            free.release()
+
+    while True:
+        await free.acquire()
+        item = await queue.get()
+        if item is None:
+            break
+        tasks.append(asyncio.ensure_future(run(*item)))
+
+    await asyncio.gather(*tasks)
+    return results
+
+def run_pipeline(jobs: List[Job], parse: Callable, workers: int = DEFAULT_WORKERS,
+                 queue_size: Optional[int] = None, manifest: Optional[ScrapeManifest] = None,
+                 **fetcher_options) -> List[Outcome]:
+    """
+    Fetch and parse every (key, url) job.
+
+    Args:
+        jobs: (key, url) pairs; the key is passed to `parse` and returned
+        parse: Top-level function parse(key, url, content) -> record or None
+        workers: Parser processes; 1 parses in this process
+        queue_size: Fetched pages allowed to wait for a parser (default 2 per worker)
+        manifest: Skip parsing pages unchanged since the last scrape (caller saves it)
+        fetcher_options: Passed to AsyncFetcher (rate, concurrency, ...)
+
+    Returns:
+        (key, url, record, error) for each job, in job order
+    """
+    workers = max(1, workers)
+    fetch_workers = fetcher_options.get('concurrency', DEFAULT_CONCURRENCY)
+
+    async def run():
+        queue = asyncio.Queue(maxsize=queue_size or workers * 2)
+        with (ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()) as pool:
+            async with AsyncFetcher(memoize=False, **fetcher_options) as fetcher:
+                _, results = await asyncio.gather(
+                    _fetch_stage(fetcher, jobs, queue, fetch_workers),
+                    _parse_stage(queue, parse, pool, slots=workers * 2, manifest=manifest),
+                )
+        return results
+
+    results = asyncio.run(run())
+    return [(key, url, *results[key]) for key, url in jobs]
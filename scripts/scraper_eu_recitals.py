@@ -4,11 +4,15 @@ Test EU AI Act Recitals Scraper - First 5 Recitals
 Simple test version to scrape and display the first 5 recitals.
 """
 
-import requests
 from bs4 import BeautifulSoup
-import json
 import time
 
+from scrape_manifest import default_manifest, patch_output
+from scrape_pipeline import DEFAULT_WORKERS, run_pipeline
+
+BASE_URL = "https://artificialintelligenceact.eu/recital/"
+RATE = 2.0  # Requests per second, enforced by the shared fetch layer
+
 def extract_recital_content(html_content, recital_id):
     """Extract recital title and content from HTML based on actual structure."""
     soup = BeautifulSoup(html_content, 'html.parser')
@@ -62,7 +66,7 @@ def extract_recital_content(html_content, recital_id):
                 any(indicator in line.lower() for indicator in [
                     'regulation', 'charter', 'union', 'artificial intelligence'
                 ])):
-                return f"Recital {recital_number}", line
+                return f"Recital {recital_id}", line
     
     # Method 4: Fallback - look at all text but filter more carefully
     all_text = soup.get_text()
@@ -82,65 +86,55 @@ def extract_recital_content(html_content, recital_id):
                     any(indicator in line.lower() for indicator in [
                         'regulation', 'charter', 'union', 'artificial intelligence', 'trustworthy'
                     ])):
-                    return f"Recital {recital_number}", line
+                    return f"Recital {recital_id}", line
     
     return None, None
 
-def test_scraper():
-    """Test the scraper on first 5 recitals."""
-    base_url = "https://artificialintelligenceact.eu/recital/"
+def build_recital(i, url, html_content):
+    """Extract recital i from its page and return the output record, or None."""
+    title, content = extract_recital_content(html_content, f"R{i}")
+    if not (title and content):
+        return None
+    return {
+        "id": f"R{i}",
+        "title": title,
+        "content": content,
+        "continent": "Europe",
+        "sourceType": "NGO",
+        "url": url,
+        "content_length": len(content)
+    }
+
+def test_scraper(rate=RATE, workers=DEFAULT_WORKERS):
+    """Scrape all 180 recitals: rate-limited fetches feed a pool of parser processes."""
     results = []
+    jobs = [(i, f"{BASE_URL}{i}/") for i in range(1, 181)]
     
-    # Set up session with headers
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    })
-    
-    print("Testing EU AI Act Scraper on first 5 recitals...")
+    print(f"Scraping {len(jobs)} EU AI Act recitals at up to {rate:g} requests/s ({workers} parser processes)...")
     print("=" * 50)
     
-    for i in range(1, 181):  # Test recitals 1-5
-        url = f"{base_url}{i}/"
+    manifest = default_manifest()
+    for i, url, recital_data, error in run_pipeline(jobs, build_recital, workers=workers,
+                                                    manifest=manifest, rate=rate):
+        if error:
+            print(f"❌ Error scraping Recital R{i}: {error}")
+            continue
         
-        try:
-            print(f"Fetching Recital R{i}...")
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
+        if recital_data:
+            results.append(recital_data)
             
-            title, content = extract_recital_content(response.text, f"R{i}")
-            
-            if title and content:
-                recital_data = {
-                    "id": f"R{i}",
-                    "title": title,
-                    "content": content,
-                    "continent": "Europe",
-                    "sourceType": "NGO",
-                    "url": url,
-                    "content_length": len(content)
-                }
-                results.append(recital_data)
-                
-                print(f"✅ Successfully scraped {title}")
-                print(f"   Content length: {len(content)} characters")
-                print(f"   Preview: {content[:100]}...")
-                print()
-                
-            else:
-                print(f"❌ Failed to extract content from Recital R{i}")
-                
-        except Exception as e:
-            print(f"❌ Error fetching Recital R{i}: {e}")
-        
-        # Small delay between requests
-        time.sleep(0.5)
+            print(f"✅ Successfully scraped {recital_data['title']}")
+            print(f"   Content length: {recital_data['content_length']} characters")
+            print(f"   Preview: {recital_data['content'][:100]}...")
+            print()
+        else:
+            print(f"❌ Failed to extract content from Recital R{i}")
     
     # Display results summary
     print("\n" + "=" * 50)
     print("RESULTS SUMMARY")
     print("=" * 50)
-    print(f"Successfully scraped: {len(results)}/5 recitals")
+    print(f"Successfully scraped: {len(results)}/{len(jobs)} recitals")
     
     if results:
         print("\nFull content of scraped recitals:")
@@ -152,20 +146,23 @@ def test_scraper():
             print(f"Content: {recital['content']}")
             print("-" * 50)
         
-        # Save to JSON file
-        output_data = {
-            "test_info": {
-                "total_scraped": len(results),
-                "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "test_range": "1-5"
-            },
-            "recitals": results
-        }
+        if manifest:
+            manifest.save()
+            print(f"\n♻️  {manifest.skipped} unchanged, {len(manifest.changed)} new or changed")
+        changed = manifest.changed if manifest else {recital['id'] for recital in results}
         
-        with open("test_recitals_1_to_180.json", "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        # Patch changed recitals into the JSON file
+        test_info = {
+            "total_scraped": len(results),
+            "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "test_range": "1-5"
+        }
         
-        print(f"\n💾 Results saved to: test_recitals_1_to_180.json")
+        if patch_output("test_recitals_1_to_180.json", results, changed, key="recitals",
+                        wrapper={"test_info": test_info}):
+            print(f"\n💾 Results saved to: test_recitals_1_to_180.json")
+        else:
+            print(f"\n💾 No changes; test_recitals_1_to_180.json left as is")
         
     return results
 
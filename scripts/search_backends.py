@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Search Backends
+One search interface over the Pinecone index and an offline stand-in, so
+search tooling (load tests, evaluation) runs with or without an API key.
+
+    backend.search(query, top_k=10, filter=None, rerank=False)
+        -> {'hits': [{'_id', '_score', 'fields'}], 'timings': {stage: seconds}}
+    backend.embed(texts) -> float32[len(texts), dimension] query vectors
+    backend.export_vectors() -> (ids, float32[n, dimension] vectors, fields)
+
+Backends:
+    pinecone  Integrated-embedding search on the configured index, optionally
+              reranked by Pinecone, with passage hits folded into their
+              documents (chunking.py); timed as one 'search' stage (Pinecone
+              does not report reranking time separately)
+    local     The validated corpus (snapshot, or the sources) embedded with
+              TF-IDF + truncated SVD into dense float32 vectors and searched
+              by exact cosine similarity, or over int8 / PQ codes with an
+              exact re-score when SEARCH_QUANTIZATION is set (quantized_index.py);
+              timed as 'embed' and 'search'
+
+Filters use Pinecone's metadata filter syntax ($eq, $ne, $in, $nin, $gt,
+$gte, $lt, $lte, $and, $or), as built by lib/utils/pinecone-filters.ts; the
+local backend evaluates them with filter_engine.py before scoring.
+"""
+
+import contextlib
+import os
+import sys
+import time
+from typing import List, Dict, Any, Iterable, Optional
+
+import numpy as np
+
+from chunking import PASSAGE_OVERFETCH, collapse_hits
+
+DEFAULT_DIMENSIONS = 256
+DEFAULT_RERANK_MODEL = 'bge-reranker-v2-m3'
+DEFAULT_EMBED_MODEL = 'llama-text-embed-v2'
+EXPORT_BATCH_SIZE = 100
+BACKENDS = ('pinecone', 'local')
+
+def load_corpus() -> List[Dict[str, Any]]:
+    """Validated corpus records: from the snapshot when exported, otherwise from the sources."""
+    from snapshot import CorpusSnapshot, default_snapshot_path
+    if os.path.exists(default_snapshot_path()):
+        with CorpusSnapshot() as snapshot:
+            return list(snapshot)
+
+    from sources import discover_sources, iter_source_records
+    with contextlib.redirect_stdout(sys.stderr):  # Loader progress must not mix with JSON output
+        return [record for spec in discover_sources() for record in iter_source_records(spec)]
+
+class LocalSearchBackend:
+    """Offline stand-in: dense TF-IDF/SVD vectors over the corpus, exact cosine search."""
+
+    name = 'local'
+
+    def __init__(self, records: Optional[Iterable[Dict[str, Any]]] = None, dimensions: int = DEFAULT_DIMENSIONS,
+                 quantization: Optional[str] = None):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from filter_engine import FilterEngine
+
+        records = list(records) if records is not None else load_corpus()
+        self.ids = [record['_id'] for record in records]
+        self.fields = [{key: value for key, value in record.items() if key != '_id'} for record in records]
+        self.filters = FilterEngine(records)
+
+        texts = [record.get('chunk_text', '') for record in records]
+        self.vectorizer = TfidfVectorizer(sublinear_tf=True, stop_words='english', ngram_range=(1, 2))
+        tfidf = self.vectorizer.fit_transform(texts)
+        # Exact truncated SVD through the small document Gram matrix: X Xᵀ = U S² Uᵀ, so the
+        # term projection is Xᵀ U / S and the document vectors are U S
+        eigenvalues, eigenvectors = np.linalg.eigh((tfidf @ tfidf.T).toarray())
+        order = np.argsort(eigenvalues)[::-1][:dimensions]
+        order = order[eigenvalues[order] > 1e-10]
+        singular = np.sqrt(eigenvalues[order])
+        # float32 on both sides of the sparse product avoids copying the projection per query
+        self.projection = np.ascontiguousarray((tfidf.T @ eigenvectors[:, order]) / singular, dtype=np.float32)
+        self.vectors = self._normalize(eigenvectors[:, order] * singular)
+
+        self.quantized = None
+        if quantization:
+            from quantized_index import QuantizedIndex, disk_backed
+            # Search reads the codes; the float32 rows move to disk and are paged in only to re-score
+            self.vectors = disk_backed(self.vectors)
+            self.quantized = QuantizedIndex(self.vectors, quantization)
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        matrix = np.asarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1, norms)
+
+    @property
+    def dimension(self) -> int:
+        return self.vectors.shape[1]
+
+    @property
+    def resident_bytes(self) -> int:
+        """Heap memory held by the document vectors (quantized codes when quantization is on)."""
+        return self.quantized.resident_bytes if self.quantized is not None else self.vectors.nbytes
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Unit-length float32 query vectors in the corpus vector space."""
+        return self._normalize(self.vectorizer.transform(texts).astype(np.float32) @ self.projection)
+
+    def export_vectors(self):
+        """The corpus ids, document vectors and metadata fields."""
+        return self.ids, self.vectors, self.fields
+
+    def search(self, query: str, top_k: int = 10, filter: Optional[Dict[str, Any]] = None,
+               rerank: bool = False) -> Dict[str, Any]:
+        """Exact top-k by cosine similarity. `rerank` is accepted for interface parity and ignored."""
+        start = time.perf_counter()
+        vector = self.embed([query])[0]
+        embedded = time.perf_counter()
+
+        # Pre-filter: only rows passing the metadata filter are scored
+        rows = self.filters.rows(filter) if filter else np.arange(len(self.ids))
+        if self.quantized is not None:
+            ranked = self.quantized.search(vector, top_k, rows)
+        else:
+            scores = self.vectors[rows] @ vector
+            top = np.argsort(-scores, kind='stable')[:top_k]
+            ranked = zip(rows[top].tolist(), scores[top].tolist())
+        hits = [{'_id': self.ids[row], '_score': float(score), 'fields': self.fields[row]} for row, score in ranked]
+        searched = time.perf_counter()
+
+        return {'hits': hits, 'timings': {'embed': embedded - start, 'search': searched - embedded}}
+
+class PineconeSearchBackend:
+    """Search on the Pinecone index with integrated embeddings (and optional reranking)."""
+
+    name = 'pinecone'
+
+    def __init__(self, rerank_model: str = DEFAULT_RERANK_MODEL):
+        from pinecone import Pinecone
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        config = {
+            'api_key': os.getenv("PINECONE_API_KEY"),
+            'index_name': os.getenv("PINECONE_INDEX_NAME", "network-graph"),
+            'namespace': os.getenv("PINECONE_NAMESPACE", "example-namespace"),
+            'embed_model': os.getenv("PINECONE_EMBED_MODEL", DEFAULT_EMBED_MODEL),
+        }
+        if not config['api_key']:
+            raise ValueError("PINECONE_API_KEY environment variable not set")
+
+        self.pc = Pinecone(api_key=config['api_key'])
+        self.index = self.pc.Index(config['index_name'])
+        self.namespace = config['namespace']
+        self.embed_model = config['embed_model']
+        self.rerank_model = rerank_model
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Query vectors from the index's embedding model."""
+        response = self.pc.inference.embed(model=self.embed_model, inputs=texts,
+                                           parameters={'input_type': 'query', 'truncate': 'END'})
+        return np.array([item['values'] for item in response.data], dtype=np.float32)
+
+    def export_vectors(self):
+        """Every stored vector in the namespace (passages included) with its ids and metadata fields."""
+        ids, vectors, fields = [], [], []
+        for page in self.index.list(namespace=self.namespace):
+            for start in range(0, len(page), EXPORT_BATCH_SIZE):
+                fetched = self.index.fetch(ids=page[start:start + EXPORT_BATCH_SIZE], namespace=self.namespace)
+                for _id, vector in fetched.vectors.items():
+                    ids.append(_id)
+                    vectors.append(vector.values)
+                    fields.append(vector.metadata or {})
+        # An empty namespace has no vector to take the width from; the index stats still report it
+        dimension = len(vectors[0]) if vectors else self.index.describe_index_stats().get('dimension', 0)
+        return ids, np.array(vectors, dtype=np.float32).reshape(len(ids), dimension), fields
+
+    def search(self, query: str, top_k: int = 10, filter: Optional[Dict[str, Any]] = None,
+               rerank: bool = False) -> Dict[str, Any]:
+        # Several passages of one document can match, so fetch extra hits before collapsing
+        fetch_k = top_k * PASSAGE_OVERFETCH
+        request = {'top_k': fetch_k, 'inputs': {'text': query}}
+        if filter:
+            request['filter'] = filter
+        options = {}
+        if rerank:
+            options['rerank'] = {'model': self.rerank_model, 'top_n': fetch_k, 'rank_fields': ['chunk_text']}
+
+        start = time.perf_counter()
+        response = self.index.search(namespace=self.namespace, query=request, **options)
+        elapsed = time.perf_counter() - start
+
+        hits = [{'_id': hit['_id'], '_score': hit['_score'], 'fields': hit.get('fields', {})}
+                for hit in response['result']['hits']]
+        hits = collapse_hits(hits, top_k)
+        return {'hits': hits, 'timings': {'search': elapsed}}
+
+def get_backend(name: Optional[str] = None):
+    """
+    Backend by name ('pinecone' or 'local'; default $SEARCH_BACKEND or 'pinecone').
+    The local backend searches quantized codes when $SEARCH_QUANTIZATION is int8 or pq.
+    """
+    name = name or os.getenv('SEARCH_BACKEND', 'pinecone')
+    if name == 'local':
+        return LocalSearchBackend(quantization=os.getenv('SEARCH_QUANTIZATION') or None)
+    if name == 'pinecone':
+        return PineconeSearchBackend()
+    raise ValueError(f"Unknown search backend '{name}' (expected one of {', '.join(BACKENDS)})")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Search Client
+A search backend (search_backends.py) behind a result cache, so repeated
+queries skip the embedding and index round trip.
+
+    client = SearchClient(get_backend('pinecone'))
+    client.search(query, top_k=10, filter=None, rerank=False)   # same response as the backend
+    client.stats()   # hits, misses, hit rate, latency saved, evictions, invalidations
+
+Results are cached per normalized query text (case and whitespace folded),
+top_k, rerank flag and canonical filter JSON (keys sorted, $in/$nin values
+sorted), for SEARCH_CACHE_TTL seconds (default 300), keeping at most
+SEARCH_CACHE_SIZE entries (default 1000, least recently used evicted first).
+
+upload_all_data.py bumps the namespace's generation in the generation file
+(default scripts/data/search_generation.json, override with SEARCH_GENERATION)
+when its writes stop (even after a failure) and again once they are
+queryable; a client that sees a new generation drops its cache.
+
+search_batch(backend, requests) runs many searches at once: identical
+requests (same cache key) are sent once, the rest run on a thread pool capped
+at SEARCH_BATCH_CONCURRENCY (default 8) sharing the backend's connection pool,
+and responses come back in request order.
+
+Usage:
+    python scripts/search_client.py [--bump NAMESPACE]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_GENERATION_PATH = os.path.join(SCRIPT_DIR, 'data', 'search_generation.json')
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_BATCH_CONCURRENCY = 8
+UNORDERED_OPERATORS = ('$in', '$nin')
+WHITESPACE = re.compile(r'\s+')
+
+def default_generation_path() -> str:
+    """Generation file location, overridable with SEARCH_GENERATION."""
+    return os.getenv('SEARCH_GENERATION', DEFAULT_GENERATION_PATH)
+
+def read_generations(path: Optional[str] = None) -> Dict[str, Any]:
+    """{namespace: {'generation', 'written_at'}} from the generation file ({} if missing)."""
+    try:
+        with open(path or default_generation_path(), encoding='utf-8') as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def mark_namespace_written(namespace: str, path: Optional[str] = None) -> int:
+    """Bump a namespace's generation after writing to it, invalidating cached results. Returns the new generation."""
+    path = path or default_generation_path()
+    generations = read_generations(path)
+    generation = generations.get(namespace, {}).get('generation', 0) + 1
+    generations[namespace] = {'generation': generation,
+                              'written_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(generations, file, indent=2)
+    os.replace(tmp_path, path)
+    return generation
+
+def normalize_query(query: str) -> str:
+    """Query text as cached: case-folded with whitespace collapsed."""
+    return WHITESPACE.sub(' ', query).strip().casefold()
+
+def canonical_filter(condition: Any) -> Any:
+    """A filter with set-valued operands sorted, so equivalent filters share a key."""
+    if isinstance(condition, dict):
+        return {key: sorted(value, key=json.dumps) if key in UNORDERED_OPERATORS and isinstance(value, list)
+                else canonical_filter(value) for key, value in condition.items()}
+    if isinstance(condition, list):
+        return [canonical_filter(item) for item in condition]
+    return condition
+
+def cache_key(query: str, top_k: int, filter: Optional[Dict[str, Any]], rerank: bool) -> str:
+    """Cache key of one search request."""
+    return json.dumps([normalize_query(query), top_k, bool(rerank), canonical_filter(filter or {})],
+                      sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+class SearchClient:
+    """TTL + LRU result cache in front of a search backend, invalidated by namespace generation."""
+
+    def __init__(self, backend, ttl: Optional[float] = None, max_entries: Optional[int] = None,
+                 generation_path: Optional[str] = None):
+        self.backend = backend
+        self.name = backend.name
+        self.namespace = getattr(backend, 'namespace', backend.name)
+        self.ttl = ttl if ttl is not None else float(os.getenv('SEARCH_CACHE_TTL', DEFAULT_TTL))
+        self.max_entries = max_entries if max_entries is not None else int(os.getenv('SEARCH_CACHE_SIZE', DEFAULT_MAX_ENTRIES))
+        self.generation_path = generation_path or default_generation_path()
+        self._entries: 'OrderedDict[str, Tuple[float, float, Dict[str, Any]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation_stamp = ()  # Never a real stamp, so the first check reads the file
+        self._cached_generation = 0
+        self._generation = self._current_generation()
+        self.counters = {'hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0,
+                         'invalidations': 0, 'saved_s': 0.0}
+
+    def _current_generation(self) -> int:
+        """The namespace generation, re-read only when the generation file changes."""
+        try:
+            stat = os.stat(self.generation_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            stamp = None
+        if stamp != self._generation_stamp:
+            self._generation_stamp = stamp
+            self._cached_generation = read_generations(self.generation_path).get(self.namespace, {}).get('generation', 0)
+        return self._cached_generation
+
+    def _check_generation(self) -> None:
+        generation = self._current_generation()
+        if generation != self._generation:
+            self._generation = generation
+            if self._entries:
+                self._entries.clear()
+                self.counters['invalidations'] += 1
+
+    def search(self, query: str, top_k: int = 10, filter: Optional[Dict[str, Any]] = None,
+               rerank: bool = False) -> Dict[str, Any]:
+        """Backend search, answered from the cache when an unexpired result exists."""
+        key = cache_key(query, top_k, filter, rerank)
+        start = time.perf_counter()
+        with self._lock:
+            self._check_generation()
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.counters['hits'] += 1
+                self.counters['saved_s'] += entry[1]
+                return {**entry[2], 'timings': {'cache': time.perf_counter() - start}, 'cached': True}
+            if entry:
+                del self._entries[key]
+                self.counters['expired'] += 1
+            self.counters['misses'] += 1
+            generation = self._generation
+
+        result = self.backend.search(query, top_k=top_k, filter=filter, rerank=rerank)
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            # A result fetched across an invalidation may predate the write; don't keep it
+            self._check_generation()
+            if generation == self._generation and self.max_entries > 0:
+                self._entries[key] = (time.monotonic() + self.ttl, elapsed, result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.counters['evictions'] += 1
+        return {**result, 'cached': False}
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters plus hit rate, size and generation."""
+        with self._lock:
+            lookups = self.counters['hits'] + self.counters['misses']
+            return {**self.counters, 'hit_rate': self.counters['hits'] / lookups if lookups else 0.0,
+                    'entries': len(self._entries), 'generation': self._generation}
+
+def search_batch(backend, requests: List[Dict[str, Any]], concurrency: Optional[int] = None,
+                 top_k: int = 10, rerank: bool = False) -> List[Dict[str, Any]]:
+    """
+    Search every request ({'query', 'top_k', 'filter', 'rerank'}, as in query
+    files) concurrently and return the responses in request order.
+
+    Duplicate requests share one search (and one response object); a failed
+    search returns {'error': ...} in its place instead of failing the batch.
+    `top_k` and `rerank` are the defaults for requests that don't set them.
+    """
+    concurrency = concurrency or int(os.getenv('SEARCH_BATCH_CONCURRENCY', DEFAULT_BATCH_CONCURRENCY))
+    unique: Dict[str, Dict[str, Any]] = {}
+    keys = []
+    for request in requests:
+        options = {'top_k': request.get('top_k', top_k), 'filter': request.get('filter'),
+                   'rerank': request.get('rerank', rerank)}
+        key = cache_key(request['query'], options['top_k'], options['filter'], options['rerank'])
+        unique.setdefault(key, {'query': request['query'], **options})
+        keys.append(key)
+
+    def run(options: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return backend.search(options['query'], top_k=options['top_k'],
+                                  filter=options['filter'], rerank=options['rerank'])
+        except Exception as e:
+            return {'error': f"{type(e).__name__}: {e}", 'hits': []}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(unique)))) as pool:
+        responses = dict(zip(unique, pool.map(run, unique.values())))
+    return [responses[key] for key in keys]
+
+def main(argv=None) -> int:
+    """Command-line entry point: print (or bump) the namespace generations."""
+    parser = argparse.ArgumentParser(description="Show the namespace generations that invalidate cached search results.")
+    parser.add_argument('--bump', metavar='NAMESPACE', help="Invalidate cached results for a namespace written outside the uploader")
+    args = parser.parse_args(argv)
+
+    path = default_generation_path()
+    if args.bump:
+        print(f"🔄 {args.bump}: generation {mark_namespace_written(args.bump, path)}")
+    generations = read_generations(path)
+    if not generations:
+        print(f"No uploads recorded in {path}")
+        return 0
+    for namespace, entry in generations.items():
+        print(f"  • {namespace}: generation {entry['generation']} (written {entry['written_at']})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
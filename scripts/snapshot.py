@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Corpus Snapshot
+Writes the validated corpus to one compressed file and reads it back by _id
+without parsing everything.
+
+Format (one file, so a snapshot is replaced with a single atomic rename and a
+reader never pairs new records with old offsets):
+    records   Independently zlib-compressed JSON blobs
+    index     JSON {"version", "count", "ids", "offsets", "lengths"}
+    footer    16 bytes: SNAPSHOT_MAGIC, then the index's byte offset (uint64 LE)
+
+Readers memory-map the file, so opening a snapshot only parses the small
+index and a lookup decompresses exactly one record. Several processes reading
+the same snapshot share its pages.
+
+Usage:
+    python scripts/snapshot.py export [--out PATH] [--only NAME ...]
+    python scripts/snapshot.py get ID [ID ...] [--snapshot PATH]
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SNAPSHOT_PATH = os.path.join(SCRIPT_DIR, 'data', 'corpus.snap')
+SNAPSHOT_VERSION = 2
+SNAPSHOT_MAGIC = b'CORPSNAP'
+FOOTER = struct.Struct('<8sQ')
+
+def default_snapshot_path() -> str:
+    """Snapshot location, overridable with CORPUS_SNAPSHOT."""
+    return os.getenv('CORPUS_SNAPSHOT', DEFAULT_SNAPSHOT_PATH)
+
+def write_snapshot(records: Iterable[Dict[str, Any]], path: str) -> int:
+    """
+    Write records to a snapshot, replacing any existing one atomically.
+
+    Records are streamed, so memory stays at one record plus the index.
+    Returns the number of records written.
+    """
+    ids, offsets, lengths = [], [], []
+    offset = 0
+    tmp_path = path + '.tmp'
+
+    with open(tmp_path, 'wb') as file:
+        for record in records:
+            blob = zlib.compress(json.dumps(record, ensure_ascii=False).encode('utf-8'), 6)
+            file.write(blob)
+            ids.append(record['_id'])
+            offsets.append(offset)
+            lengths.append(len(blob))
+            offset += len(blob)
+
+    index = {'version': SNAPSHOT_VERSION, 'count': len(ids), 'ids': ids, 'offsets': offsets, 'lengths': lengths}
+    with open(tmp_path, 'ab') as file:
+        file.write(json.dumps(index).encode('utf-8'))
+        file.write(FOOTER.pack(SNAPSHOT_MAGIC, offset))
+
+    os.replace(tmp_path, path)
+    return len(ids)
+
+class CorpusSnapshot:
+    """Memory-mapped, random-access reader for a corpus snapshot."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_snapshot_path()
+        self._file = open(self.path, 'rb')
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, index_offset = FOOTER.unpack(self._data[-FOOTER.size:]) if len(self._data) >= FOOTER.size else (b'', 0)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"{self.path} is not a version {SNAPSHOT_VERSION} snapshot; re-run: python scripts/snapshot.py export")
+            index = json.loads(self._data[index_offset:-FOOTER.size])
+            if index.get('version') != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported snapshot version {index.get('version')} in {self.path}")
+        except ValueError:
+            self.close()
+            raise
+
+        self.ids: List[str] = index['ids']
+        self._offsets = index['offsets']
+        self._lengths = index['lengths']
+        self._positions = {_id: i for i, _id in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, _id: str) -> bool:
+        return _id in self._positions
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for position in range(len(self.ids)):
+            yield self.record_at(position)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def position(self, _id: str) -> int:
+        """Row number of a record (KeyError if missing)."""
+        return self._positions[_id]
+
+    def record_at(self, position: int) -> Dict[str, Any]:
+        """Decompress the record stored at a row number."""
+        start = self._offsets[position]
+        return json.loads(zlib.decompress(self._data[start:start + self._lengths[position]]))
+
+    def get(self, _id: str) -> Optional[Dict[str, Any]]:
+        """Return a record by _id, or None if it is not in the snapshot."""
+        position = self._positions.get(_id)
+        return None if position is None else self.record_at(position)
+
+    def get_many(self, ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Return the records for the ids that exist, in the order requested."""
+        return [self.record_at(self._positions[_id]) for _id in ids if _id in self._positions]
+
+    def close(self) -> None:
+        self._data.close()
+        self._file.close()
+
+def export_snapshot(path: str, only: Optional[List[str]] = None) -> int:
+    """Load and validate all registered sources and write them to a snapshot."""
+    from sources import discover_sources, iter_source_records
+
+    specs = discover_sources()
+    if only:
+        specs = [spec for spec in specs if spec['name'] in only]
+    records = (record for spec in specs for record in iter_source_records(spec))
+    return write_snapshot(records, path)
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Export or read the corpus snapshot.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export = commands.add_parser('export', help="Write the validated corpus to a snapshot")
+    export.add_argument('--out', default=default_snapshot_path())
+    export.add_argument('--only', nargs='+', metavar='NAME', help="Export only these sources")
+
+    get = commands.add_parser('get', help="Print records by _id as JSON")
+    get.add_argument('ids', nargs='+')
+    get.add_argument('--snapshot', default=default_snapshot_path())
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        count = export_snapshot(args.out, args.only)
+        size = os.path.getsize(args.out)
+        print(f"\n✅ Wrote {count} records to {args.out} ({size / 1024:.0f} KB)")
+        return 0
+
+    with CorpusSnapshot(args.snapshot) as snapshot:
+        print(json.dumps(snapshot.get_many(args.ids), ensure_ascii=False, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
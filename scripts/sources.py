@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Data Source Registry
+Discovers, loads and validates every corpus that feeds the Pinecone index.
+
+Sources are listed in data/sources.json (override with SOURCES_CONFIG) as
+a name, a "module:function" loader and keyword options for it. Installed
+packages can add sources through the "network_graph_search.sources"
+entry-point group without touching this repository.
+
+A loader is any callable returning an iterable of raw records. Loading,
+parsing and validate_record run per source in a process pool, and finished
+batches are handed to the uploader through a bounded queue.
+"""
+
+import importlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import entry_points
+from itertools import chain
+from multiprocessing import Manager
+from queue import Full
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SOURCES_CONFIG = os.path.join(SCRIPT_DIR, 'data', 'sources.json')
+ENTRY_POINT_GROUP = 'network_graph_search.sources'
+
+JSON_READ_CHUNK = 64 * 1024  # Bytes read per step when streaming JSON files
+BATCH_SIZE = 90  # Stay under Pinecone's 96 limit
+QUEUE_POLL_SECONDS = 0.5  # How often a worker blocked on a full queue checks for a stop
+
+def _skip_whitespace(buffer: str, pos: int) -> int:
+    """Return the index of the next non-whitespace character."""
+    while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+        pos += 1
+    return pos
+
+class _JsonStream:
+    """Incremental reader that decodes one JSON value at a time from a file."""
+
+    def __init__(self, file):
+        self.file = file
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Read the next chunk, dropping already-consumed text. Returns False at EOF."""
+        chunk = self.file.read(JSON_READ_CHUNK)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ('' at EOF)."""
+        while True:
+            self.pos = _skip_whitespace(self.buffer, self.pos)
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        """Consume a single structural character."""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expected '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def array_items(self) -> Iterator[Any]:
+        """Yield the items of the array starting at the current position."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ']':
+                self.pos += 1
+                return
+            self.expect(',')
+
+def iter_json_items(file_path: str, key: Optional[str] = None) -> Iterator[Any]:
+    """
+    Stream the items of a JSON array without loading the whole file.
+
+    The array is either the top-level value or, when `key` is given,
+    the value of that key in a top-level object.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            stream = _JsonStream(file)
+            if key is None:
+                yield from stream.array_items()
+                return
+            stream.expect('{')
+            while stream.peek() not in ('}', ''):
+                name = stream.value()
+                stream.expect(':')
+                if name == key:
+                    yield from stream.array_items()
+                    return
+                stream.value()  # Skip sibling values such as test_info
+                if stream.peek() == ',':
+                    stream.pos += 1
+    except FileNotFoundError:
+        print(f"⚠️  Warning: {file_path} not found")
+    except json.JSONDecodeError as e:
+        print(f"❌ Error parsing JSON from {file_path}: {e}")
+
+def iter_batches(records: Iterable[Dict[str, Any]], batch_size: int = BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """Group a record stream into lists of at most `batch_size` records."""
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def validate_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Check that a record has _id and chunk_text (ValueError otherwise) and cap
+    its summary at 2000 characters. Every other field is passed through as is.
+    """
+    if not record.get('_id') or not record.get('chunk_text'):
+        raise ValueError(f"Record {record.get('_id', 'unknown')} must have _id and chunk_text fields")
+    
+    # Nothing else is truncated: chunk_text is split into passages at upload (chunking.py).
+    # Content and summary are served from the document store, not vector metadata; the
+    # summary is capped because it is shown as is and heads a long document's parent chunk_text.
+    MAX_SUMMARY_LENGTH = 2000       # Summaries are usually reasonable, don't truncate unless very long
+    
+    # Truncate summary if too long
+    if 'summary' in record and len(record.get('summary', '')) > MAX_SUMMARY_LENGTH:
+        original_length = len(record['summary'])
+        record['summary'] = record['summary'][:MAX_SUMMARY_LENGTH] + "..."
+        print(f"   ⚠️  Truncated summary for {record['_id']}: {original_length} → {len(record['summary'])} chars")
+    
+    return record
+
+def load_eu_articles(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream EU AI Act article records."""
+    print("\n📄 Loading EU AI Act Articles...")
+    
+    count = 0
+    for article in iter_json_items(path):
+        record = {
+            "_id": str(article['id']),
+            "chunk_text": f"{article['title']}. {article.get('summary', '')}. {article['content']}",
+            "category": "article",
+            "label": article['title'],
+            "type": "article",
+            "summary": article.get('summary', article['title']),
+            "content": article['content'],
+            "continent": article.get('continent', 'Europe'),
+            "country": 'European Union',
+            "sourceType": article.get('sourceType', 'Government'),
+            "connected_to": article.get('connected_to', []),
+            "url": article.get('url')
+        }
+        count += 1
+        yield record
+    
+    print(f"   ✅ Loaded {count} articles" if count else "   No articles found")
+
+def load_eu_recitals(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream EU AI Act recital records."""
+    print("\n📄 Loading EU AI Act Recitals...")
+    
+    count = 0
+    for recital in iter_json_items(path, key='recitals'):
+        record = {
+            "_id": str(recital['id']),
+            "chunk_text": f"{recital['title']}. {recital['content']}",
+            "category": "recital",
+            "label": recital['title'],
+            "type": "recital",
+            "summary": recital.get('title', ''),
+            "content": recital['content'],
+            "continent": recital.get('continent', 'Europe'),
+            "country": 'European Union',
+            "sourceType": recital.get('sourceType', 'Government'),
+            "url": recital.get('url')
+        }
+        count += 1
+        yield record
+    
+    print(f"   ✅ Loaded {count} recitals" if count else "   No recitals found")
+
+def load_canadian_data() -> Iterator[Dict[str, Any]]:
+    """Stream Canadian AI governance records."""
+    print("\n📄 Loading Canadian AI Governance Data...")
+    
+    # Import the canadian_records from data_canada.py
+    try:
+        from data_canada import canadian_records
+    except ImportError as e:
+        print(f"   ⚠️  Could not import canadian_data: {e}")
+        return
+    
+    try:
+        # Stream the records; iter_source_records validates them
+        count = 0
+        for record in canadian_records:
+            count += 1
+            yield record
+        print(f"   ✅ Loaded {count} Canadian records")
+    except Exception as e:
+        print(f"   ❌ Error loading Canadian data: {e}")
+
+def load_record_file(path: str, label: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Stream records that are already in upload schema from a {"records": [...]} file."""
+    print(f"\n📄 Loading {label or os.path.basename(path)}...")
+    
+    count = 0
+    for record in iter_json_items(path, key='records'):
+        count += 1
+        yield record
+    
+    print(f"   ✅ Loaded {count} records" if count else "   No records found")
+
+def resolve_loader(loader_path: str) -> Callable[..., Iterable[Dict[str, Any]]]:
+    """Import a loader from a "module:function" string."""
+    module_name, _, attr = loader_path.partition(':')
+    if not attr:
+        raise ValueError(f"Loader '{loader_path}' must look like 'module:function'")
+    return getattr(importlib.import_module(module_name), attr)
+
+def _resolve_paths(options: Dict[str, Any], base_dir: str) -> Dict[str, Any]:
+    """Make a relative 'path' option relative to the config file's directory."""
+    resolved = dict(options)
+    if 'path' in resolved and not os.path.isabs(resolved['path']):
+        resolved['path'] = os.path.join(base_dir, resolved['path'])
+    return resolved
+
+def discover_sources(config_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Return source specs ({'name', 'loader', 'options'}) in upload order.
+    
+    Config entries come first; entry-point sources are appended unless a config
+    entry with the same name already exists. Entries with "enabled": false are skipped.
+    """
+    config_path = config_path or os.getenv('SOURCES_CONFIG', DEFAULT_SOURCES_CONFIG)
+    specs = []
+    
+    if os.path.exists(config_path):
+        base_dir = os.path.dirname(os.path.abspath(config_path))
+        with open(config_path, 'r', encoding='utf-8') as file:
+            for entry in json.load(file).get('sources', []):
+                specs.append({
+                    'name': entry['name'],
+                    'loader': entry['loader'],
+                    'options': _resolve_paths(entry.get('options', {}), base_dir),
+                    'enabled': entry.get('enabled', True),
+                })
+    else:
+        print(f"⚠️  Warning: {config_path} not found")
+    
+    known = {spec['name'] for spec in specs}
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        if ep.name not in known:
+            specs.append({'name': ep.name, 'loader': ep.value, 'options': {}, 'enabled': True})
+    
+    return [spec for spec in specs if spec['enabled']]
+
+def iter_source_records(spec: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Load one source and validate each record as it is produced."""
+    loader = resolve_loader(spec['loader'])
+    for record in loader(**spec['options']):
+        yield validate_record(record)
+
+def _put_unless_stopped(queue, item, stop) -> bool:
+    """Put an item on the queue, giving up once the consumer sets `stop`. Returns whether it was queued."""
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=QUEUE_POLL_SECONDS)
+            return True
+        except Full:
+            continue
+    return False
+
+def _produce_source_batches(spec: Dict[str, Any], queue, stop, batch_size: int) -> None:
+    """Worker: load and validate one source, pushing full batches onto the queue."""
+    try:
+        for batch in iter_batches(iter_source_records(spec), batch_size):
+            if not _put_unless_stopped(queue, batch, stop):
+                return
+    finally:
+        _put_unless_stopped(queue, None, stop)  # Signal completion so the consumer never hangs
+
+def iter_source_batches(specs: List[Dict[str, Any]], workers: int = 1,
+                        batch_size: int = BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield upload batches for all sources.
+    
+    With one worker, sources are streamed in order and batches fill across source
+    boundaries. With more, each source runs in its own process and records are
+    re-batched as they arrive; the bounded queue keeps memory at a few batches.
+    If the consumer stops early (an upload error, or closing the generator),
+    workers are told to stop and pending sources are cancelled.
+    """
+    if workers <= 1 or len(specs) <= 1:
+        yield from iter_batches(chain.from_iterable(iter_source_records(spec) for spec in specs), batch_size)
+        return
+    
+    with Manager() as manager, ProcessPoolExecutor(max_workers=workers) as pool:
+        queue = manager.Queue(maxsize=workers * 2)
+        stop = manager.Event()
+        futures = [pool.submit(_produce_source_batches, spec, queue, stop, batch_size) for spec in specs]
+        
+        try:
+            # Re-batch so small sources still fill full upload batches
+            yield from iter_batches(_drain(queue, len(futures)), batch_size)
+        except BaseException:
+            # Workers blocked on the full queue would keep the pool from shutting down
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        
+        # Surface any loader errors raised in the workers
+        for future in futures:
+            future.result()
+
+def _drain(queue, producers: int) -> Iterator[Dict[str, Any]]:
+    """Yield records from worker batches until every producer has finished."""
+    while producers:
+        batch = queue.get()
+        if batch is None:
+            producers -= 1
+            continue
+        yield from batch
@@ -1,31 +1,45 @@
 #!/usr/bin/env python3
-import os
+"""
+Search smoke test and load generator.
+
+Usage:
+    python scripts/test_pinecone_search.py
+        Run the sample queries once against Pinecone and print the hits.
+
+    python scripts/test_pinecone_search.py load [--queries FILE] [--backend pinecone|local]
+            [--concurrency N] [--rate RPS] [--requests N] [--top-k K] [--rerank] [--cache]
+            [--report PATH]
+        Replay a query file at a fixed request rate (open loop; 0 = as fast as the
+        workers allow) and report latency percentiles, throughput, errors and
+        per-stage timings. The local backend (search_backends.py) runs offline;
+        --cache puts the result cache (search_client.py) in front of the backend.
+
+Query files hold one query per line, either plain text or JSON:
+    {"query": "...", "top_k": 20, "filter": {"country": {"$in": ["Canada"]}}}
+"""
+
+import argparse
 import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
-from pinecone import Pinecone
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+import numpy as np
+
+from search_backends import BACKENDS, get_backend
+from search_client import search_batch
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_QUERIES_PATH = os.path.join(SCRIPT_DIR, 'data', 'search_queries.jsonl')
+PERCENTILES = (50, 90, 95, 99)
 
 def test_pinecone_search():
     """Test Pinecone search functionality with the uploaded data."""
-    # Environment Configuration
-    config = {
-        'api_key': os.getenv("PINECONE_API_KEY"),
-        'index_name': os.getenv("PINECONE_INDEX_NAME", "network-graph"),
-        'namespace': os.getenv("PINECONE_NAMESPACE", "example-namespace"),
-    }
-    
-    if not config['api_key']:
-        raise ValueError("PINECONE_API_KEY environment variable not set")
-    
-    # Initialize Pinecone client
-    pc = Pinecone(api_key=config['api_key'])
-    
-    # Target the index
-    index = pc.Index(config['index_name'])
-    
+    backend = get_backend('pinecone')
+
     # Define test queries
     test_queries = [
         "artificial intelligence regulation",
@@ -33,49 +47,200 @@ def test_pinecone_search():
         "high-risk AI systems",
         "transparency obligations"
     ]
-    
+
     print("Testing Pinecone search functionality...\n")
-    
-    for query in test_queries:
+
+    # Search the index for all queries at once
+    responses = search_batch(backend, [{'query': query} for query in test_queries], top_k=5)
+
+    for query, response in zip(test_queries, responses):
         print(f"Query: '{query}'")
-        
+
         try:
-            # Search the index
-            results = index.search(
-                namespace=config['namespace'],
-                query={
-                    "top_k": 5,
-                    "inputs": {
-                        'text': query
-                    }
-                }
-            )
-            
+            if 'error' in response:
+                raise RuntimeError(response['error'])
+            hits = response['hits']
+
             # Print the results
-            print(f"Found {len(results['result']['hits'])} results:")
-            for i, hit in enumerate(results['result']['hits'], 1):
+            print(f"Found {len(hits)} results:")
+            for i, hit in enumerate(hits, 1):
                 print(f"  {i}. ID: {hit['_id']:<10} | Score: {hit['_score']:.3f}")
                 print(f"     Type: {hit['fields'].get('type', 'unknown')} | Category: {hit['fields'].get('category', 'unknown')}")
                 text = hit['fields'].get('chunk_text', '')
                 if text:
                     print(f"     Text: {text[:100]}...")
                 print()
-                
+
         except Exception as e:
             print(f"Search failed: {e}")
-        
+
         print("-" * 50)
-    
+
     # Test index stats
     try:
-        stats = index.describe_index_stats()
+        stats = backend.index.describe_index_stats()
         print("\nIndex Statistics:")
         print(f"  Total vectors: {stats.get('total_vector_count', 0)}")
-        print(f"  Namespace '{config['namespace']}': {stats.get('namespaces', {}).get(config['namespace'], {}).get('vector_count', 0)} vectors")
+        print(f"  Namespace '{backend.namespace}': {stats.get('namespaces', {}).get(backend.namespace, {}).get('vector_count', 0)} vectors")
         print(f"  Dimension: {stats.get('dimension', 'unknown')}")
         print(f"  Index fullness: {stats.get('index_fullness', 0):.1%}")
     except Exception as e:
         print(f"Error getting index stats: {e}")
 
+def load_queries(path: str) -> List[Dict[str, Any]]:
+    """Read a query file: one plain-text or JSON query per line."""
+    queries = []
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            queries.append(json.loads(line) if line.startswith('{') else {'query': line})
+    return queries
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Mean, percentiles and max of a list of seconds, in milliseconds."""
+    if not values:
+        return {}
+    ms = np.asarray(values) * 1000
+    summary = {'mean': float(ms.mean())}
+    summary.update({f"p{p}": float(np.percentile(ms, p)) for p in PERCENTILES})
+    summary['max'] = float(ms.max())
+    return summary
+
+def run_load(backend, queries: List[Dict[str, Any]], requests: int, concurrency: int = 4,
+             rate: float = 0.0, top_k: int = 10, rerank: bool = False) -> Dict[str, Any]:
+    """
+    Send `requests` searches cycling through `queries`.
+
+    With a rate, request i is due at start + i / rate whether or not earlier ones
+    have finished (open loop), so a slow backend shows up as latency and start lag
+    instead of silently lowering the offered load.
+    """
+    samples = []
+    lock = threading.Lock()
+
+    def send(i: int, due: float):
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        query = queries[i % len(queries)]
+        started = time.perf_counter()
+        sample = {'lag': max(0.0, started - due), 'error': None, 'timings': {}, 'hits': 0}
+        try:
+            result = backend.search(query['query'], top_k=query.get('top_k', top_k),
+                                    filter=query.get('filter'), rerank=query.get('rerank', rerank))
+            sample['timings'] = result['timings']
+            sample['hits'] = len(result['hits'])
+        except Exception as e:
+            sample['error'] = type(e).__name__
+        sample['latency'] = time.perf_counter() - started
+        with lock:
+            samples.append(sample)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for i in range(requests):
+            pool.submit(send, i, start + (i / rate if rate else 0))
+    elapsed = time.perf_counter() - start
+
+    ok = [sample for sample in samples if not sample['error']]
+    errors: Dict[str, int] = {}
+    for sample in samples:
+        if sample['error']:
+            errors[sample['error']] = errors.get(sample['error'], 0) + 1
+    stages = sorted({stage for sample in ok for stage in sample['timings']})
+
+    return {
+        'backend': backend.name,
+        'config': {'requests': requests, 'concurrency': concurrency, 'rate': rate,
+                   'top_k': top_k, 'rerank': rerank, 'queries': len(queries)},
+        'elapsed_s': elapsed,
+        'throughput_rps': len(samples) / elapsed if elapsed else 0.0,
+        'errors': {'count': len(samples) - len(ok), 'rate': (len(samples) - len(ok)) / max(len(samples), 1), 'by_type': errors},
+        'latency_ms': summarize([sample['latency'] for sample in ok]),
+        'stages_ms': {stage: summarize([s['timings'][stage] for s in ok if stage in s['timings']]) for stage in stages},
+        'start_lag_ms': summarize([sample['lag'] for sample in samples]),
+        'mean_hits': float(np.mean([sample['hits'] for sample in ok])) if ok else 0.0,
+        'cache': backend.stats() if hasattr(backend, 'stats') else None,
+    }
+
+def print_load_report(report: Dict[str, Any]) -> None:
+    """Human-readable summary of a load report."""
+    config = report['config']
+    print("\n" + "=" * 70)
+    print(f"📈 SEARCH LOAD TEST ({report['backend']})")
+    print("=" * 70)
+    print(f"\n{config['requests']} requests, concurrency {config['concurrency']}, "
+          f"rate {config['rate'] or 'unlimited'}{' req/s' if config['rate'] else ''}, top_k {config['top_k']}"
+          f"{', rerank' if config['rerank'] else ''}")
+    print(f"Throughput: {report['throughput_rps']:.1f} req/s over {report['elapsed_s']:.2f}s")
+    print(f"Errors: {report['errors']['count']} ({report['errors']['rate']:.1%}) {report['errors']['by_type'] or ''}")
+
+    def row(name, summary):
+        if summary:
+            print(f"  • {name:<10} " + "  ".join(f"{key} {value:7.2f}" for key, value in summary.items()))
+
+    print("\nLatency (ms):")
+    row('total', report['latency_ms'])
+    for stage, summary in report['stages_ms'].items():
+        row(stage, summary)
+    row('start lag', report['start_lag_ms'])
+
+    cache = report.get('cache')
+    if cache:
+        print(f"\nCache: {cache['hits']} hits / {cache['misses']} misses ({cache['hit_rate']:.1%}), "
+              f"{cache['saved_s'] * 1000:.1f}ms saved, {cache['evictions']} evictions, "
+              f"{cache['expired']} expired, {cache['invalidations']} invalidations")
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Search smoke test and load generator.")
+    commands = parser.add_subparsers(dest='command')
+
+    load = commands.add_parser('load', help="Replay a query file under load and report latency")
+    load.add_argument('--queries', default=DEFAULT_QUERIES_PATH, help="Query file (text or JSON lines)")
+    load.add_argument('--backend', choices=BACKENDS, default=os.getenv('SEARCH_BACKEND', 'pinecone'))
+    load.add_argument('--concurrency', type=int, default=4, help="Requests in flight")
+    load.add_argument('--rate', type=float, default=0.0, help="Requests per second (0 = unlimited)")
+    load.add_argument('--requests', type=int, default=100, help="Total requests (queries are cycled)")
+    load.add_argument('--top-k', type=int, default=10)
+    load.add_argument('--rerank', action='store_true', help="Rerank results (Pinecone only)")
+    load.add_argument('--cache', action='store_true', help="Serve repeated queries from the result cache")
+    load.add_argument('--warmup', type=int, default=5, help="Unmeasured requests sent first")
+    load.add_argument('--report', metavar='PATH', help="Also write the report as JSON")
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    args = parse_args(argv)
+    if args.command != 'load':
+        test_pinecone_search()
+        return 0
+
+    queries = load_queries(args.queries)
+    if not queries:
+        print(f"❌ No queries in {args.queries}")
+        return 1
+
+    print(f"🔌 Preparing {args.backend} backend...")
+    backend = get_backend(args.backend)
+    if args.cache:
+        from search_client import SearchClient
+        backend = SearchClient(backend)
+    if args.warmup:
+        run_load(backend, queries, args.warmup, concurrency=1, top_k=args.top_k, rerank=args.rerank)
+
+    report = run_load(backend, queries, args.requests, concurrency=args.concurrency,
+                      rate=args.rate, top_k=args.top_k, rerank=args.rerank)
+    print_load_report(report)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"\n💾 Report saved to: {args.report}")
+
+    return 1 if report['errors']['count'] else 0
+
 if __name__ == "__main__":
-    test_pinecone_search()
+    sys.exit(main())
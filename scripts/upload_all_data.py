@@ -4,89 +4,69 @@ Unified Data Upload Script
 Uploads all data sources to Pinecone in a single command.
 
 Usage:
-    python scripts/upload_all_data.py
+    python scripts/upload_all_data.py [--workers N] [--only NAME ...]
+    python scripts/upload_all_data.py --from-snapshot [PATH]
+    python scripts/upload_all_data.py --changed | --ids ID [ID ...]
 
-This script consolidates:
+Sources are registered in data/sources.json (see sources.py). By default:
 - EU AI Act Articles (from eu_ai_act.json)
 - EU AI Act Recitals (from test_recitals_1_to_180.json)
-- Canadian AI Governance Data (from canada_data.py)
-- IAPP AI Governance Articles (from more_data.py)
+- Canadian AI Governance Data (from data_canada.py)
+- IAPP AI Governance Articles (from iapp_articles.json)
 """
 
+import argparse
+import heapq
 import json
 import os
 import sys
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Set, Tuple
 from pinecone import Pinecone
 from dotenv import load_dotenv
 
+from chunking import PASSAGE_SEPARATOR, expand_passages, passage_records
+from document_index import DocumentIndex, default_document_index_path, save_upload
+from document_store import finish_upload, lean_record, open_for_upload
+from graph_index import default_graph_index_path, save_upload as save_graph_upload
+from scrape_manifest import default_manifest
+from search_client import mark_namespace_written
+from snapshot import CorpusSnapshot, default_snapshot_path
+from sources import BATCH_SIZE, discover_sources, iter_batches, iter_source_batches, resolve_loader, validate_record
+
 # Load environment variables
 load_dotenv()
 
-def load_json_file(file_path: str) -> Any:
-    """Load JSON data from a file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    except FileNotFoundError:
-        print(f"⚠️  Warning: {file_path} not found")
-        return None
-    except json.JSONDecodeError as e:
-        print(f"❌ Error parsing JSON from {file_path}: {e}")
-        return None
+INDEX_READY_TIMEOUT = 300  # Seconds to wait for a new index
+INGEST_TIMEOUT = 300       # Seconds to wait for upserted records to become queryable
+INGEST_SAMPLE_SIZE = 20    # Most recently sent records fetched back to confirm ingest
+PINECONE_METADATA_LIMIT = 40960  # Bytes of metadata allowed per record
+SIZE_BUCKETS = [1024 * 2 ** i for i in range(6)]  # 1 KB .. 32 KB histogram edges
+TRUNCATED_FIELDS = ('summary',)  # Fields validate_record may shorten
+DELETE_BATCH_SIZE = 1000
 
-def validate_record(record: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate that a record has required fields and truncate large content."""
-    if not record.get('_id') or not record.get('chunk_text'):
-        raise ValueError(f"Record {record.get('_id', 'unknown')} must have _id and chunk_text fields")
-    
-    # Pinecone metadata limit is 40KB (40,960 bytes) for ALL metadata combined
-    # This includes JSON serialization overhead, field names, and all fields
-    # Being very conservative to account for:
-    # - JSON encoding overhead (~20-30% extra)
-    # - UTF-8 multi-byte characters
-    # - All other metadata fields (label, summary, category, etc.)
-    
-    MAX_CHUNK_TEXT_LENGTH = 10000   # Used for embeddings - can be shorter
-    MAX_CONTENT_LENGTH = 15000      # Used for display
-    MAX_SUMMARY_LENGTH = 2000       # Summaries are usually reasonable, don't truncate unless very long
-    
-    # Truncate chunk_text (used for embedding generation)
-    if len(record['chunk_text']) > MAX_CHUNK_TEXT_LENGTH:
-        original_length = len(record['chunk_text'])
-        record['chunk_text'] = record['chunk_text'][:MAX_CHUNK_TEXT_LENGTH]
-        print(f"   ⚠️  Truncated chunk_text for {record['_id']}: {original_length} → {len(record['chunk_text'])} chars")
-    
-    # Truncate content (used for display)
-    if 'content' in record and len(record['content']) > MAX_CONTENT_LENGTH:
-        original_length = len(record['content'])
-        record['content'] = record['content'][:MAX_CONTENT_LENGTH] + "... [Content truncated]"
-        print(f"   ⚠️  Truncated content for {record['_id']}: {original_length} → {len(record['content'])} chars")
-    
-    # Truncate summary if too long
-    if 'summary' in record and len(record.get('summary', '')) > MAX_SUMMARY_LENGTH:
-        original_length = len(record['summary'])
-        record['summary'] = record['summary'][:MAX_SUMMARY_LENGTH] + "..."
-        print(f"   ⚠️  Truncated summary for {record['_id']}: {original_length} → {len(record['summary'])} chars")
+def poll_until(check: Callable[[], Any], timeout: float, initial_delay: float = 0.5,
+               max_delay: float = 10.0) -> Tuple[bool, Any]:
+    """
+    Call `check` with exponential backoff until it returns a truthy value or the deadline passes.
     
-    # Estimate total metadata size (rough approximation)
-    # Serialize to JSON to get actual byte size
-    import json
-    metadata_size = len(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+    Returns (succeeded, last value returned by check).
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
     
-    if metadata_size > 40000:  # Warning threshold
-        print(f"   ⚠️  WARNING: {record['_id']} metadata size is {metadata_size} bytes (limit: 40960)")
-        # If still too large, aggressively truncate content further
-        if metadata_size > 40000:
-            record['content'] = record.get('content', '')[:8000] + "... [Truncated]"
-            record['chunk_text'] = record['chunk_text'][:8000]
-            print(f"   🔧 Aggressively truncated {record['_id']} to fit within limits")
-    
-    return record
+    while True:
+        result = check()
+        if result:
+            return True, result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False, result
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
 
 def create_pinecone_index(pc: Pinecone, index_name: str) -> None:
-    """Create Pinecone index if it doesn't exist."""
+    """Create Pinecone index if it doesn't exist and wait until it is ready."""
     if not pc.has_index(index_name):
         print(f"🔧 Creating new index: {index_name}")
         
@@ -97,199 +77,268 @@ def create_pinecone_index(pc: Pinecone, index_name: str) -> None:
             embed={
                 "model": "llama-text-embed-v2",
                 "field_map": {"text": "chunk_text"}
-            }
+            },
+            timeout=-1  # Don't block in the client; poll below with backoff
         )
         
         print("⏳ Waiting for index to be ready...")
-        max_wait = 300  # 5 minutes max
-        start_time = time.time()
-        
-        while time.time() - start_time < max_wait:
-            try:
-                index = pc.Index(index_name)
-                stats = index.describe_index_stats()
-                print(f"✅ Index {index_name} is ready!")
-                break
-            except Exception:
-                print("   Index still initializing...")
-                time.sleep(10)
-        else:
-            raise TimeoutError(f"Index {index_name} did not become ready within {max_wait} seconds")
+        ready, _ = poll_until(lambda: pc.describe_index(index_name).status.ready, INDEX_READY_TIMEOUT)
+        if not ready:
+            raise TimeoutError(f"Index {index_name} did not become ready within {INDEX_READY_TIMEOUT} seconds")
+        print(f"✅ Index {index_name} is ready!")
     else:
         print(f"✅ Index {index_name} already exists")
 
-def load_eu_articles(script_dir: str) -> List[Dict[str, Any]]:
-    """Load EU AI Act articles."""
-    print("\n📄 Loading EU AI Act Articles...")
-    file_path = os.path.join(script_dir, 'data', 'eu_ai_act.json')
-    articles_data = load_json_file(file_path)
-    
-    if not articles_data:
-        print("   No articles found")
-        return []
-    
-    records = []
-    for article in articles_data:
-        record = {
-            "_id": str(article['id']),
-            "chunk_text": f"{article['title']}. {article.get('summary', '')}. {article['content']}",
-            "category": "article",
-            "label": article['title'],
-            "type": "article",
-            "summary": article.get('summary', article['title']),
-            "content": article['content'],
-            "continent": article.get('continent', 'Europe'),
-            "country": 'European Union',
-            "sourceType": article.get('sourceType', 'Government'),
-            "connected_to": article.get('connected_to', []),
-            "url": article.get('url')
-        }
-        records.append(validate_record(record))
-    
-    print(f"   ✅ Loaded {len(records)} articles")
-    return records
+def namespace_vector_count(stats, namespace: str) -> int:
+    """Read a namespace's vector count from describe_index_stats output."""
+    return stats.get('namespaces', {}).get(namespace, {}).get('vector_count', 0)
 
-def load_eu_recitals(script_dir: str) -> List[Dict[str, Any]]:
-    """Load EU AI Act recitals."""
-    print("\n📄 Loading EU AI Act Recitals...")
-    file_path = os.path.join(script_dir, 'data', 'test_recitals_1_to_180.json')
-    recitals_data = load_json_file(file_path)
+def wait_for_ingest(index, namespace: str, expected: int, sample: Optional[Dict[str, str]] = None,
+                    timeout: float = INGEST_TIMEOUT):
+    """
+    Wait until the upload is queryable and return the final stats.
     
-    if not recitals_data:
-        print("   No recitals found")
-        return []
+    The namespace must hold at least `expected` vectors, and every id in `sample`
+    ({id: chunk_text sent}) must fetch back with the text that was sent. The count
+    alone says nothing for re-uploads into a populated namespace, where it is already
+    reached before any write lands; the sample shows the new versions are visible.
+    """
+    def sample_visible() -> bool:
+        if not sample:
+            return True
+        vectors = index.fetch(ids=list(sample), namespace=namespace).vectors
+        return all(_id in vectors and (vectors[_id].metadata or {}).get('chunk_text', text) == text
+                   for _id, text in sample.items())
     
-    recitals = recitals_data.get('recitals', [])
-    records = []
+    def check():
+        stats = index.describe_index_stats()
+        return stats if namespace_vector_count(stats, namespace) >= expected and sample_visible() else None
     
-    for recital in recitals:
-        record = {
-            "_id": str(recital['id']),
-            "chunk_text": f"{recital['title']}. {recital['content']}",
-            "category": "recital",
-            "label": recital['title'],
-            "type": "recital",
-            "summary": recital.get('title', ''),
-            "content": recital['content'],
-            "continent": recital.get('continent', 'Europe'),
-            "country": 'European Union',
-            "sourceType": recital.get('sourceType', 'Government'),
-            "url": recital.get('url')
-        }
-        records.append(validate_record(record))
+    start = time.monotonic()
+    done, stats = poll_until(check, timeout)
+    if done:
+        print(f"✅ {expected} records queryable after {time.monotonic() - start:.1f}s")
+        return stats
     
-    print(f"   ✅ Loaded {len(records)} recitals")
-    return records
+    stats = index.describe_index_stats()
+    print(f"⚠️  Upload not fully visible after {timeout}s: {namespace_vector_count(stats, namespace)}/{expected} vectors, "
+          f"sampled records {'current' if sample_visible() else 'not yet current'}")
+    return stats
 
-def load_canadian_data() -> List[Dict[str, Any]]:
-    """Load Canadian AI governance data."""
-    print("\n📄 Loading Canadian AI Governance Data...")
+def upload_batches(index, namespace: str, batches: Iterable[List[Dict[str, Any]]]) -> int:
+    """
+    Upload batches to Pinecone as soon as they are produced.
     
-    # Import the canadian_records from data_canada.py
-    try:
-        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-        from data_canada import canadian_records
+    Returns the number of records sent.
+    """
+    total_records = 0
+    
+    for batch_num, batch in enumerate(batches, start=1):
+        # Small delay between batches
+        if batch_num > 1:
+            time.sleep(2)
         
-        # Validate each record
-        validated_records = [validate_record(record) for record in canadian_records]
-        print(f"   ✅ Loaded {len(validated_records)} Canadian records")
-        return validated_records
-    except ImportError as e:
-        print(f"   ⚠️  Could not import canadian_data: {e}")
-        return []
-    except Exception as e:
-        print(f"   ❌ Error loading Canadian data: {e}")
-        return []
+        print(f"   📤 Batch {batch_num} ({len(batch)} records)...")
+        index.upsert_records(namespace, batch)
+        total_records += len(batch)
+    
+    return total_records
 
-def load_iapp_data() -> List[Dict[str, Any]]:
-    """Load IAPP AI governance articles."""
-    print("\n📄 Loading IAPP Data...")
+def collect_index_rows(batches: Iterable[List[Dict[str, Any]]],
+                       rows: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    """Pass batches through, keeping what the graph and document indexes need from each record."""
+    for batch in batches:
+        rows.extend({'_id': record['_id'], 'connected_to': record.get('connected_to') or [],
+                     **DocumentIndex.row(record)} for record in batch)
+        yield batch
+
+def passage_batches(batches: Iterable[List[Dict[str, Any]]], sent_ids: Set[str],
+                    sample: Optional[Dict[str, str]] = None) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Re-batch records with long documents expanded into passages and trimmed to their
+    metadata (lean_record), recording every vector id sent.
     
-    # Define IAPP records inline (from more_data.py)
-    # Article 1
-    article_content_1 = """Ankit Gupta
+    `sample` collects {id: chunk_text} for the last record of each batch, keeping the
+    INGEST_SAMPLE_SIZE most recent, for wait_for_ingest to check.
+    """
+    vectors = (lean_record(vector) for vector in expand_passages(record for batch in batches for record in batch))
+    for batch in iter_batches(vectors):
+        sent_ids.update(record['_id'] for record in batch)
+        if sample is not None:
+            sample.pop(batch[-1]['_id'], None)
+            sample[batch[-1]['_id']] = batch[-1]['chunk_text']
+            while len(sample) > INGEST_SAMPLE_SIZE:
+                sample.pop(next(iter(sample)))
+        yield batch
+
+def prune_stale_passages(index, namespace: str, sent_ids: Set[str], documents: Optional[Set[str]] = None) -> int:
+    """
+    Delete passage vectors that were not part of this upload (a document got shorter or unchunked).
 
-Contributor
+    A full upload (documents=None) scans the namespace; a partial one only lists the
+    passages of `documents`, the records it uploaded, so other documents' passages survive.
+    Returns the number of vectors deleted.
+    """
+    prefixes = [None] if documents is None else [f"{_id}{PASSAGE_SEPARATOR}" for _id in sorted(documents)]
+    stale = []
+    for prefix in prefixes:
+        pages = index.list(namespace=namespace, prefix=prefix) if prefix else index.list(namespace=namespace)
+        for page in pages:
+            stale.extend(_id for _id in page if PASSAGE_SEPARATOR in _id and _id not in sent_ids)
+    
+    for start in range(0, len(stale), DELETE_BATCH_SIZE):
+        index.delete(ids=stale[start:start + DELETE_BATCH_SIZE], namespace=namespace)
+    return len(stale)
 
-AIGP, CIPP/US, CIPM, FIP
+def only_ids(batches: Iterable[List[Dict[str, Any]]], ids: Set[str]) -> Iterator[List[Dict[str, Any]]]:
+    """Re-batch just the records whose _id is in `ids`."""
+    return iter_batches(record for batch in batches for record in batch if record['_id'] in ids)
 
-9 Minute Read
+def json_size(value: Any) -> int:
+    """UTF-8 byte size of a value as it is serialized in the request body."""
+    return len(json.dumps(value, ensure_ascii=False).encode('utf-8'))
 
-Editor's note: The IAPP is policy neutral. We publish contributed opinion and analysis pieces to enable our members to hear a broad spectrum of views in our domains.
+SIZE_BUCKET_LABELS = [f"{lower // 1024}-{edge // 1024}KB" for lower, edge in zip([0] + SIZE_BUCKETS, SIZE_BUCKETS)] \
+    + [f">={SIZE_BUCKETS[-1] // 1024}KB"]
 
-Artificial intelligence systems have rapidly transitioned from the lab to core business operations — bringing their associated risks along with them.
+def size_bucket(size: int) -> str:
+    """Histogram bucket label for a byte size."""
+    for edge, label in zip(SIZE_BUCKETS, SIZE_BUCKET_LABELS):
+        if size < edge:
+            return label
+    return SIZE_BUCKET_LABELS[-1]
 
-Not long ago, AI governance conversations centered on checklists for ethics, bias and model transparency. In 2025, governance teams find themselves confronted with real-time incidents that resemble those of cybersecurity or crisis management.
+def iter_profiled_records(specs: List[Dict[str, Any]], report: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Load and validate every source in order, recording payload statistics as records pass."""
+    largest = report.setdefault('_largest_heap', [])
+    for spec in specs:
+        loader = resolve_loader(spec['loader'])
+        report['sources'][spec['name']] = 0
+        for raw in loader(**spec['options']):
+            original = {field: raw.get(field) for field in TRUNCATED_FIELDS}
+            record = validate_record(raw)
+            report['sources'][spec['name']] += 1
+            
+            for field in TRUNCATED_FIELDS:
+                if record.get(field) != original[field]:
+                    report['truncations'][field] = report['truncations'].get(field, 0) + 1
+            for field, value in record.items():
+                histogram = report['field_sizes'].setdefault(field, {})
+                bucket = size_bucket(json_size(value))
+                histogram[bucket] = histogram.get(bucket, 0) + 1
+            
+            size = max(json_size(lean_record(vector)) for vector in passage_records(record))
+            if size > PINECONE_METADATA_LIMIT:
+                report['oversized'].append(record['_id'])
+            heapq.heappush(largest, (size, record['_id']))
+            if len(largest) > 10:
+                heapq.heappop(largest)
+            yield record
 
-From AI models unpredictably drifting off course to employees inadvertently leaking data into chatbots, and even deepfakes duping staff — these risks are no longer hypothetical. They're happening, often in highly regulated environments where they were least expected."""
+def dry_run(specs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the exact upload batches without touching the network and report on their payloads."""
+    report = {'sources': {}, 'field_sizes': {}, 'truncations': {}, 'oversized': []}
+    request_sizes = []
+    vector_count = 0
     
-    record1 = {
-        "_id": 'IAPP_1',
-        "chunk_text": "Model drift, data leaks and deepfakes: Rethinking AI governance in the age of autonomous risk. " + article_content_1,
-        "category": "guide",
-        "label": "Model drift, data leaks and deepfakes: Rethinking AI governance in the age of autonomous risk",
-        "type": "article",
-        "summary": "Model drift, data leaks and deepfakes: Rethinking AI governance in the age of autonomous risk",
-        "content": article_content_1,
-        "continent": 'North America',
-        "country": 'USA',
-        "sourceType": 'NGO',
-        "url": "https://iapp.org/news/a/model-drift-data-leaks-and-deepfakes-rethinking-ai-governance-in-the-age-of-autonomous-risk"
-    }
+    vectors = (lean_record(vector) for vector in expand_passages(iter_profiled_records(specs, report)))
+    for batch in iter_batches(vectors):
+        request_sizes.append(json_size(batch))
+        vector_count += len(batch)
     
-    # Article 2
-    article_content_2 = """US State AI Governance Legislation Tracker
-This tracker focuses on cross-sectoral AI governance bills that apply to private sector organizations.
-
-Last updated: 15 July 2025
+    largest = sorted(report.pop('_largest_heap'), reverse=True)
+    report['largest_records'] = [{'_id': _id, 'bytes': size} for size, _id in largest]
+    report['total_records'] = sum(report['sources'].values())
+    report['requests'] = {
+        'count': len(request_sizes),
+        'batch_size': BATCH_SIZE,
+        'vector_records': vector_count,
+        'total_bytes': sum(request_sizes),
+        'max_bytes': max(request_sizes, default=0),
+    }
+    return report
 
-As with seemingly every aspect of AI, legislative activity related to potential AI risks and harms has moved with unprecedented speed. Often it can take decades for policymakers to begin responding to new technologies with targeted laws. But after generative AI captured the world's attention, it took only a matter of months for U.S. state legislatures to consider responsive legislation."""
+def print_dry_run_report(report: Dict[str, Any]) -> None:
+    """Pretty-print a dry-run report."""
+    print("\n" + "=" * 70)
+    print("🧪 DRY RUN REPORT (no network access)")
+    print("=" * 70)
     
-    record2 = {
-        "_id": 'IAPP_2',
-        "chunk_text": "US State AI Governance Legislation Tracker. " + article_content_2,
-        "category": "tracker",
-        "label": "US State AI Governance Legislation Tracker",
-        "type": "article",
-        "summary": "A comprehensive tracker monitoring unprecedented speed of US state AI legislation development, focusing on cross-sectoral laws directly impacting private sector organizations.",
-        "content": article_content_2,
-        "continent": 'North America',
-        "country": 'USA',
-        "sourceType": 'NGO',
-        "url": "https://iapp.org/resources/article/us-state-ai-governance-legislation-tracker/"
-    }
+    print("\nRecords per source:")
+    for name, count in report['sources'].items():
+        print(f"  • {name}: {count}")
+    print(f"  • Total: {report['total_records']}")
     
-    records = [validate_record(record1), validate_record(record2)]
-    print(f"   ✅ Loaded {len(records)} IAPP records")
-    return records
-
-def upload_records_batch(index, namespace: str, records: List[Dict[str, Any]], source_name: str) -> None:
-    """Upload records to Pinecone in batches."""
-    if not records:
-        print(f"   ⚠️  No records to upload for {source_name}")
-        return
+    print("\nField size histograms (bytes):")
+    for field, histogram in report['field_sizes'].items():
+        buckets = ', '.join(f"{label}: {histogram[label]}" for label in SIZE_BUCKET_LABELS if label in histogram)
+        print(f"  • {field}: {buckets}")
     
-    print(f"\n📤 Uploading {len(records)} {source_name} records...")
+    print("\nTruncations:")
+    for field in TRUNCATED_FIELDS:
+        print(f"  • {field}: {report['truncations'].get(field, 0)}")
     
-    batch_size = 90  # Stay under Pinecone's 96 limit
-    total_records = len(records)
+    print("\nLargest records (biggest vector record per document):")
+    for item in report['largest_records']:
+        print(f"  • {item['_id']}: {item['bytes']} bytes")
     
-    for i in range(0, total_records, batch_size):
-        batch = records[i:i + batch_size]
-        batch_num = i // batch_size + 1
-        total_batches = (total_records + batch_size - 1) // batch_size
-        
-        print(f"   Batch {batch_num}/{total_batches} ({len(batch)} records)...")
-        index.upsert_records(namespace, batch)
-        
-        # Small delay between batches
-        if batch_num < total_batches:
-            time.sleep(2)
+    requests = report['requests']
+    print(f"\nProjected requests: {requests['count']} upserts of up to {requests['batch_size']} records, "
+          f"{requests['vector_records']} vectors with passages "
+          f"({requests['total_bytes'] / 1024:.0f} KB total, largest {requests['max_bytes'] / 1024:.0f} KB)")
     
-    print(f"   ✅ {source_name} uploaded successfully")
+    if report['oversized']:
+        print(f"\n❌ {len(report['oversized'])} records exceed the {PINECONE_METADATA_LIMIT}-byte metadata limit: {report['oversized']}")
+    else:
+        print(f"\n✅ All records fit within the {PINECONE_METADATA_LIMIT}-byte metadata limit")
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Upload all data sources to Pinecone.")
+    parser.add_argument('--sources-config', help="Source registry JSON (default: data/sources.json or $SOURCES_CONFIG)")
+    parser.add_argument('--only', nargs='+', metavar='NAME', help="Upload only these sources")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Processes used to load and validate sources in parallel (1 = serial)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Load, validate and batch everything offline and print a payload report")
+    parser.add_argument('--report', metavar='PATH', help="Also write the dry-run report as JSON")
+    parser.add_argument('--from-snapshot', nargs='?', const=default_snapshot_path(), metavar='PATH',
+                        help="Upload the already-validated records in a corpus snapshot instead of the sources")
+    ids = parser.add_mutually_exclusive_group()
+    ids.add_argument('--ids', nargs='+', metavar='ID', help="Upload only these record ids")
+    ids.add_argument('--changed', action='store_true',
+                     help="Upload only ids the scrapers found new or changed since the last --changed upload")
+    args = parser.parse_args(argv)
+    if args.from_snapshot and args.only:
+        parser.error("--only selects registered sources and cannot be combined with --from-snapshot "
+                     "(export a snapshot with: python scripts/snapshot.py export --only NAME ...)")
+    return args
 
-def main():
+def select_sources(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Resolve the registered sources, honouring --only."""
+    specs = discover_sources(args.sources_config)
+    if args.only:
+        specs = [spec for spec in specs if spec['name'] in args.only]
+    return specs
+
+def run_dry_run(args: argparse.Namespace) -> int:
+    """Entry point for --dry-run. Fails when any record would be rejected for size."""
+    report = dry_run(select_sources(args))
+    print_dry_run_report(report)
+    
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"\n💾 Report saved to: {args.report}")
+    
+    return 1 if report['oversized'] else 0
+
+def main(argv=None):
     """Main upload function."""
+    args = parse_args(argv)
+    if args.dry_run:
+        return run_dry_run(args)
+    
     print("=" * 70)
     print("🚀 UNIFIED DATA UPLOAD TO PINECONE")
     print("=" * 70)
@@ -305,6 +354,17 @@ def main():
         print("❌ PINECONE_API_KEY environment variable not set")
         return 1
     
+    # Restrict the upload to specific ids (e.g. what the last scrapes changed)
+    manifest = default_manifest() if args.changed else None
+    if args.changed and manifest is None:
+        print("❌ --changed needs the scrape manifest, but SCRAPE_MANIFEST is off")
+        return 1
+    ids = set(args.ids) if args.ids else (manifest.pending if manifest else None)
+    if ids is not None and not ids:
+        print("\n✅ No changed records to upload")
+        return 0
+    partial = bool(ids) or bool(args.only)  # Only some documents are uploaded; the rest stay as they are
+    
     try:
         # Initialize Pinecone
         print("\n🔌 Connecting to Pinecone...")
@@ -315,47 +375,74 @@ def main():
         
         # Target the index
         index = pc.Index(config['index_name'])
+        rows = []  # Links and listing fields of every uploaded record, for the local indexes
+        store = open_for_upload(partial=partial)  # Full text stays local; Pinecone gets lean records
+        sent_ids = set()  # Vector ids upserted, including passages
+        sample = {}  # Recently sent records, checked by wait_for_ingest
         
-        # Get project directory
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_dir = os.path.dirname(script_dir)
-        
-        # Load all data sources
-        print("\n" + "=" * 70)
-        print("📚 LOADING DATA SOURCES")
-        print("=" * 70)
+        try:
+            if args.from_snapshot:
+                # Records in a snapshot are already validated; stream them straight into batches
+                print("\n" + "=" * 70)
+                print(f"📦 UPLOADING FROM SNAPSHOT {args.from_snapshot}")
+                print("=" * 70)
+            
+                with CorpusSnapshot(args.from_snapshot) as snapshot:
+                    batches = iter_batches(snapshot.get_many(sorted(ids)) if ids else snapshot)
+                    batches = store.store_batches(collect_index_rows(batches, rows))
+                    total_uploaded = upload_batches(index, config['namespace'], passage_batches(batches, sent_ids, sample))
+            else:
+                # Resolve the registered sources
+                specs = select_sources(args)
+                workers = max(1, min(args.workers, len(specs)))
+            
+                # Stream all data sources straight into upload batches
+                print("\n" + "=" * 70)
+                print(f"📚 LOADING AND UPLOADING {len(specs)} DATA SOURCES ({workers} worker{'s' if workers > 1 else ''})")
+                print("=" * 70)
+            
+                batches = iter_source_batches(specs, workers=workers)
+                batches = only_ids(batches, ids) if ids else batches
+                batches = store.store_batches(collect_index_rows(batches, rows))
+                total_uploaded = upload_batches(index, config['namespace'], passage_batches(batches, sent_ids, sample))
         
-        eu_articles = load_eu_articles(script_dir)
-        eu_recitals = load_eu_recitals(script_dir)
-        canadian_data = load_canadian_data()
-        iapp_data = load_iapp_data()
+            if manifest:
+                manifest.mark_uploaded(ids)
         
-        # Upload all data sources
-        print("\n" + "=" * 70)
-        print("📤 UPLOADING TO PINECONE")
-        print("=" * 70)
+            documents = {row['_id'] for row in rows} if partial else None
+            pruned = prune_stale_passages(index, config['namespace'], sent_ids, documents)
+            print(f"\n✂️  {total_uploaded} vectors for {len(rows)} documents; removed {pruned} stale passages")
+        finally:
+            # Any upsert or delete that reached the index makes cached results stale, even if a later one failed
+            mark_namespace_written(config['namespace'])
         
-        upload_records_batch(index, config['namespace'], eu_articles, "EU Articles")
-        upload_records_batch(index, config['namespace'], eu_recitals, "EU Recitals")
-        upload_records_batch(index, config['namespace'], canadian_data, "Canadian Data")
-        upload_records_batch(index, config['namespace'], iapp_data, "IAPP Data")
+        # A partial upload replaces only the links its documents declare
+        try:
+            graph = save_graph_upload(rows, partial=partial)
+            print(f"\n🕸️  Graph index: {len(graph)} documents, {graph.edge_count} links → {default_graph_index_path()}")
+        except ValueError as e:
+            print(f"\n⚠️  Graph index not updated: {e}")
+        listing = save_upload(rows, partial=partial)
+        print(f"🗂️  Document index: {len(listing)} documents → {default_document_index_path()}")
+        finish_upload(store)
+        print(f"📚 Document store: {len(rows)} documents written")
         
-        # Wait for indexing
+        # Wait until the uploaded records are queryable
         print("\n⏳ Waiting for indexing to complete...")
-        time.sleep(10)
+        stats = wait_for_ingest(index, config['namespace'], total_uploaded, sample)
+        # Bump again: searches cached while the writes were still being indexed saw the old records
+        generation = mark_namespace_written(config['namespace'])
+        print(f"🔄 Search cache invalidated (namespace generation {generation})")
         
         # Display stats
         print("\n" + "=" * 70)
         print("📊 UPLOAD STATISTICS")
         print("=" * 70)
         
-        stats = index.describe_index_stats()
-        total_uploaded = len(eu_articles) + len(eu_recitals) + len(canadian_data) + len(iapp_data)
-        
         print(f"\n✅ Successfully uploaded {total_uploaded} total records!")
         print(f"\nIndex Statistics:")
         print(f"  • Total vectors: {stats.get('total_vector_count', 0)}")
-        print(f"  • Namespace '{config['namespace']}': {stats.get('namespaces', {}).get(config['namespace'], {}).get('vector_count', 0)} vectors")
+        print(f"  • Namespace '{config['namespace']}': {namespace_vector_count(stats, config['namespace'])} vectors")
         print(f"  • Dimension: {stats.get('dimension', 'unknown')}")
         print(f"  • Index fullness: {stats.get('index_fullness', 0):.1%}")
         